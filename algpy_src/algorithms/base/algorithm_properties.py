@@ -16,6 +16,7 @@ class AlgorithmFamily(StrEnum):
     GRAPH_TRAVERSAL = 'Graph Traversal Algorithms',
     MESSAGE_PASSING = 'Relational Classification Algorithms',
     MAX_FLOW = 'Maximum Flow Algorithms',
+    GRAPH_PARTITIONING = 'Graph Partitioning Algorithms',
 
     # Backtracking
     BACKTRACKING = 'Backtracking Algorithms',
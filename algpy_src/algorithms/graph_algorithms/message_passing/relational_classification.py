@@ -96,15 +96,16 @@ class RelationalClassificationAlgorithm(Algorithm[FeatureGraph, GraphSize, Featu
             if not all(isinstance(edge_data, (int, float, bool)) for edge_data in neighbourhood.values()):
                 raise ValueError('Relational classification algorithm can only be ran with numerical edge values.')
 
-        nodes_without_label: set[Node] = set()
+        nodes_without_label: list[Node] = []
         for node in input_instance.nodes:
             inp_feature = input_instance.get_node_features(node)
             if inp_feature == NoFeature():
-                nodes_without_label.add(node)
-                input_instance.add_node_with_features(node, 0.5)
+                nodes_without_label.append(node)
             elif not isinstance(inp_feature, (int, float, bool)) or not 0 <= inp_feature <= 1:
                 raise ValueError('Relational classification algorithm can only be ran with numerical node feature values between 0 and 1.')
 
+        input_instance.set_node_features_batch(nodes_without_label, 0.5)
+
         max_label_change = np.inf
         n_iterations = 0
         while max_label_change > convergence_threshold and n_iterations < max_iterations:
@@ -128,7 +129,7 @@ class RelationalClassificationAlgorithm(Algorithm[FeatureGraph, GraphSize, Featu
             print_problem_instance(input_instance, verbosity_level, 2)
 
         print_problem_instance(input_instance, verbosity_level, 1)
-        for node in nodes_without_label:
-            input_instance.add_node_with_features(node, 1 if cast(float, input_instance.get_node_features(node)) > classification_threshold else 0)
+        labels = input_instance.get_node_features_batch(nodes_without_label) > classification_threshold
+        input_instance.set_node_features_batch(nodes_without_label, labels.astype(int))
 
         return n_iterations < max_iterations, input_instance
@@ -2,8 +2,9 @@ from typing import Any, Optional
 
 from algpy_src.algorithms.base.algorithm_properties import AlgorithmProperties, AlgorithmFamily
 from algpy_src.algorithms.graph_algorithms.network_flow.ford_fulkerson import FordFulkersonAlgorithm, FordFulkersonGraphSize
-from algpy_src.base.constants import Node, Edge, FlowEdgeData
+from algpy_src.base.constants import Node, FlowEdgeData
 from algpy_src.data_structures.graphs.flow_network import FlowNetwork
+from algpy_src.data_structures.graphs.residual_network import ResidualNetwork
 from algpy_src.data_structures.linear.queue import Queue
 
 
@@ -58,45 +59,47 @@ class EdmondsKarpAlgorithm(FordFulkersonAlgorithm):
 
         return {'input_instance': g}
 
-    def _find_augmenting_path(self, input_instance: FlowNetwork[Node]) -> Optional[list[Edge]]:
+    def _find_augmenting_path(self, residual_network: ResidualNetwork[Node]) -> Optional[list[int]]:
         """
         Find the next augmenting path along which to increase the flow.
         In contrast to Ford-Fulkerson's algorithm, in Edmonds-Karp's algorithm we always select the shortest path via BFS.
 
         Parameters
         ----------
-        input_instance : FlowNetwork[Node]
-            Flow network within which to find the maximum flow. Also stores source and sink values.
+        residual_network : ResidualNetwork[Node]
+            Residual graph of the flow network within which to find the maximum flow.
 
         Returns
         -------
-        augmenting_path: list[Edge] | None
-            Return None if no augmenting path is found, otherwise return a sequence of edges representing the augmenting path from source to sink.
+        augmenting_path: list[int] | None
+            Return None if no augmenting path is found, otherwise return a sequence of residual arcs representing the augmenting path from source to sink.
         """
-        visited: set[Node] = set()
-        queue: Queue[tuple[Node, list[Edge]]] = Queue()
-        queue.enqueue((input_instance.source, []))
-        shortest_path: Optional[list[Edge]] = None
+        visited: list[bool] = [False] * len(residual_network.nodes)
+        queue: Queue[tuple[int, list[int]]] = Queue()
+        queue.enqueue((residual_network.source_id, []))
+        shortest_path: Optional[list[int]] = None
 
         while queue.size > 0:
             current_node, path_so_far = queue.dequeue()
             self.increment_n_ops()
 
-            if current_node in visited:
+            if visited[current_node]:
                 continue
-            visited.add(current_node)
+            visited[current_node] = True
 
-            if current_node == input_instance.sink:
+            if current_node == residual_network.sink_id:
                 return path_so_far
 
-            for successor, flow_edge_data in input_instance.adjacency_list[current_node].items():
-                if successor not in visited and flow_edge_data.flow < flow_edge_data.upper_bound:
-                    queue.enqueue((successor, path_so_far + [(current_node, successor, flow_edge_data)]))
+            for arc in residual_network.forward_arcs(current_node):
+                successor = residual_network.head(arc)
+                if not visited[successor] and residual_network.residual_capacity(arc) > 0:
+                    queue.enqueue((successor, path_so_far + [arc]))
                 self.increment_n_ops()
 
-            for predecessor, flow_edge_data in input_instance.adjacency_list_transposed[current_node].items():
-                if predecessor not in visited and flow_edge_data.lower_bound < flow_edge_data.flow:
-                    queue.enqueue((predecessor, path_so_far + [(predecessor, current_node, flow_edge_data)]))
+            for arc in residual_network.backward_arcs(current_node):
+                predecessor = residual_network.head(arc)
+                if not visited[predecessor] and residual_network.residual_capacity(arc) > 0:
+                    queue.enqueue((predecessor, path_so_far + [arc]))
                 self.increment_n_ops()
 
         return shortest_path
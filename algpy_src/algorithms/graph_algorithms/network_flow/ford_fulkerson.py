@@ -1,13 +1,16 @@
 from collections import namedtuple, defaultdict
 from collections.abc import Iterator
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from algpy_src.algorithms.algorithm import Algorithm
 from algpy_src.algorithms.base.algorithm_properties import AlgorithmProperties, AlgorithmFamily
-from algpy_src.base.constants import VERBOSITY_LEVELS, Node, FlowEdgeData, Edge
+from algpy_src.base.constants import VERBOSITY_LEVELS, Node, FlowEdgeData
 from algpy_src.base.utils import alternating_binary_generator
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
 from algpy_src.data_structures.graphs.flow_network import FlowNetwork
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
+from algpy_src.data_structures.graphs.residual_network import ResidualNetwork
 from algpy_src.data_structures.linear.stack import Stack
 
 FordFulkersonGraphSize = namedtuple('FordFulkersonGraphSize', 'edges max_capacity')
@@ -74,15 +77,17 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
             num_edges += 1
         return {'input_instance': g}
 
-    def run_algorithm(self, input_instance: FlowNetwork[Node], verbosity_level: VERBOSITY_LEVELS = 0, find_initial_feasible: bool = True,
-                      *args: Any, **kwargs: Any) -> tuple[bool, FlowNetwork[Node]]:
+    def run_algorithm(self, input_instance: FlowNetwork[Node] | CSRGraph, verbosity_level: VERBOSITY_LEVELS = 0, find_initial_feasible: bool = True,
+                      source: Node | NoNode = NoNode(), sink: Node | NoNode = NoNode(), *args: Any, **kwargs: Any) -> tuple[bool, FlowNetwork[Node]]:
         """
         Run function of Ford-Fulkerson's maximum flow algorithm.
 
         Parameters
         ----------
-        input_instance : FlowNetwork[Node]
+        input_instance : FlowNetwork[Node] | CSRGraph
             Flow network within which to find the maximum flow. Also stores source and sink values.
+            A frozen CSR graph with FlowEdgeData edge data is also accepted, in which case source and sink have to be given
+            and the flows are computed on a new FlowNetwork built from it since the frozen graph itself cannot hold changing flows.
         verbosity_level : int (default 0)
             Select the amount of information to print throughout run of the algorithm.
             One of 0, 1, 2 with 0 referring to no printing, 1 leading to print the flow in the beginning and in the end and
@@ -91,6 +96,10 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
             If True, start the algorithm by finding an initial feasible flow.
             Initial feasible flow is a prerequisite for the Ford-Fulkerson's algorithm and if this parameter is set to False, it is assumed
             that the input_instance FlowNetwork object already has a feasible flow assigned to it. If that is not the case, setting this to False may lead to incorrect results.
+        source : Node | NoNode (default NoNode())
+            Source of the flow, only used if input_instance is a CSRGraph. If not given, the source stored in the CSRGraph's graph attributes is used.
+        sink : Node | NoNode (default NoNode())
+            Sink of the flow, only used if input_instance is a CSRGraph. If not given, the sink stored in the CSRGraph's graph attributes is used.
         *args : Any
             Additional arguments passed to the algorithm.
         **kwargs : Any
@@ -101,45 +110,31 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
         result : tuple[bool, FlowNetwork[Node]]
             Returns True in the first index after termination (always terminates with integer capacities) and FlowNetwork with all edge flows set in the second index.
         """
+        if isinstance(input_instance, CSRGraph):
+            source = input_instance.graph_attributes.get('source', NoNode()) if isinstance(source, NoNode) else source
+            sink = input_instance.graph_attributes.get('sink', NoNode()) if isinstance(sink, NoNode) else sink
+            input_instance = cast(FlowNetwork[Node], input_instance.thaw(FlowNetwork, source=source, sink=sink))
+
+        residual_network: ResidualNetwork[Node] = ResidualNetwork(input_instance)
         if find_initial_feasible is True:
-            is_possible_to_set_feasible = self._set_feasible_flow(input_instance)
+            is_possible_to_set_feasible = self._set_feasible_flow(input_instance, residual_network)
             if not is_possible_to_set_feasible:
                 return False, input_instance
 
-        augmenting_path: Optional[list[Edge]] = self._find_augmenting_path(input_instance)
+        augmenting_path: Optional[list[int]] = self._find_augmenting_path(residual_network)
         while augmenting_path:
 
-            capacity = float('inf')
-            current = input_instance.source
-            for src, tgt, flow_edge in augmenting_path:
-
-                candidate_capacity = float('inf')
-                if current == src:
-                    candidate_capacity = flow_edge.upper_bound - flow_edge.flow
-                    current = tgt
-                elif current == tgt:
-                    candidate_capacity = flow_edge.flow - flow_edge.lower_bound
-                    current = src
-
-                if candidate_capacity < capacity:
-                    capacity = candidate_capacity
-
-            current = input_instance.source
-            for src, tgt, flow_edge in augmenting_path:
-                if current == src:
-                    input_instance.change_flow_between_nodes(src, tgt, flow_edge.flow + capacity)
-                    self.increment_n_ops()
-                    current = tgt
-                elif current == tgt:
-                    input_instance.change_flow_between_nodes(src, tgt, flow_edge.flow - capacity)
-                    self.increment_n_ops()
-                    current = src
-
-            augmenting_path = self._find_augmenting_path(input_instance)
+            capacity = min(residual_network.residual_capacity(arc) for arc in augmenting_path)
+            for arc in augmenting_path:
+                residual_network.push(arc, capacity)
+                self.increment_n_ops()
+
+            augmenting_path = self._find_augmenting_path(residual_network)
 
+        residual_network.write_flows(input_instance)
         return True, input_instance
 
-    def _find_augmenting_path(self, input_instance: FlowNetwork[Node]) -> Optional[list[Edge]]:
+    def _find_augmenting_path(self, residual_network: ResidualNetwork[Node]) -> Optional[list[int]]:
         """
         Find the next augmenting path along which to increase the flow.
         To demonstrate the worst case of the pure Ford-Fulkerson's algorithm, this always finds the longest augmenting path
@@ -147,45 +142,48 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
 
         Parameters
         ----------
-        input_instance : FlowNetwork[Node]
-            Flow network within which to find the maximum flow. Also stores source and sink values.
+        residual_network : ResidualNetwork[Node]
+            Residual graph of the flow network within which to find the maximum flow.
 
         Returns
         -------
-        augmenting_path: list[Edge] | None
-            Return None if no augmenting path is found, otherwise return a sequence of edges representing the augmenting path from source to sink.
+        augmenting_path: list[int] | None
+            Return None if no augmenting path is found, otherwise return a sequence of residual arcs representing the augmenting path from source to sink.
         """
-        visited: set[Node] = set()
-        stack: Stack[tuple[Node, list[Edge]]] = Stack()
-        stack.push((input_instance.source, []))
-        longest_path: Optional[list[Edge]] = None
+        visited: list[bool] = [False] * len(residual_network.nodes)
+        stack: Stack[tuple[int, list[int]]] = Stack()
+        stack.push((residual_network.source_id, []))
+        longest_path: Optional[list[int]] = None
         to_reverse: bool = next(self._worst_case_alternating_generator)
 
         while stack.size > 0:
             current_node, path_so_far = stack.pop()
             self.increment_n_ops()
 
-            if current_node in visited:
+            if visited[current_node]:
                 continue
-            visited.add(current_node)
+            visited[current_node] = True
 
-            if current_node == input_instance.sink:
+            if current_node == residual_network.sink_id:
                 if longest_path is None or len(path_so_far) > len(longest_path):
                     longest_path = path_so_far
 
-            for successor, flow_edge_data in sorted(input_instance.adjacency_list[current_node].items(), reverse=to_reverse):
-                if successor not in visited and flow_edge_data.flow < flow_edge_data.upper_bound:
-                    stack.push((successor, path_so_far + [(current_node, successor, flow_edge_data)]))
+            forward_arcs = residual_network.forward_arcs_by_head(current_node)
+            for arc in reversed(forward_arcs) if to_reverse else forward_arcs:
+                successor = residual_network.head(arc)
+                if not visited[successor] and residual_network.residual_capacity(arc) > 0:
+                    stack.push((successor, path_so_far + [arc]))
                 self.increment_n_ops()
 
-            for predecessor, flow_edge_data in input_instance.adjacency_list_transposed[current_node].items():
-                if predecessor not in visited and flow_edge_data.lower_bound < flow_edge_data.flow:
-                    stack.push((predecessor, path_so_far + [(predecessor, current_node, flow_edge_data)]))
+            for arc in residual_network.backward_arcs(current_node):
+                predecessor = residual_network.head(arc)
+                if not visited[predecessor] and residual_network.residual_capacity(arc) > 0:
+                    stack.push((predecessor, path_so_far + [arc]))
                 self.increment_n_ops()
 
         return longest_path
 
-    def _set_feasible_flow(self, input_instance: FlowNetwork[Node]) -> bool:
+    def _set_feasible_flow(self, input_instance: FlowNetwork[Node], residual_network: ResidualNetwork[Node]) -> bool:
         """
         Find initial feasible flow through conversion to the maximum flow with balances problem.
         Easy path of setting all flow to 0 is taken if possible.
@@ -194,6 +192,8 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
         ----------
         input_instance : FlowNetwork[Node]
             Flow network in which to set the initial flow.
+        residual_network : ResidualNetwork[Node]
+            Residual graph of the flow network, whose flows are set.
 
         Returns
         -------
@@ -201,8 +201,8 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
             Whether it was possible to set the initial flow.
         """
         if input_instance.max_lower_bound == 0:
-            for edge in input_instance.edges:
-                input_instance.change_flow_between_nodes(edge[0], edge[1], 0)
+            for edge_number in range(residual_network.number_of_edges):
+                residual_network.set_flow(edge_number, 0)
                 self.increment_n_ops()
             return True
 
@@ -231,11 +231,12 @@ class FordFulkersonAlgorithm(Algorithm[FlowNetwork, FordFulkersonGraphSize, Flow
             find_initial_feasible=False
         )
         if res is True:
-            for src, target, flow_edge in input_instance.edges:
+            for edge_number in range(residual_network.number_of_edges):
+                src, target = residual_network.edge(edge_number)
                 new_edge_data = filled_instance.get_edge_data(src, target)
                 original_edge_data = input_instance.get_edge_data(src, target)
                 if not isinstance(new_edge_data, NoEdge) and not isinstance(original_edge_data, NoEdge):
-                    input_instance.change_flow_between_nodes(src, target, new_edge_data.flow + original_edge_data.lower_bound)
+                    residual_network.set_flow(edge_number, new_edge_data.flow + original_edge_data.lower_bound)
                 self.increment_n_ops()
             return True
 
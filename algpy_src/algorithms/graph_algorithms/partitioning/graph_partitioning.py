@@ -0,0 +1,231 @@
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Generic
+
+from algpy_src.algorithms.algorithm import Algorithm
+from algpy_src.algorithms.base.algorithm_properties import AlgorithmProperties, AlgorithmFamily
+from algpy_src.base.constants import GraphSize, VERBOSITY_LEVELS, Node
+from algpy_src.base.utils import print_problem_instance
+from algpy_src.data_structures.graphs.compressed_graph import CompressedGraph
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_snapshot import GraphSnapshot
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.graph_view import GraphView, ViewableGraph
+from algpy_src.data_structures.graphs.sharded_graph import ShardedGraph
+
+
+@dataclass
+class GraphPartition(Generic[Node]):
+    """
+    Partition of the nodes of a graph into parts, e.g., to distribute work on the graph among several processes.
+    Boundary nodes of a part are its nodes with an edge (in any direction) to a node of another part, i.e., the nodes whose state has to be exchanged with other parts.
+    Edge cut is the number of edges whose end nodes lie in different parts (each undirected edge counted once).
+    """
+    parts: list[set[Node]]
+    assignment: dict[Node, int]
+    boundary_nodes: list[set[Node]]
+    edge_cut: int
+
+    @property
+    def n_parts(self) -> int:
+        return len(self.parts)
+
+    def subgraph_views(self, graph: ViewableGraph) -> list[GraphView]:
+        """
+        Create a lazy view of the subgraph induced by each part (see GraphView), e.g., to hand each part over to a separate worker.
+
+        Parameters
+        ----------
+        graph : ViewableGraph
+            The partitioned graph.
+
+        Returns
+        -------
+        subgraph_views : list[GraphView]
+            Views of the induced subgraphs in the order of the parts.
+        """
+        return [GraphView(graph, part) for part in self.parts]
+
+
+class GraphPartitioningAlgorithm(Algorithm[Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView, GraphSize, GraphPartition], Generic[Node]):
+    """
+    Balanced k-way graph partitioning by BFS region growing refined by label propagation.
+    First, the parts are grown one after another by BFS, each one up to its share of nodes and seeded from the frontier of the previous part,
+    so that every part is a connected region as far as possible. Then, the nodes are repeatedly moved to the part most of their neighbours belong to,
+    as long as it strictly lowers the edge cut and keeps the parts balanced, until no node moves anymore.
+    Edge directions are ignored for the partitioning.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @property
+    def algorithm_properties(self) -> AlgorithmProperties:
+        return AlgorithmProperties(
+            name='Graph Partitioning',
+            algorithm_family=AlgorithmFamily.GRAPH_PARTITIONING,
+            is_deterministic=True,
+            best_case_time_complexity='|V| + |E|',
+            best_case_description='no node improves the edge cut by moving after region growing',
+            average_case_time_complexity='(|V| + |E|) * n_iterations',
+            worst_case_time_complexity='(|V| + |E|) * max_iterations',
+            worst_case_description='label propagation not converging before max_iterations',
+            space_complexity='|V| + |E|',
+        )
+
+    def get_worst_case_arguments(self, input_size: GraphSize) -> dict[str, Any]:
+        """
+        Generate a graph with input_size.nodes nodes and input_size.edges edges to split into two parts.
+        The graph instance starts as a star graph, sequentially adding new star roots until desired number of edges is reached or until the graph is fully connected.
+
+        Parameters
+        ----------
+        input_size : GraphSize
+            Tuple of n_nodes, n_edges with desired graph size.
+
+        Returns
+        -------
+        run_algorithm_kwargs : dict[str, Any]
+            A dictionary with the created graph as 'input_instance' value and 'n_parts' set to 2.
+        """
+        g: Graph = Graph()
+        g.add_nodes_from(range(0, input_size.nodes))
+        num_edges = 0
+        root = 0
+        while num_edges < input_size.edges and root + 1 < input_size.nodes:
+            for new_neighbour in range(root + 1, input_size.nodes):
+                g.add_edge((root, new_neighbour, None))
+                num_edges += 1
+                if num_edges == input_size.edges:
+                    break
+            root += 1
+        return {'input_instance': g, 'n_parts': 2}
+
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView,
+                      verbosity_level: VERBOSITY_LEVELS = 0, n_parts: int = 2, max_imbalance: float = 0.1, max_iterations: int = 100,
+                      *args: Any, **kwargs: Any) -> tuple[bool, GraphPartition]:
+        """
+        Run function of the graph partitioning algorithm.
+
+        Parameters
+        ----------
+        input_instance : Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView
+            Graph to partition.
+        verbosity_level : int (default 0)
+            Select the amount of information to print throughout run of the algorithm.
+            One of 0, 1, 2 with 0 referring to no printing, 1 leading to print of the parts after region growing and at the end
+            and 2 meaning also print the parts after every label propagation iteration.
+        n_parts : int (default 2)
+            Number of parts, at least 1 and at most the number of nodes.
+        max_imbalance : float (default 0.1)
+            Allowed relative excess of the size of a part over the average part size during refinement,
+            i.e., no part grows beyond ceil((1 + max_imbalance) * |V| / n_parts) nodes.
+        max_iterations : int (default 100)
+            Maximum number of label propagation iterations.
+        *args : Any
+            Additional arguments passed to the algorithm.
+        **kwargs : Any
+            Additional keyword arguments passed to the algorithm.
+
+        Returns
+        -------
+        result : tuple[bool, GraphPartition]
+            Returns True in the first index if the label propagation converged (no node moved in the last iteration) within max_iterations.
+            Also returns the partition of the nodes with the boundary nodes of every part and the edge cut.
+        """
+        self.reset_n_ops()
+        # node ids match those of the CSR, compressed and sharded representations of the graph
+        node_interner: NodeInterner[Node] = (NodeInterner(input_instance.nodes) if isinstance(input_instance, (GraphSnapshot, GraphView))
+                                             else input_instance.node_interner)
+        nodes = node_interner.nodes
+        node_ids = node_interner.ids
+        n_nodes = len(nodes)
+        if not 0 < n_parts <= n_nodes:
+            raise ValueError(f'Number of parts has to be between 1 and the number of nodes ({n_nodes}).')
+        if max_imbalance < 0:
+            raise ValueError('Maximum imbalance cannot be negative.')
+
+        # undirected adjacency over node ids without self loops
+        neighbour_sets: list[set[int]] = [set() for _ in range(n_nodes)]
+        for node_id, node in enumerate(nodes):
+            for neighbour in input_instance.neighbors(node):
+                neighbour_id = node_ids[neighbour]
+                if neighbour_id != node_id:
+                    neighbour_sets[node_id].add(neighbour_id)
+                    neighbour_sets[neighbour_id].add(node_id)
+        neighbours = [sorted(neighbour_set) for neighbour_set in neighbour_sets]
+
+        # BFS region growing, each part seeded from the remaining frontier of the previous one
+        assignment = [-1] * n_nodes
+        sizes = [0] * n_parts
+        next_seed = 0
+        frontier: deque[int] = deque()
+        for part in range(n_parts):
+            target_size = n_nodes // n_parts + (1 if part < n_nodes % n_parts else 0)
+            queue = deque(node_id for node_id in frontier if assignment[node_id] == -1)
+            while sizes[part] < target_size:
+                if not queue:
+                    while assignment[next_seed] != -1:
+                        next_seed += 1
+                    queue.append(next_seed)
+                current = queue.popleft()
+                if assignment[current] != -1:
+                    continue
+                assignment[current] = part
+                sizes[part] += 1
+                self.increment_n_ops()
+                for neighbour_id in neighbours[current]:
+                    if assignment[neighbour_id] == -1:
+                        queue.append(neighbour_id)
+                        self.increment_n_ops()
+            frontier = queue
+        print_problem_instance(self._parts(nodes, assignment, n_parts), verbosity_level, 1)
+
+        # label propagation, every move strictly lowers the edge cut, thus it terminates
+        max_part_size = max(math.ceil((1 + max_imbalance) * n_nodes / n_parts), -(-n_nodes // n_parts))
+        n_iterations = 0
+        converged = False
+        while not converged and n_iterations < max_iterations:
+            converged = True
+            for node_id in range(n_nodes):
+                current_part = assignment[node_id]
+                if sizes[current_part] == 1:
+                    continue
+                neighbour_counts: dict[int, int] = {}
+                for neighbour_id in neighbours[node_id]:
+                    self.increment_n_ops()
+                    neighbour_part = assignment[neighbour_id]
+                    neighbour_counts[neighbour_part] = neighbour_counts.get(neighbour_part, 0) + 1
+                best_part, best_count = current_part, neighbour_counts.get(current_part, 0)
+                for part, count in neighbour_counts.items():
+                    if count > best_count and sizes[part] < max_part_size:
+                        best_part, best_count = part, count
+                if best_part != current_part:
+                    assignment[node_id] = best_part
+                    sizes[current_part] -= 1
+                    sizes[best_part] += 1
+                    converged = False
+            n_iterations += 1
+            print_problem_instance(self._parts(nodes, assignment, n_parts), verbosity_level, 2)
+
+        parts = self._parts(nodes, assignment, n_parts)
+        boundary_nodes: list[set[Node]] = [set() for _ in range(n_parts)]
+        for node_id, node in enumerate(nodes):
+            if any(assignment[neighbour_id] != assignment[node_id] for neighbour_id in neighbours[node_id]):
+                boundary_nodes[assignment[node_id]].add(node)
+        cut_entries = sum(1 for node_id, node in enumerate(nodes) for neighbour in input_instance.neighbors(node)
+                          if assignment[node_ids[neighbour]] != assignment[node_id])
+        edge_cut = cut_entries if input_instance.is_directed else cut_entries // 2
+
+        print_problem_instance(parts, verbosity_level, 1)
+        return converged, GraphPartition(parts, {node: assignment[node_id] for node_id, node in enumerate(nodes)}, boundary_nodes, edge_cut)
+
+    @staticmethod
+    def _parts(nodes: list[Node], assignment: list[int], n_parts: int) -> list[set[Node]]:
+        parts: list[set[Node]] = [set() for _ in range(n_parts)]
+        for node_id, node in enumerate(nodes):
+            parts[assignment[node_id]].add(node)
+        return parts
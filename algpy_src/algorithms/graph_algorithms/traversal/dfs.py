@@ -1,17 +1,26 @@
-from typing import Any
+from typing import Any, Literal, overload
+
+import numpy as np
 
 from algpy_src.algorithms.algorithm import Algorithm
 from algpy_src.algorithms.base.algorithm_properties import AlgorithmProperties, AlgorithmFamily
-from algpy_src.base.constants import GraphSize, VERBOSITY_LEVELS, Node
+from algpy_src.base.constants import GraphSize, VERBOSITY_LEVELS, Node, RESULT_MODES
 from algpy_src.base.utils import print_problem_instance
+from algpy_src.data_structures.graphs.compressed_graph import CompressedGraph
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.graph_snapshot import GraphSnapshot
+from algpy_src.data_structures.graphs.sharded_graph import ShardedGraph
+from algpy_src.data_structures.graphs.graph_view import GraphView
 from algpy_src.data_structures.graphs.digraph import DiGraph
 from algpy_src.data_structures.graphs.graph import Graph
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
+from algpy_src.data_structures.graphs.shortest_paths_graph import NO_PREDECESSOR
 from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
+from algpy_src.data_structures.graphs.traversal_result import TraversalResult
 from algpy_src.data_structures.linear.stack import Stack
 
 
-class DepthFirstSearch(Algorithm[Graph | DiGraph, GraphSize, TraversalGraph]):
+class DepthFirstSearch(Algorithm[Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView, GraphSize, TraversalGraph | TraversalResult]):
     """
     Depth First Search algorithm.
     """
@@ -61,15 +70,24 @@ class DepthFirstSearch(Algorithm[Graph | DiGraph, GraphSize, TraversalGraph]):
             root += 1
         return {'input_instance': g, 'element_to_search': input_size.nodes + 1}
 
-    def run_algorithm(self, input_instance: Graph | DiGraph, verbosity_level: VERBOSITY_LEVELS = 0, root: Node | NoNode = NoNode(),
-                      element_to_search: Node | NoNode = NoNode(), *args: Any, **kwargs: Any) -> tuple[bool, TraversalGraph]:
+    @overload
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, root: Node | NoNode = NoNode(),
+                      element_to_search: Node | NoNode = NoNode(), *args: Any, result_mode: Literal['graph'] = 'graph', **kwargs: Any) -> tuple[bool, TraversalGraph]: ...
+
+    @overload
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, root: Node | NoNode = NoNode(),
+                      element_to_search: Node | NoNode = NoNode(), *args: Any, result_mode: Literal['arrays'], **kwargs: Any) -> tuple[bool, TraversalResult]: ...
+
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, root: Node | NoNode = NoNode(),
+                      element_to_search: Node | NoNode = NoNode(), *args: Any, result_mode: RESULT_MODES = 'graph',
+                      **kwargs: Any) -> tuple[bool, TraversalGraph | TraversalResult]:
         """
         Run function of the depth first search (DFS) algorithm.
 
         Parameters
         ----------
-        input_instance : Graph | DiGraph
-            Graph in which to run the search.
+        input_instance : Graph | DiGraph | CSRGraph | CompressedGraph | ShardedGraph | GraphSnapshot | GraphView
+            Graph in which to run the search. Frozen CSR graphs (see BaseGraph.freeze()) are accepted directly.
         verbosity_level : int (default 0)
             Select the amount of information to print throughout run of the algorithm.
             One of 0, 1, 2 with 0 referring to no printing, 1 leading to print of the traversal order nodes at the end and 2 meaning also print the traversal order nodes after every expanded node.
@@ -80,41 +98,75 @@ class DepthFirstSearch(Algorithm[Graph | DiGraph, GraphSize, TraversalGraph]):
             Element to look for in the graph. If not given, whole graph is traversed.
         *args : Any
             Additional arguments passed to the algorithm.
+        result_mode : RESULT_MODES (default 'graph')
+            Either 'graph' to return a TraversalGraph or 'arrays' to return a lightweight TraversalResult with visit order, parent and distance arrays
+            aligned with the order of visit, which builds the traversal graph only if asked for (see TraversalResult.to_graph()).
         **kwargs : Any
             Additional keyword arguments passed to the algorithm.
 
         Returns
         -------
-        result : tuple[bool, TraversalGraph]
+        result : tuple[bool, TraversalGraph | TraversalResult]
             Returns True in the first index if the element was found in the graph or if no element was given for search.
-            Also returns a new tree graph with node order corresponding to the order of traversal.
+            Also returns a new tree graph with node order corresponding to the order of traversal, or the arrays of the traversal depending on result_mode.
         """
 
         self.reset_n_ops()
-        traversal_graph: TraversalGraph = TraversalGraph()
         visited: set[Node] = set()
-        stack: Stack[Node] = Stack()
+        order: list[Node] = []
+        # position (in order) of the node each visited node was discovered from and its depth, filled as the nodes are visited
+        parents: list[int] = []
+        depths: list[int] = []
+        stack: Stack[tuple[Node, int]] = Stack()
 
-        for node in [root] if root != NoNode() else input_instance.nodes:
+        for node in input_instance.nodes if isinstance(root, NoNode) else [root]:
             if node not in visited:
                 visited.add(node)
-                stack.push(node)
+                stack.push((node, NO_PREDECESSOR))
                 self.increment_n_ops()
 
                 while stack.size > 0:
-                    current = stack.pop()
-                    print_problem_instance(traversal_graph.nodes, verbosity_level, 2)
-                    traversal_graph.add_node(current)
+                    current, parent = stack.pop()
+                    print_problem_instance(order, verbosity_level, 2)
+                    current_position = len(order)
+                    order.append(current)
+                    parents.append(parent)
+                    depths.append(0 if parent == NO_PREDECESSOR else depths[parent] + 1)
                     self.increment_n_ops()
                     if current == element_to_search:
-                        print_problem_instance(traversal_graph.nodes, verbosity_level, 1)
-                        return True, traversal_graph
+                        print_problem_instance(order, verbosity_level, 1)
+                        return True, self._build_result(order, parents, depths, result_mode)
 
                     for neighbor in input_instance.neighbors(current):
                         if neighbor not in visited:
                             visited.add(neighbor)
-                            stack.push(neighbor)
+                            stack.push((neighbor, current_position))
                             self.increment_n_ops()
 
-        print_problem_instance(traversal_graph.nodes, verbosity_level, 1)
-        return element_to_search == NoNode(), traversal_graph
+        print_problem_instance(order, verbosity_level, 1)
+        return element_to_search == NoNode(), self._build_result(order, parents, depths, result_mode)
+
+    @staticmethod
+    def _build_result(order: list[Node], parents: list[int], depths: list[int], result_mode: RESULT_MODES) -> TraversalGraph | TraversalResult:
+        """
+        Build the result of the traversal in the requested form in O(number of visited nodes) time.
+
+        Parameters
+        ----------
+        order : list[Node]
+            Visited nodes in the order of their visit.
+        parents : list[int]
+            Position (in order) of the node from which each visited node was discovered, NO_PREDECESSOR for roots.
+        depths : list[int]
+            Depth of each visited node in the traversal tree.
+        result_mode : RESULT_MODES
+            Either 'graph' or 'arrays'.
+
+        Returns
+        -------
+        result : TraversalGraph | TraversalResult
+            Traversal graph with node order corresponding to the order of traversal or the arrays of the traversal.
+        """
+        if result_mode == 'arrays':
+            return TraversalResult(order, np.array(parents, dtype=np.int64), np.array(depths, dtype=np.int64))
+        return TraversalGraph.from_nodes(order)
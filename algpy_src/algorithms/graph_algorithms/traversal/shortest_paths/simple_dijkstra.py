@@ -1,17 +1,26 @@
-from typing import Any, Optional
+from typing import Any, Literal, Optional, overload
+
+import numpy as np
 
 from algpy_src.algorithms.algorithm import Algorithm
 from algpy_src.algorithms.base.algorithm_properties import AlgorithmProperties, AlgorithmFamily
-from algpy_src.base.constants import GraphSize, VERBOSITY_LEVELS, Node
+from algpy_src.base.constants import GraphSize, VERBOSITY_LEVELS, Node, RESULT_MODES, SHORTEST_PATHS_STORAGE
 from algpy_src.base.utils import print_problem_instance
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.graph_snapshot import GraphSnapshot
+from algpy_src.data_structures.graphs.sharded_graph import ShardedGraph
+from algpy_src.data_structures.graphs.graph_view import GraphView
 from algpy_src.data_structures.graphs.digraph import DiGraph
 from algpy_src.data_structures.graphs.graph import Graph
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
-from algpy_src.data_structures.graphs.shortest_paths_graph import ShortestPathsGraph
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.shortest_paths_graph import NO_PREDECESSOR, ShortestPathsGraph
+from algpy_src.data_structures.graphs.traversal_result import ShortestPathsResult
 from algpy_src.data_structures.graphs.trees.heaps.fibonacci_heap import FibonacciHeap
+from algpy_src.data_structures.graphs.trees.heaps.heap_node import HeapNode
 
 
-class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, ShortestPathsGraph]):
+class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView, GraphSize, ShortestPathsGraph | ShortestPathsResult]):
     """
     Dijkstra's shortest path(s) algorithm.
     """
@@ -61,15 +70,26 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
             root += 1
         return {'input_instance': g, 'source': NoNode(), 'target': NoNode()}
 
-    def run_algorithm(self, input_instance: Graph | DiGraph, verbosity_level: VERBOSITY_LEVELS = 0, source: Node | NoNode = NoNode(),
-                      target: Node | NoNode = NoNode(), fill_weight_value: Optional[float | int] = None, *args: Any, **kwargs: Any) -> tuple[bool, ShortestPathsGraph]:
+    @overload
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, source: Node | NoNode = NoNode(),
+                      target: Node | NoNode = NoNode(), fill_weight_value: Optional[float | int] = None, storage: Optional[SHORTEST_PATHS_STORAGE] = None,
+                      *args: Any, result_mode: Literal['graph'] = 'graph', **kwargs: Any) -> tuple[bool, ShortestPathsGraph]: ...
+
+    @overload
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, source: Node | NoNode = NoNode(),
+                      target: Node | NoNode = NoNode(), fill_weight_value: Optional[float | int] = None, storage: Optional[Literal['arrays']] = None,
+                      *args: Any, result_mode: Literal['arrays'], **kwargs: Any) -> tuple[bool, ShortestPathsResult]: ...
+
+    def run_algorithm(self, input_instance: Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView, verbosity_level: VERBOSITY_LEVELS = 0, source: Node | NoNode = NoNode(),
+                      target: Node | NoNode = NoNode(), fill_weight_value: Optional[float | int] = None, storage: Optional[SHORTEST_PATHS_STORAGE] = None,
+                      *args: Any, result_mode: RESULT_MODES = 'graph', **kwargs: Any) -> tuple[bool, ShortestPathsGraph | ShortestPathsResult]:
         """
         Run function of Dijkstra's uni-directional shortest path(s) algorithm.
 
         Parameters
         ----------
-        input_instance : Graph | DiGraph
-            Graph in which to run the search.
+        input_instance : Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView
+            Graph in which to run the search. Frozen CSR graphs (see BaseGraph.freeze()) are accepted directly.
         verbosity_level : int (default 0)
             Select the amount of information to print throughout run of the algorithm.
             One of 0, 1, 2 with 0 referring to no printing, 1 leading to print the shortest path traversal graph at the end and
@@ -80,36 +100,72 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
             Target node to find the shortest path(s) to. If not given, shortest paths to all nodes are found.
         fill_weight_value : Optional[float | int] (default None)
             If given and None weight is encountered, fill the None with this value. Otherwise, an error will be raised.
+        storage : Optional[SHORTEST_PATHS_STORAGE] (default None)
+            How the path lengths and predecessors are kept. Either 'dicts' of dicts,
+            or 'arrays', i.e., distance and predecessor matrices over the ids of the node interner (see ShortestPathsGraph.from_arrays()),
+            which take far less memory for all-pairs runs. Results of each source are moved into the matrices as soon as they are computed.
+            If None, 'arrays' are used for the 'arrays' result mode and 'dicts' otherwise. The 'arrays' result mode accepts only 'arrays'.
         *args : Any
             Additional arguments passed to the algorithm.
+        result_mode : RESULT_MODES (default 'graph')
+            Either 'graph' to return a ShortestPathsGraph or 'arrays' to return a lightweight ShortestPathsResult with the distance and predecessor matrices,
+            which copies the adjacency of the graph into a ShortestPathsGraph only if asked for (see ShortestPathsResult.to_graph()).
         **kwargs : Any
             Additional keyword arguments passed to the algorithm.
 
         Returns
         -------
-        result : tuple[bool, ShortestPathsGraph]
+        result : tuple[bool, ShortestPathsGraph | ShortestPathsResult]
             Returns True in the first index if the shortest path to target was found or if no target was specified.
-            Also returns a ShortestPathsGraph object carrying the respective path lengths and predecessor and capable of reconstructing the path.
+            Also returns a ShortestPathsGraph object carrying the respective path lengths and predecessor and capable of reconstructing the path,
+            or the matrices of the paths depending on result_mode.
         """
         self.reset_n_ops()
+        if result_mode == 'arrays' and storage == 'dicts':
+            raise ValueError("The 'arrays' result mode keeps the shortest paths in matrices, thus it cannot be combined with the 'dicts' storage.")
+        if storage is None:
+            storage = 'arrays' if result_mode == 'arrays' else 'dicts'
         if source != NoNode() and source not in input_instance.nodes or target != NoNode() and target not in input_instance.nodes:
             raise ValueError('Either source or target node which are not present in the graph were given.')
 
         shortest_paths_lengths: dict[Node, dict[Node, int | float]] = {}
         shortest_paths_predecessors: dict[Node, dict[Node, Node | NoNode]] = {}
 
-        sources = [source] if source != NoNode() else input_instance.nodes
+        sources = [source] if source != NoNode() else list(input_instance.nodes)
         target_node_found = True if target == NoNode() else False
 
-        for src in sources:
+        node_interner: NodeInterner[Node] = NodeInterner()
+        distances, predecessor_ids = np.empty((0, 0)), np.empty((0, 0), dtype=np.int64)
+        if storage == 'arrays':
+            node_interner = (NodeInterner(input_instance.nodes) if isinstance(input_instance, (GraphSnapshot, GraphView))
+                             else input_instance.node_interner)
+            distances = np.full((len(sources), len(node_interner)), np.inf)
+            predecessor_ids = np.full((len(sources), len(node_interner)), NO_PREDECESSOR, dtype=np.int64)
+
+        for row, src in enumerate(sources):
             success, single_source_sp_lengths, single_source_sp_predecessors = self._run_algorithm_single_source(input_instance, src, target, verbosity_level, fill_weight_value)
             if success:
                 target_node_found = True
-            shortest_paths_lengths[src] = single_source_sp_lengths
-            shortest_paths_predecessors[src] = single_source_sp_predecessors
+            if storage == 'arrays':
+                node_ids = node_interner.ids
+                for node, length in single_source_sp_lengths.items():
+                    distances[row, node_ids[node]] = length
+                for node, predecessor in single_source_sp_predecessors.items():
+                    if not isinstance(predecessor, NoNode):
+                        predecessor_ids[row, node_ids[node]] = node_ids[predecessor]
+            else:
+                shortest_paths_lengths[src] = single_source_sp_lengths
+                shortest_paths_predecessors[src] = single_source_sp_predecessors
 
         if not target_node_found:
-            return_graph = ShortestPathsGraph(input_instance.adjacency_list, {}, {})
+            sources, shortest_paths_lengths, shortest_paths_predecessors = [], {}, {}
+            distances, predecessor_ids = distances[:0], predecessor_ids[:0]
+        if result_mode == 'arrays':
+            result = ShortestPathsResult(input_instance.adjacency_list, node_interner.copy(), sources, distances, predecessor_ids)
+            print_problem_instance(result, verbosity_level, 1)
+            return target_node_found, result
+        if storage == 'arrays':
+            return_graph = ShortestPathsGraph.from_arrays(input_instance.adjacency_list, node_interner, sources, distances, predecessor_ids)
         else:
             return_graph = ShortestPathsGraph(input_instance.adjacency_list, shortest_paths_lengths, shortest_paths_predecessors)
 
@@ -117,7 +173,7 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
         return target_node_found, return_graph
 
     def _run_algorithm_single_source(
-            self, input_instance: Graph | DiGraph, source: Node, target: Node | NoNode = NoNode(),
+            self, input_instance: Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView, source: Node, target: Node | NoNode = NoNode(),
             verbosity_level: VERBOSITY_LEVELS = 0, fill_weight_value: Optional[float | int] = None
     ) -> tuple[bool, dict[Node, int | float], dict[Node, Node | NoNode]]:
         """
@@ -125,8 +181,8 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
 
         Parameters
         ----------
-        input_instance : Graph | DiGraph
-            Graph in which to run the search.
+        input_instance : Graph | DiGraph | CSRGraph | ShardedGraph | GraphSnapshot | GraphView
+            Graph in which to run the search. Frozen CSR graphs (see BaseGraph.freeze()) are accepted directly.
         source : Node
             Root node to find the shortest path(s) from. Has to be given.
         target : Node | NoNode (default NoNode())
@@ -149,9 +205,10 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
         target_node_found = True if target == NoNode() else False
 
         to_visit: FibonacciHeap[Node, int | float] = FibonacciHeap()
+        heap_nodes: dict[Node, HeapNode] = {}
         for node in input_instance.nodes:
             priority = float('inf') if node != source else 0
-            to_visit.insert(node, priority)
+            heap_nodes[node] = to_visit.insert(node, priority)
 
         while not to_visit.is_empty:
             self.increment_n_ops()
@@ -159,14 +216,14 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
             if isinstance(min_node, NoNode):
                 raise IndexError('Fibonacci heap is said to not be empty while the extracted min node is a NoNode() object.')
             v_min = min_node.key
+            del heap_nodes[v_min]
             print_problem_instance(sp_lengths, verbosity_level, 2)
 
             if v_min == target:
                 self.increment_n_ops(to_visit.n_ops)
                 return min_node.priority < float('inf'), sp_lengths, sp_predecessors
 
-            for neighbour in input_instance.neighbors(v_min):
-                weight = input_instance.get_edge_data(v_min, neighbour)
+            for neighbour, weight in input_instance.iter_out_edges(v_min):
                 if weight is None:
                     weight = fill_weight_value
                 if not isinstance(weight, int | float):
@@ -176,8 +233,8 @@ class DijkstraShortestPathsAlgorithm(Algorithm[Graph | DiGraph, GraphSize, Short
 
                 alt = sp_lengths.get(v_min, float('inf')) + weight
                 if alt < sp_lengths.get(neighbour, float('inf')):
-                    neighbour_in_heap = to_visit.find(neighbour)
-                    if isinstance(neighbour_in_heap, NoNode):
+                    neighbour_in_heap = heap_nodes.get(neighbour)
+                    if neighbour_in_heap is None:
                         continue
                     to_visit.decrease_priority(neighbour_in_heap, alt)
                     sp_lengths[neighbour] = alt
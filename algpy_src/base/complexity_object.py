@@ -1,5 +1,8 @@
+import sys
 from abc import ABC, abstractmethod
 
+from algpy_src.base.memory_footprint import MemoryFootprint, deep_sizeof
+
 
 class ComplexityObject(ABC):
     """
@@ -34,3 +37,41 @@ class ComplexityObject(ABC):
         Convenience method to reset n_ops count of the given complexity object.
         """
         self._n_ops = 0
+
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Walk the object once and measure the memory it actually uses, broken down into the components named by _memory_components().
+        The 'instance' component holds the object itself with its attribute dict. Everything reachable from an attribute which is not part of any named component
+        is reported under the name of the attribute (without leading underscores), unless it is empty. Objects shared by several components are counted only once.
+
+        Returns
+        -------
+        memory_footprint : MemoryFootprint
+            Number of bytes used by each component of the object.
+        """
+        seen: set[int] = {id(self), id(vars(self))}
+        components = {'instance': sys.getsizeof(self) + sys.getsizeof(vars(self))}
+        components.update(self._memory_components(seen))
+        for name, value in vars(self).items():
+            size = deep_sizeof((value,), seen)
+            if size > 0:
+                component = name.lstrip('_')
+                components[component] = components.get(component, 0) + size
+        return MemoryFootprint(components)
+
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the named components of the object (see memory_footprint()), none by default.
+        Subclasses override it to break their storage down into meaningful parts, e.g., node objects, edge data and adjacency dicts of a graph.
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already, to be passed to shallow_sizeof() and deep_sizeof().
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        return {}
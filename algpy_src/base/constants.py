@@ -22,6 +22,8 @@ class Hashable(Protocol):
 
 COMPLEXITIES = Literal['both', 'time', 'space']
 METRICS_TO_PLOT = Literal['both', 'time', 'n_ops']
+SHORTEST_PATHS_STORAGE = Literal['dicts', 'arrays']
+RESULT_MODES = Literal['graph', 'arrays']
 TEST_SEED = 42
 VERBOSITY_LEVELS = Literal[0, 1, 2]
 
@@ -36,6 +38,7 @@ Node = TypeVar('Node')
 EdgeData = TypeVar('EdgeData')
 SingleEdgeData = TypeVar('SingleEdgeData')
 MultiEdgeData = set[SingleEdgeData]
+KeyedMultiEdgeData = dict[int, SingleEdgeData]
 FlowEdgeData = namedtuple('FlowEdgeData', 'lower_bound flow upper_bound', defaults=[0, None, float('inf')])
 Edge = tuple[Node, Node, EdgeData]
 
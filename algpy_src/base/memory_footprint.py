@@ -0,0 +1,118 @@
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Iterable
+
+import numpy as np
+
+# shared objects which are not owned by any data structure
+_UNOWNED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_SMALL_INT_MIN, _SMALL_INT_MAX = -5, 256
+
+
+@dataclass
+class MemoryFootprint:
+    """
+    Breakdown of the memory used by a data structure into named components (e.g., adjacency dicts, node objects or child arrays), in bytes.
+    Every object is counted only once, in the first component reaching it, thus the components add up to the total footprint.
+    """
+    components: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """
+        Getter for the total number of bytes of all components.
+
+        Returns
+        -------
+        total : int
+            Sum of the sizes of all components.
+        """
+        return sum(self.components.values())
+
+
+def _is_owned(obj: Any, seen: set[int]) -> bool:
+    if id(obj) in seen or obj is None or isinstance(obj, (bool, *_UNOWNED_TYPES)):
+        return False
+    # small integers are preallocated singletons of the interpreter
+    return not (type(obj) is int and _SMALL_INT_MIN <= obj <= _SMALL_INT_MAX)
+
+
+def shallow_sizeof(objects: Iterable[Any], seen: set[int]) -> int:
+    """
+    Compute the size of the given objects themselves (including their attribute dicts), but not of the objects they refer to.
+    Objects already in seen, None, booleans, small integers and classes, modules and functions are not counted, the counted objects are added to seen.
+
+    Parameters
+    ----------
+    objects : Iterable[Any]
+        Objects to measure.
+    seen : set[int]
+        Ids of objects which were counted already.
+
+    Returns
+    -------
+    size : int
+        Number of bytes of the given objects.
+    """
+    size = 0
+    for obj in objects:
+        if not _is_owned(obj, seen):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        attributes = getattr(obj, '__dict__', None)
+        if isinstance(attributes, dict) and id(attributes) not in seen:
+            seen.add(id(attributes))
+            size += sys.getsizeof(attributes)
+    return size
+
+
+def deep_sizeof(objects: Iterable[Any], seen: set[int]) -> int:
+    """
+    Compute the size of the given objects and all objects reachable from them (items of containers, keys and values of dicts,
+    attribute values of objects and the buffers NumPy array views refer to) in O(number of reachable objects) time without recursion.
+    Objects already in seen, None, booleans, small integers and classes, modules and functions are not counted, the counted objects are added to seen.
+
+    Parameters
+    ----------
+    objects : Iterable[Any]
+        Objects to measure.
+    seen : set[int]
+        Ids of objects which were counted already.
+
+    Returns
+    -------
+    size : int
+        Number of bytes of the given objects and the objects reachable from them.
+    """
+    size = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if not _is_owned(obj, seen):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, complex)):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, np.ndarray):
+            # views do not include the buffer of the array they refer to
+            if obj.base is not None:
+                stack.append(obj.base)
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        attributes = getattr(obj, '__dict__', None)
+        if isinstance(attributes, dict) and id(attributes) not in seen:
+            # attribute names are interned strings shared by all instances, thus only the values are walked
+            seen.add(id(attributes))
+            size += sys.getsizeof(attributes)
+            stack.extend(attributes.values())
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            stack.extend(getattr(obj, slot, None) for slot in ((slots,) if isinstance(slots, str) else slots))
+    return size
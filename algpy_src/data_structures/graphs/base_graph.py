@@ -1,12 +1,49 @@
 from __future__ import annotations
 
+import os
 from abc import abstractmethod
-from typing import Generic, Optional, Iterable
+from typing import Any, Generic, Optional, Iterable, Iterator, KeysView, TypeVar, cast
+
+import numpy as np
 
 from algpy_src.base.constants import Node, EdgeData, Edge
+from algpy_src.base.memory_footprint import deep_sizeof, shallow_sizeof
 from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.compressed_graph import CompressedGraph
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.graph_snapshot import GraphSnapshot
+from algpy_src.data_structures.graphs.graph_view import EdgeFilter, GraphView
 from algpy_src.data_structures.graphs.graph_utils.affects_adjacency_matrix import affects_adjacency_matrix
+from algpy_src.data_structures.graphs.graph_utils.edge_entries import collect_edges, count_edge_entries, edge_entry_size, number_of_edges_from_counts, single_edges_data
+from algpy_src.data_structures.graphs.graph_utils.graph_fingerprint import FINGERPRINT_MASK, edge_entry_token, graph_fingerprint, node_token, single_edge_token
+from algpy_src.data_structures.graphs.graph_utils.graph_journal import GraphChangeKind, GraphDelta, GraphJournal
+from algpy_src.data_structures.graphs.graph_utils.incremental_adjacency_matrix import IncrementalAdjacencyMatrix
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+_G = TypeVar('_G', bound='BaseGraph')
+# shared (never modified) neighbourhood of nodes which are not present in the graph
+_EMPTY_NEIGHBOURHOOD: dict[Any, Any] = {}
+
+
+def _to_python_sequence(values: Iterable[Any]) -> list[Any]:
+    """
+    Convert the given iterable (possibly a NumPy array) to a list of Python objects.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        Iterable to convert.
+
+    Returns
+    -------
+    values_list : list[Any]
+        List of the values, with NumPy scalars converted to the respective Python objects.
+    """
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
 
 
 class BaseGraph(DataStructure, Generic[Node, EdgeData]):
@@ -15,7 +52,10 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
     Adjacency list representation is assumed for simplicity.
     """
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, EdgeData]]] = None) -> None:
+    # names of graph-level attributes whose values are nodes, kept by freeze() and the binary on-disk format (see save_binary())
+    _graph_attribute_names: tuple[str, ...] = ()
+
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, EdgeData]]] = None, store_edges: bool = True) -> None:
         """
         Constructor of the BaseGraph class.
         Initializes set of edges, adjacency list and adjacency matrix.
@@ -24,16 +64,44 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         ----------
         adjacency_list : Optional[dict[Node, dict[Node, EdgeData]]] (default None)
             Optional adjacency list from which to build the graph.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list.
+            If False, the graph is memory-lean: the edges are derived from the adjacency list on each access of the edges property
+            and their number is maintained by a counter, so that changes of the graph do not need to hash any edge tuples.
         """
         super().__init__()
-        self._edges: set[tuple[Node, Node, EdgeData]] = set()
+        self._edges: Optional[set[tuple[Node, Node, EdgeData]]] = set() if store_edges else None
+        self._number_of_edge_entries: Optional[int] = None
+        self._number_of_self_loop_entries: int = 0
         self._adjacency_list: dict[Node, dict[Node, EdgeData]] = {}
         self._adjacency_matrix: list[list[EdgeData | NoEdge]] = []
         self._adjacency_matrix_is_actual: bool = True
+        self._incremental_adjacency_matrix: Optional[IncrementalAdjacencyMatrix[Node]] = None
+        self._predecessors: Optional[dict[Node, dict[Node, EdgeData]]] = None
+        # copy-on-write bookkeeping, only active once a snapshot has been taken (see snapshot())
+        self._shares_adjacency_with_snapshot: bool = False
+        self._owned_rows: Optional[set[Node]] = None
+        self._owned_predecessor_rows: set[Node] = set()
+        self._owned_entries: set[tuple[Node, Node]] = set()
+        self._journal: Optional[GraphJournal] = None
+        self._node_interner: Optional[NodeInterner[Node]] = None
+        self._fingerprint: Optional[int] = None
         if adjacency_list is not None:
             self._adjacency_list = adjacency_list.copy()
             self._fill_missing_nodes_adjacency_list(adjacency_list)
             self._fill_missing_edges_adjacency_list()
+        if self.is_directed:
+            self._build_predecessors()
+
+    def _build_predecessors(self) -> None:
+        """
+        Helper method to build the reverse adjacency (in-edge) index of a directed graph in O(V + E) time.
+        The index is then maintained on every change of the graph, so that in-edges of a node can be accessed in O(indegree) time.
+        """
+        self._predecessors = {node: {} for node in self._adjacency_list}
+        for node, neighbourhood in self._adjacency_list.items():
+            for neighbour, edge_data in neighbourhood.items():
+                self._predecessors[neighbour][node] = edge_data
 
     @affects_adjacency_matrix
     def _fill_missing_nodes_adjacency_list(self, adjacency_list: dict[Node, dict[Node, EdgeData]]) -> None:
@@ -54,9 +122,12 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         """
         Helper method for building the graph from given adjacency list to ensure that all edges are present in the adjacency list as expected.
         """
+        if self._edges is None:
+            return
+        is_multigraph = self.is_multigraph
         for node in self._adjacency_list:
             for neighbour, data in self._adjacency_list[node].items():
-                if self.is_multigraph and isinstance(data, set):
+                if is_multigraph and isinstance(data, set):
                     for single_edge_data in data:
                         self._edges.add((node, neighbour, single_edge_data))
                 else:
@@ -64,12 +135,144 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
 
     @affects_adjacency_matrix
     def _fill_to_undirected(self) -> None:
-        for node in self.nodes:
+        self._number_of_edge_entries = None
+        for node in self._adjacency_list:
             for neighbour, data in self._adjacency_list[node].items():
-                self._adjacency_list[neighbour][node] = data
+                if self.is_multigraph and node != neighbour and isinstance(data, set | dict):
+                    # multiedge entries are changed in place, thus both directions need their own container
+                    self._adjacency_list[neighbour][node] = cast(EdgeData, data.copy())
+                else:
+                    self._adjacency_list[neighbour][node] = data
+
+    @classmethod
+    def from_edge_arrays(cls: type[_G], sources: Iterable[Node], targets: Iterable[Node], data: Optional[Iterable[Any]] = None,
+                         nodes: Optional[Iterable[Node]] = None, **kwargs: Any) -> _G:
+        """
+        Build a graph from parallel arrays of edge sources, targets and data in a single pass over the edges.
+        The adjacency list is assembled directly (without adding the edges one by one through add_edge) and then passed to the constructor.
+        NumPy arrays are accepted and converted to Python objects beforehand.
+
+        Parameters
+        ----------
+        sources : Iterable[Node]
+            Source node of each edge.
+        targets : Iterable[Node]
+            Target node of each edge, aligned with sources.
+        data : Optional[Iterable[Any]] (default None)
+            Data of each edge, aligned with sources. If not given, all edges carry None as their data.
+        nodes : Optional[Iterable[Node]] (default None)
+            Nodes to add to the graph before the edges, e.g., to include isolated nodes or to fix the order of nodes.
+        **kwargs : Any
+            Additional keyword arguments passed to the constructor of the graph (e.g., source and sink of a FlowNetwork).
+
+        Returns
+        -------
+        graph : BaseGraph
+            Graph of the class this method was called on.
+        """
+        sources, targets = _to_python_sequence(sources), _to_python_sequence(targets)
+        edge_data = _to_python_sequence(data) if data is not None else [None] * len(sources)
+        if not len(sources) == len(targets) == len(edge_data):
+            raise ValueError('Sources, targets and data of the edges have to be of the same length.')
+        return cls.from_edge_list(zip(sources, targets, edge_data), nodes, **kwargs)
+
+    @classmethod
+    def from_edge_list(cls: type[_G], edges: Iterable[Edge], nodes: Optional[Iterable[Node]] = None, **kwargs: Any) -> _G:
+        """
+        Build a graph from an iterable of (source node, target node, edge data) tuples in a single pass over the edges.
+        The resulting graph is the same as if the edges were added one by one using add_edge (keyed multigraphs get keys in the order of the edges),
+        except that for undirected graphs an edge given in the opposite direction of an already present edge is stored in the direction of the present one.
+
+        Parameters
+        ----------
+        edges : Iterable[Edge]
+            Edges represented as tuples of (source node, target node, edge data).
+        nodes : Optional[Iterable[Node]] (default None)
+            Nodes to add to the graph before the edges, e.g., to include isolated nodes or to fix the order of nodes.
+        **kwargs : Any
+            Additional keyword arguments passed to the constructor of the graph (e.g., source and sink of a FlowNetwork).
+
+        Returns
+        -------
+        graph : BaseGraph
+            Graph of the class this method was called on.
+        """
+        # directedness and multiplicity are constant properties of each graph class, thus an uninitialized instance suffices to read them
+        graph_type = cls.__new__(cls)
+        keyed = bool(kwargs.get('keyed', False))
+        adjacency_list = cls._build_adjacency_list(edges, nodes, graph_type.is_directed, graph_type.is_multigraph, keyed)
+        return cls(adjacency_list, **kwargs)
+
+    @staticmethod
+    def _build_adjacency_list(edges: Iterable[Edge], nodes: Optional[Iterable[Node]], is_directed: bool, is_multigraph: bool,
+                              keyed: bool = False) -> dict[Node, dict[Node, Any]]:
+        """
+        Helper method to assemble an adjacency list (with each undirected edge stored in one direction only) from the given edges.
+
+        Parameters
+        ----------
+        edges : Iterable[Edge]
+            Edges represented as tuples of (source node, target node, edge data).
+        nodes : Optional[Iterable[Node]]
+            Nodes to add before the edges.
+        is_directed : bool
+            Whether the built graph is directed. If not, an edge whose opposite direction is already present rewrites (or extends) the present entry.
+        is_multigraph : bool
+            Whether the built graph is a multigraph. If so, data of parallel edges are gathered in sets.
+        keyed : bool (default False)
+            Whether the built graph is a keyed multigraph. If so, data of parallel edges are gathered in dicts under consecutive integer keys,
+            so that repeated edges with equal data are all kept.
+
+        Returns
+        -------
+        adjacency_list : dict[Node, dict[Node, Any]]
+            Adjacency list to be passed to the constructor of the graph.
+        """
+        adjacency_list: dict[Node, dict[Node, Any]] = {node: {} for node in nodes} if nodes is not None else {}
+        for key, (source, target, edge_data) in enumerate(edges):
+            neighbourhood = adjacency_list.setdefault(source, {})
+            target_neighbourhood = adjacency_list.setdefault(target, {})
+            if not is_directed and source in target_neighbourhood:
+                source, target, neighbourhood = target, source, target_neighbourhood
+            if is_multigraph and keyed:
+                neighbourhood.setdefault(target, {})[key] = edge_data
+            elif is_multigraph:
+                neighbourhood.setdefault(target, set()).add(edge_data)
+            else:
+                neighbourhood[target] = edge_data
+        return adjacency_list
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, BaseGraph) and self._adjacency_list == other._adjacency_list
+        return isinstance(other, BaseGraph) and not self._fingerprints_differ(other) and self._adjacency_list == other._adjacency_list
+
+    def __hash__(self) -> int:
+        """
+        Hash the graph by its structural fingerprint (see fingerprint()), so that graphs can serve as keys of caches of results.
+        A graph must not be changed while it is used as a key.
+
+        Returns
+        -------
+        hash : int
+            Fingerprint of the graph.
+        """
+        return self.fingerprint()
+
+    def _fingerprints_differ(self, other: BaseGraph) -> bool:
+        """
+        Check in O(1) time whether the graphs are known to differ in structure by their fingerprints, used to short-circuit equality checks.
+        Fingerprints are only compared if both of them are already maintained, since building them is as costly as comparing the graphs.
+
+        Parameters
+        ----------
+        other : BaseGraph
+            Graph to compare with.
+
+        Returns
+        -------
+        fingerprints_differ : bool
+            True if both fingerprints are maintained and differ, i.e., the graphs are certainly not equal, otherwise False.
+        """
+        return self is not other and self._fingerprint is not None and other._fingerprint is not None and self._fingerprint != other._fingerprint
 
     @property
     @abstractmethod
@@ -91,17 +294,34 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         raise NotImplementedError()
 
     @property
-    def nodes(self) -> list[Node]:
+    def nodes(self) -> NodesView[Node]:
         """
         Retrieve the nodes of this graph.
         Nodes can be represented by any Python object and the order retrieved here corresponds to the order of being added to the graph.
+        No copy is made, the nodes are returned as a read-only view supporting O(1) membership checks.
 
         Returns
         -------
-        nodes : list[Node]
+        nodes : NodesView[Node]
             Nodes of this graph.
         """
-        return list(self._adjacency_list.keys())
+        return NodesView(self._adjacency_list)
+
+    def has_node(self, node: Node) -> bool:
+        """
+        Check whether the given node is present in the graph in O(1) time.
+
+        Parameters
+        ----------
+        node : Node
+            Node to look for.
+
+        Returns
+        -------
+        is_present : bool
+            True if the node is present in the graph.
+        """
+        return node in self._adjacency_list
 
     @property
     def edges(self) -> set[Edge]:
@@ -114,9 +334,39 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         Returns
         -------
         edges : set[Edge]
-            Edges of this graph.
+            Edges of this graph. For memory-lean graphs (see store_edges in the constructor), a new set is built on each access in O(V + E) time.
         """
-        return self._edges
+        if self._edges is not None:
+            return self._edges
+        return collect_edges(((node, neighbourhood.items()) for node, neighbourhood in self._adjacency_list.items()), self.is_directed, self.is_multigraph)
+
+    @property
+    def stores_edges(self) -> bool:
+        return self._edges is not None
+
+    def _record_edge(self, edge: Edge) -> None:
+        """
+        Low-level helper to add an edge to the materialized set of edges (if the graph keeps one).
+
+        Parameters
+        ----------
+        edge : Edge
+            Edge to add represented as a tuple of (source node, destination node, edge data).
+        """
+        if self._edges is not None:
+            self._edges.add(edge)
+
+    def _forget_edge(self, edge: Edge) -> None:
+        """
+        Low-level helper to discard an edge from the materialized set of edges (if the graph keeps one).
+
+        Parameters
+        ----------
+        edge : Edge
+            Edge to discard represented as a tuple of (source node, destination node, edge data).
+        """
+        if self._edges is not None:
+            self._edges.discard(edge)
 
     @property
     def number_of_nodes(self) -> int:
@@ -128,7 +378,7 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         number_of_nodes : int
             Number of nodes of this graph.
         """
-        return len(self.nodes)
+        return len(self._adjacency_list)
 
     @property
     def number_of_edges(self) -> int:
@@ -141,7 +391,54 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         number_of_edges : int
             Number of edges of this graph.
         """
-        return len(self._edges)
+        if self._edges is not None:
+            return len(self._edges)
+        if self._number_of_edge_entries is None:
+            self._count_edge_entries()
+        assert self._number_of_edge_entries is not None
+        return number_of_edges_from_counts(self._number_of_edge_entries, self._number_of_self_loop_entries, self.is_directed)
+
+    def _count_edge_entries(self) -> None:
+        """
+        Helper method to count the edges stored in the adjacency list (and the self-loops among them) in O(V + E) time.
+        Once counted, the counts are maintained by the low-level helpers changing the adjacency list entries.
+        """
+        number_of_entries, self._number_of_self_loop_entries = count_edge_entries(
+            ((node, neighbourhood.items()) for node, neighbourhood in self._adjacency_list.items()), self.is_multigraph)
+        self._number_of_edge_entries = number_of_entries
+
+    def _edge_entry_size(self, data: Any) -> int:
+        return edge_entry_size(data, self.is_multigraph)
+
+    def _single_edges_data(self, data: Any) -> Iterable[Any]:
+        return single_edges_data(data, self.is_multigraph)
+
+    def fingerprint(self) -> int:
+        """
+        Retrieve the structural fingerprint of this graph, a hash of its nodes and adjacency list entries independent of their order.
+        Equal graphs have equal fingerprints, while different graphs collide only with a negligible probability.
+        It is built on first access in O(V + E) time and then kept up to date on every change of the graph in O(1) time per changed edge or node,
+        thus later accesses take O(1) time. Changes of edge data objects in place (bypassing the methods of the graph) are not reflected.
+        Fingerprints depend on the hash seed of the Python process, thus they must not be persisted.
+
+        Returns
+        -------
+        fingerprint : int
+            Fingerprint of this graph, a non-negative integer below 2 ** 64.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = graph_fingerprint((node, neighbourhood.items()) for node, neighbourhood in self._adjacency_list.items())
+        return self._fingerprint
+
+    def _change_fingerprint(self, change: int) -> None:
+        if self._fingerprint is not None:
+            self._fingerprint = (self._fingerprint + change) & FINGERPRINT_MASK
+
+    def _change_edge_entry_count(self, source: Node, target: Node, change: int) -> None:
+        if self._number_of_edge_entries is not None:
+            self._number_of_edge_entries += change
+            if source == target:
+                self._number_of_self_loop_entries += change
 
     @property
     def adjacency_list(self) -> dict[Node, dict[Node, EdgeData]]:
@@ -160,6 +457,8 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
     def adjacency_list_transposed(self) -> dict[Node, dict[Node, EdgeData]]:
         """
         Getter for transposed adjacency list representation of the graph.
+        For directed graphs, this is the reverse adjacency (in-edge) index maintained on every change of the graph, thus no copy is made.
+        It should therefore be treated as read-only.
 
         Returns
         -------
@@ -167,15 +466,8 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
             If the graph is directed, return an adjacency list with all edges having opposite direction.
             Otherwise, simply return the actual adjacency list.
         """
-        if self.is_directed:
-            adjacency_list_transposed: dict[Node, dict[Node, EdgeData]] = {}
-            for node, neighbourhood in self._adjacency_list.items():
-                adjacency_list_transposed.setdefault(node, {})
-                for neighbour, edge_data in neighbourhood.items():
-                    if neighbour not in adjacency_list_transposed:
-                        adjacency_list_transposed[neighbour] = {}
-                    adjacency_list_transposed[neighbour][node] = edge_data
-            return adjacency_list_transposed
+        if self._predecessors is not None:
+            return self._predecessors
         return self._adjacency_list
 
     @property
@@ -184,6 +476,8 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         Getter for the adjacency matrix of the graph.
         Note that the graph is internally represented as an adjacency list, thus the adjacency matrix is built in O(n^2) time with O(n^2) space complexity for each call of this method.
         It is then cached as the graph's attribute until further change in the graph.
+        If the incremental adjacency matrix is enabled, the matrix is instead converted from its always up-to-date NumPy counterpart without any rebuild,
+        at most once between two changes of the graph.
 
         Returns
         -------
@@ -192,11 +486,442 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
             Symmetrical for undirected graph.
         """
         self.reset_n_ops()
+        if self._incremental_adjacency_matrix is not None:
+            return self._incremental_adjacency_matrix.to_list()
         if not self._adjacency_matrix_is_actual:
             self._build_adjacency_matrix()
             self._adjacency_matrix_is_actual = True
         return self._adjacency_matrix
 
+    @property
+    def adjacency_matrix_array(self) -> np.ndarray:
+        """
+        Getter for the adjacency matrix of the graph as a NumPy array of objects.
+        With the incremental adjacency matrix enabled, this is an O(1) view of the maintained matrix, otherwise it is converted from the adjacency_matrix property.
+
+        Returns
+        -------
+        adjacency_matrix_array : np.ndarray
+            Adjacency matrix of shape (number of nodes, number of nodes) with rows and columns in the order of self.nodes.
+        """
+        if self._incremental_adjacency_matrix is not None:
+            return self._incremental_adjacency_matrix.matrix
+        adjacency_matrix_array = np.empty((self.number_of_nodes, self.number_of_nodes), dtype=object)
+        for i, row in enumerate(self.adjacency_matrix):
+            for j, entry in enumerate(row):
+                adjacency_matrix_array[i, j] = entry
+        return adjacency_matrix_array
+
+    @property
+    def has_incremental_adjacency_matrix(self) -> bool:
+        return self._incremental_adjacency_matrix is not None
+
+    def enable_incremental_adjacency_matrix(self) -> None:
+        """
+        Opt in to maintaining a NumPy-backed adjacency matrix which is updated in place by each node and edge addition or removal.
+        The matrix is built once in O(V^2) time, afterwards adding or removing an edge costs O(1),
+        adding a node costs amortized O(V) and removing a node costs O(V^2) array shifting (without any Python-level loop over cells).
+        This is beneficial when single updates of the graph are interleaved with reads of the adjacency matrix.
+        """
+        if self._incremental_adjacency_matrix is None:
+            self._incremental_adjacency_matrix = IncrementalAdjacencyMatrix(self._adjacency_list)
+            self._adjacency_matrix = []
+            self._adjacency_matrix_is_actual = False
+
+    def disable_incremental_adjacency_matrix(self) -> None:
+        """
+        Stop maintaining the incremental adjacency matrix and fall back to building the adjacency matrix on demand.
+        """
+        self._incremental_adjacency_matrix = None
+        self._adjacency_matrix = []
+        self._adjacency_matrix_is_actual = False
+
+    def snapshot(self) -> GraphSnapshot[Node, EdgeData]:
+        """
+        Create an immutable snapshot of the current state of the graph in O(1) time.
+        The snapshot shares the adjacency structures with this graph, which are then copied lazily (copy-on-write) on changes of this graph:
+        the outer dicts are copied once on the first change after the snapshot and the adjacency dict of a node is copied on the first change of its edges.
+        The snapshot therefore stays consistent while this graph keeps being changed, e.g., by a single writer thread while reader threads query the snapshot.
+        Snapshots should be taken by the writer (i.e., not concurrently with a change of the graph).
+
+        Returns
+        -------
+        snapshot : GraphSnapshot[Node, EdgeData]
+            Read-only snapshot of this graph.
+        """
+        self._shares_adjacency_with_snapshot = True
+        self._owned_rows = set()
+        self._owned_predecessor_rows = set()
+        self._owned_entries = set()
+        return GraphSnapshot(self._adjacency_list, self._predecessors, self.is_directed, self.is_multigraph, self.name, fingerprint=self._fingerprint)
+
+    def subgraph_view(self, nodes: Iterable[Node]) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy read-only view of the subgraph induced by the given nodes in O(number of given nodes) time, without copying any edges.
+        The view can be used as an input of the traversal and shortest paths algorithms, which then only touch the nodes and edges of the subgraph.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes to restrict the view to, nodes not present in the graph are ignored.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view of the induced subgraph.
+        """
+        return GraphView(self, nodes)
+
+    def edge_filter_view(self, edge_filter: EdgeFilter) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy read-only view of the graph restricted to the edges passing the given predicate in O(1) time, without copying any edges.
+        The predicate is evaluated only for edges the view is queried for.
+
+        Parameters
+        ----------
+        edge_filter : EdgeFilter
+            Predicate called as edge_filter(source, target, edge data) deciding whether an edge is kept.
+            In case of a multigraph, it is called for every single edge. In case of an undirected graph, it should not depend on the order of the nodes.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view with filtered edges.
+        """
+        return GraphView(self, edge_filter=edge_filter)
+
+    @property
+    def has_node_interner(self) -> bool:
+        return self._node_interner is not None
+
+    @property
+    def node_interner(self) -> NodeInterner[Node]:
+        """
+        Retrieve the interner mapping the nodes of this graph to dense integer ids, which correspond to the positions of the nodes in self.nodes.
+        It is built on first access in O(V) time and then kept up to date on node additions in O(1) time per node.
+        Node removal invalidates it (ids of the following nodes would shift), thus it is rebuilt on the next access and should be retrieved again after such changes.
+
+        Returns
+        -------
+        node_interner : NodeInterner[Node]
+            Interner of the nodes of this graph, which must not be changed by the caller.
+        """
+        if self._node_interner is None:
+            self._node_interner = NodeInterner(self._adjacency_list)
+        return self._node_interner
+
+    def enable_journal(self, max_deltas: Optional[int] = None) -> GraphJournal:
+        """
+        Start recording all changes of the graph (node and edge additions, removals and edge data changes) in a journal with increasing versions.
+        Consumers can remember the version they last processed and ask for all changes since then (see deltas_since()),
+        e.g., to update results of algorithms incrementally or to invalidate caches.
+        Changes are recorded per adjacency list entry, i.e., a change of an undirected edge is recorded for both its directions (except for self loops).
+        If the journal is already enabled, the present journal is returned.
+
+        Parameters
+        ----------
+        max_deltas : Optional[int] (default None)
+            Minimum number of latest changes to retain (see GraphJournal). If not given, all changes are retained.
+
+        Returns
+        -------
+        journal : GraphJournal
+            The journal of this graph, starting at version 0.
+        """
+        if self._journal is None:
+            self._journal = GraphJournal(max_deltas)
+        return self._journal
+
+    def disable_journal(self) -> None:
+        """
+        Stop recording changes of the graph and discard the journal.
+        """
+        self._journal = None
+
+    @property
+    def journal(self) -> Optional[GraphJournal]:
+        return self._journal
+
+    @property
+    def version(self) -> int:
+        """
+        Retrieve the current version of the graph, i.e., the number of changes recorded since the journal was enabled.
+
+        Returns
+        -------
+        version : int
+            Current version of the graph.
+        """
+        if self._journal is None:
+            raise ValueError('Journal is not enabled, see enable_journal().')
+        return self._journal.version
+
+    def deltas_since(self, version: int) -> list[GraphDelta]:
+        """
+        Retrieve all changes of the graph recorded after the given version, in the order they were made.
+
+        Parameters
+        ----------
+        version : int
+            Version after which to retrieve the changes.
+
+        Returns
+        -------
+        deltas : list[GraphDelta]
+            Changes with versions greater than the given version.
+        """
+        if self._journal is None:
+            raise ValueError('Journal is not enabled, see enable_journal().')
+        return self._journal.deltas_since(version)
+
+    def _journal_entry(self, kind: GraphChangeKind, source: Node, target: Node, entry: Any) -> None:
+        """
+        Record addition or removal of a whole adjacency list entry in the journal, i.e., one delta per single edge in case of a multigraph.
+
+        Parameters
+        ----------
+        kind : GraphChangeKind
+            Kind of the change (addition or removal of edges).
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        entry : Any
+            Edge data, set of edge data or dict of key : edge data.
+        """
+        if self._journal is None:
+            return
+        if self.is_multigraph and isinstance(entry, dict):
+            for key, single_edge_data in entry.items():
+                self._journal.record(kind, source, target, single_edge_data, key=key)
+        else:
+            for single_edge_data in self._single_edges_data(entry):
+                self._journal.record(kind, source, target, single_edge_data)
+
+    def _detach_from_snapshot(self) -> None:
+        """
+        Copy the outer adjacency dicts if they are shared with a snapshot, so that nodes can be added or removed without affecting it.
+        """
+        if self._shares_adjacency_with_snapshot:
+            self._adjacency_list = dict(self._adjacency_list)
+            if self._predecessors is not None:
+                self._predecessors = dict(self._predecessors)
+            self._shares_adjacency_with_snapshot = False
+
+    def _own_rows(self, source: Node, target: Node) -> None:
+        """
+        Copy the adjacency dict of source (and the reverse adjacency dict of target) if they may be shared with a snapshot.
+        Does nothing if no snapshot has been taken.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry to be changed.
+        target : Node
+            Target node of the entry to be changed.
+        """
+        if self._owned_rows is None:
+            return
+        self._detach_from_snapshot()
+        if source not in self._owned_rows:
+            self._adjacency_list[source] = dict(self._adjacency_list[source])
+            self._owned_rows.add(source)
+        if self._predecessors is not None and target not in self._owned_predecessor_rows:
+            self._predecessors[target] = dict(self._predecessors[target])
+            self._owned_predecessor_rows.add(target)
+
+    def _own_edge_entry(self, source: Node, target: Node) -> Any:
+        """
+        Copy the multiedge entry between two nodes if it may be shared with a snapshot, so that it can be changed in place.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+
+        Returns
+        -------
+        entry : Any
+            The entry of the graph which can be changed in place.
+        """
+        entry: Any = self._adjacency_list[source][target]
+        if self._owned_rows is None or (source, target) in self._owned_entries:
+            return entry
+        self._own_rows(source, target)
+        entry = entry.copy()
+        self._adjacency_list[source][target] = entry
+        if self._predecessors is not None:
+            self._predecessors[target][source] = entry
+        if self._incremental_adjacency_matrix is not None:
+            self._incremental_adjacency_matrix.set_entry(source, target, entry)
+        self._owned_entries.add((source, target))
+        return entry
+
+    def _insert_node(self, node: Node) -> None:
+        """
+        Low-level helper to add a node to the internal structures of the graph.
+        All node additions after construction of the graph should go through this method.
+
+        Parameters
+        ----------
+        node : Node
+            Node to add. Nothing changes if the node already exists.
+        """
+        if node in self._adjacency_list:
+            return
+        self._detach_from_snapshot()
+        self._adjacency_list[node] = {}
+        if self._predecessors is not None:
+            self._predecessors[node] = {}
+        if self._owned_rows is not None:
+            self._owned_rows.add(node)
+            self._owned_predecessor_rows.add(node)
+        if self._incremental_adjacency_matrix is not None:
+            self._incremental_adjacency_matrix.add_node(node)
+        if self._node_interner is not None:
+            self._node_interner.intern(node)
+        self._change_fingerprint(node_token(node))
+        if self._journal is not None:
+            self._journal.record(GraphChangeKind.NODE_ADDED, node)
+
+    def _delete_node(self, node: Node) -> None:
+        """
+        Low-level helper to delete a node (which has no edges left) from the internal structures of the graph.
+        All node removals should go through this method.
+
+        Parameters
+        ----------
+        node : Node
+            Node to delete.
+        """
+        self._detach_from_snapshot()
+        del self._adjacency_list[node]
+        if self._predecessors is not None:
+            self._predecessors.pop(node, None)
+        if self._incremental_adjacency_matrix is not None:
+            self._incremental_adjacency_matrix.remove_node(node)
+        self._node_interner = None
+        self._change_fingerprint(-node_token(node))
+        if self._journal is not None:
+            self._journal.record(GraphChangeKind.NODE_REMOVED, node)
+
+    def _set_edge_entry(self, source: Node, target: Node, data: EdgeData) -> None:
+        """
+        Low-level helper to set the adjacency list entry between two existing nodes to the given data.
+        All edge additions and edge data changes after construction of the graph should go through this method.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        data : EdgeData
+            Edge data or set of edge data in case of a multigraph.
+        """
+        present_data = self._adjacency_list[source].get(target, NoEdge())
+        if self._number_of_edge_entries is not None:
+            self._change_edge_entry_count(source, target, self._edge_entry_size(data) - self._edge_entry_size(present_data))
+        if self._fingerprint is not None:
+            present_token = 0 if isinstance(present_data, NoEdge) else edge_entry_token(source, target, present_data)
+            self._change_fingerprint(edge_entry_token(source, target, data) - present_token)
+        if self._journal is not None:
+            if isinstance(present_data, NoEdge):
+                self._journal_entry(GraphChangeKind.EDGE_ADDED, source, target, data)
+            else:
+                self._journal.record(GraphChangeKind.EDGE_DATA_CHANGED, source, target, data, present_data)
+        self._own_rows(source, target)
+        self._adjacency_list[source][target] = data
+        if self._predecessors is not None:
+            self._predecessors[target][source] = data
+        if self._incremental_adjacency_matrix is not None:
+            self._incremental_adjacency_matrix.set_entry(source, target, data)
+
+    def _add_to_edge_entry(self, source: Node, target: Node, data: Any, key: Optional[int] = None) -> None:
+        """
+        Low-level helper to add a single edge to an existing multiedge entry in place (without copying the entry) in O(1) time.
+        The entry object is shared by all internal structures of the graph (it is copied first only if it may be shared with a snapshot).
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        data : Any
+            Data of the single edge to add.
+        key : Optional[int] (default None)
+            Key of the edge if the entry is a dict of key : edge data, otherwise the entry is expected to be a set of edge data.
+        """
+        entry = self._own_edge_entry(source, target)
+        size_before = len(entry)
+        if self._fingerprint is not None and key is not None and key in entry:
+            self._change_fingerprint(-single_edge_token(source, target, entry[key], key))
+        if key is None:
+            entry.add(data)
+        else:
+            entry[key] = data
+        if self._fingerprint is not None and (key is not None or len(entry) > size_before):
+            self._change_fingerprint(single_edge_token(source, target, data, key))
+        self._change_edge_entry_count(source, target, len(entry) - size_before)
+        if self._journal is not None and len(entry) > size_before:
+            self._journal.record(GraphChangeKind.EDGE_ADDED, source, target, data, key=key)
+
+    def _remove_from_edge_entry(self, source: Node, target: Node, data: Any = None, key: Optional[int] = None) -> None:
+        """
+        Low-level helper to remove a single edge from an existing multiedge entry in place in O(1) time.
+        If no edge remains in the entry afterwards, the entry is deleted.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        data : Any (default None)
+            Data of the single edge to remove from an entry which is a set of edge data.
+        key : Optional[int] (default None)
+            Key of the edge to remove from an entry which is a dict of key : edge data.
+        """
+        entry = self._own_edge_entry(source, target)
+        size_before = len(entry)
+        if key is None:
+            entry.discard(data)
+        else:
+            data = entry.pop(key, None)
+        if self._fingerprint is not None and len(entry) < size_before:
+            self._change_fingerprint(-single_edge_token(source, target, data, key))
+        self._change_edge_entry_count(source, target, len(entry) - size_before)
+        if self._journal is not None and len(entry) < size_before:
+            self._journal.record(GraphChangeKind.EDGE_REMOVED, source, target, data, key=key)
+        if not entry:
+            self._delete_edge_entry(source, target)
+
+    def _delete_edge_entry(self, source: Node, target: Node) -> None:
+        """
+        Low-level helper to delete an existing adjacency list entry between two nodes.
+        All edge removals should go through this method.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        """
+        self._own_rows(source, target)
+        present_data = self._adjacency_list[source].pop(target)
+        self._change_edge_entry_count(source, target, -self._edge_entry_size(present_data))
+        if self._fingerprint is not None:
+            self._change_fingerprint(-edge_entry_token(source, target, present_data))
+        self._journal_entry(GraphChangeKind.EDGE_REMOVED, source, target, present_data)
+        if self._predecessors is not None:
+            self._predecessors.get(target, {}).pop(source, None)
+        if self._incremental_adjacency_matrix is not None:
+            self._incremental_adjacency_matrix.delete_entry(source, target)
+
     def _build_adjacency_matrix(self) -> None:
         """
         Builder method for the adjacency matrix of this graph. Should assign the self._adjacency_matrix attribute.
@@ -212,6 +937,96 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
                     neighbours.append(NoEdge())
             self._adjacency_matrix.append(neighbours)
 
+    def freeze(self) -> CSRGraph:
+        """
+        Build a frozen compressed sparse row (CSR) representation of this graph.
+        The frozen graph does not reflect any further changes to this graph but is considerably more memory-efficient
+        and supports the read interface used by the traversal algorithms.
+
+        Returns
+        -------
+        csr_graph : CSRGraph
+            Frozen CSR representation of this graph.
+        """
+        return CSRGraph.from_graph(self, {attribute: getattr(self, attribute) for attribute in self._graph_attribute_names})
+
+    def compress(self, block_size: int = 16) -> CompressedGraph:
+        """
+        Build a frozen compressed representation of the structure of this graph (without edge data) for memory-constrained traversals.
+        See CompressedGraph for details of the encoding.
+
+        Parameters
+        ----------
+        block_size : int (default 16)
+            Number of nodes per block of the block index.
+
+        Returns
+        -------
+        compressed_graph : CompressedGraph
+            Compressed representation of this graph.
+        """
+        return CompressedGraph.from_graph(self, block_size)
+
+    def save_binary(self, path: str | os.PathLike[str]) -> None:
+        """
+        Save this graph in the binary on-disk format of its frozen CSR representation (see CSRGraph.save_binary()).
+        The saved graph can be loaded either as a memory-mapped CSRGraph by CSRGraph.load_binary() or as a mutable graph by load_binary().
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory to save the graph to.
+        """
+        self.freeze().save_binary(path)
+
+    @classmethod
+    def load_binary(cls: type[_G], path: str | os.PathLike[str], allow_pickle: bool = False, **kwargs: Any) -> _G:
+        """
+        Load a graph saved by save_binary() (or by CSRGraph.save_binary()) as a mutable graph of this class.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory the graph was saved to.
+        allow_pickle : bool (default False)
+            Whether to load pickled node tables and edge data, which should be allowed only for graphs from a trusted source (see CSRGraph.load_binary()).
+        **kwargs : Any
+            Additional keyword arguments passed to the constructor of this class.
+            Graph-level node attributes of the class (e.g., source and sink of a FlowNetwork) are restored from the saved graph unless given here.
+
+        Returns
+        -------
+        graph : _G
+            The loaded graph.
+        """
+        csr_graph = CSRGraph.load_binary(path, mmap=True, allow_pickle=allow_pickle)
+        graph_attributes = {attribute: node for attribute, node in csr_graph.graph_attributes.items() if attribute in cls._graph_attribute_names}
+        return cast(_G, csr_graph.thaw(cls, **(graph_attributes | kwargs)))
+
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the node objects, edge data, adjacency dicts, predecessor dicts, edge tuples, adjacency matrix and node interner of this graph.
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already.
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        return {
+            'nodes': deep_sizeof(self._adjacency_list.keys(), seen),
+            'edge_data': deep_sizeof((data for neighbourhood in self._adjacency_list.values() for data in neighbourhood.values()), seen),
+            'adjacency_dicts': shallow_sizeof((self._adjacency_list, *self._adjacency_list.values()), seen),
+            'predecessor_dicts': deep_sizeof((self._predecessors,), seen),
+            'edge_tuples': deep_sizeof((self._edges,), seen),
+            'adjacency_matrix': deep_sizeof((self._adjacency_matrix, self._incremental_adjacency_matrix), seen),
+            'node_interner': deep_sizeof((self._node_interner,), seen),
+        }
+
     def add_nodes_from(self, nodes: Iterable[Node]) -> None:
         """
         Add multiple nodes from an iterable.
@@ -235,7 +1050,7 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         node : Node
             Node to add.
         """
-        self._adjacency_list.setdefault(node, {})
+        self._insert_node(node)
 
     def remove_nodes_from(self, nodes_to_remove: Iterable[Node]) -> None:
         """
@@ -246,13 +1061,14 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         nodes_to_remove : Iterable[Node]
             Nodes to be removed from the graph.
         """
-        for node in nodes_to_remove:
+        for node in list(nodes_to_remove):
             self.remove_node(node)
 
     @affects_adjacency_matrix
     def remove_node(self, node: Node) -> None:
         """
         Remove given node from the graph along with all its edges.
+        Thanks to the reverse adjacency index of directed graphs, only the edges of the given node are visited, i.e., this takes O(degree) time.
 
         Parameters
         ----------
@@ -260,22 +1076,18 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
             Node to be removed.
             If not present in the graph, it is silently ignored.
         """
-        if node in self.nodes:
-            for other_node in self.nodes:
-                edge_data: EdgeData | NoEdge = self._adjacency_list[other_node].get(node, NoEdge())
-                if edge_data != NoEdge():
-                    if isinstance(edge_data, set):
-                        for single_edge_data in list(edge_data):
-                            self.remove_edge(other_node, node, single_edge_data)
-                    else:
-                        self.remove_edge(other_node, node, edge_data)
+        if node in self._adjacency_list:
+            for other_node, edge_data in list(self.adjacency_list_transposed.get(node, {}).items()):
+                if self.is_multigraph:
+                    self.remove_edge(other_node, node)
+                else:
+                    self.remove_edge(other_node, node, edge_data)
             for neighbour, edge in list(self._adjacency_list[node].items()):
-                if isinstance(edge, set):
-                    for single_edge_data in list(edge):
-                        self.remove_edge(node, neighbour, single_edge_data)
+                if self.is_multigraph:
+                    self.remove_edge(node, neighbour)
                 else:
                     self.remove_edge(node, neighbour, edge)
-            del self._adjacency_list[node]
+            self._delete_node(node)
 
     def add_edges_from(self, edges: Iterable[Edge]) -> None:
         """
@@ -291,9 +1103,9 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
             self.add_edge(edge)
 
     def get_edge_data(self, source: Node, target: Node) -> EdgeData | NoEdge:
-        if source not in self.nodes:
+        if source not in self._adjacency_list:
             raise KeyError('Source node is not present in the graph.')
-        if target not in self.nodes:
+        if target not in self._adjacency_list:
             raise KeyError('Target node is not present in the graph.')
         return self._adjacency_list[source].get(target, NoEdge())
 
@@ -346,22 +1158,78 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         """
         raise NotImplementedError()
 
-    def neighbors(self, node: Node) -> set[Node]:
+    def neighbors(self, node: Node) -> KeysView[Node]:
         """
-        Return a set of adjacent nodes for a given node.
+        Return a read-only view of adjacent nodes for a given node in O(1) time without copying them.
+        The view supports set operations and comparisons and reflects further changes of the graph,
+        thus the graph should not be changed while iterating over it.
 
         Parameters
         ----------
         node : Node
             Node for which to find the neighbours.
-            If not present in the graph, empty set is returned.
+            If not present in the graph, empty view is returned.
+
+        Returns
+        -------
+        neighbours : KeysView[Node]
+            A set-like view of adjacent nodes.
+        """
+        return self._adjacency_list.get(node, _EMPTY_NEIGHBOURHOOD).keys()
+
+    def in_neighbors(self, node: Node) -> KeysView[Node]:
+        """
+        Return a read-only view of nodes with an edge pointing to the given node in O(1) time without copying them.
+        For directed graphs, this uses the maintained reverse adjacency index.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to find the in-neighbours.
+            If not present in the graph, empty view is returned.
+
+        Returns
+        -------
+        in_neighbours : KeysView[Node]
+            A set-like view of nodes with an edge pointing to the given node. Same as neighbors() for an undirected graph.
+        """
+        return self.adjacency_list_transposed.get(node, _EMPTY_NEIGHBOURHOOD).keys()
+
+    def iter_out_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        """
+        Iterate over the outgoing edges of the given node without any copying.
+        The graph should not be changed during the iteration.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose outgoing edges to iterate over.
+            If not present in the graph, nothing is yielded.
+
+        Returns
+        -------
+        out_edges : Iterator[tuple[Node, EdgeData]]
+            Iterator of (neighbour, edge data) pairs, with edge data being a set or dict of edge data in case of a multigraph.
+        """
+        return iter(self._adjacency_list.get(node, _EMPTY_NEIGHBOURHOOD).items())
+
+    def iter_in_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        """
+        Iterate over the incoming edges of the given node without any copying.
+        The graph should not be changed during the iteration.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose incoming edges to iterate over.
+            If not present in the graph, nothing is yielded.
 
         Returns
         -------
-        neighbours : set[Node]
-            A set of adjacent nodes.
+        in_edges : Iterator[tuple[Node, EdgeData]]
+            Iterator of (in-neighbour, edge data) pairs, with edge data being a set or dict of edge data in case of a multigraph.
         """
-        return set(self._adjacency_list.get(node, {}).keys())
+        return iter(self.adjacency_list_transposed.get(node, _EMPTY_NEIGHBOURHOOD).items())
 
     def indegree(self, node: Node) -> int:
         """
@@ -378,14 +1246,7 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         indegree : int
             Indegree of the given node.
         """
-        if not self.is_directed:
-            return sum(len(edges) if isinstance(edges, set) else 1 for edges in self._adjacency_list.get(node, {}).values())
-
-        indegree = 0
-        for edge in self._edges:
-            if edge[1] == node:
-                indegree += len(edge[2]) if isinstance(edge[2], set) else 1
-        return indegree
+        return sum(self._edge_entry_size(edges) for edges in self.adjacency_list_transposed.get(node, {}).values())
 
     def outdegree(self, node: Node) -> int:
         """
@@ -402,7 +1263,7 @@ class BaseGraph(DataStructure, Generic[Node, EdgeData]):
         outdegree : int
             Outdegree of the given node.
         """
-        return sum(len(edges) if isinstance(edges, set) else 1 for edges in self._adjacency_list.get(node, {}).values())
+        return sum(self._edge_entry_size(edges) for edges in self._adjacency_list.get(node, {}).values())
 
     def degree(self, node: Node) -> int:
         """
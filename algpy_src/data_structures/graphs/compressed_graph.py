@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+from typing import Generic, Iterator, TYPE_CHECKING
+
+import numpy as np
+
+from algpy_src.base.constants import Node
+from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+if TYPE_CHECKING:
+    from algpy_src.data_structures.graphs.base_graph import BaseGraph
+
+# maximum number of bytes of a varint encoding a 64-bit unsigned integer (7 bits per byte)
+_MAX_VARINT_BYTES = 10
+
+
+def _varint_sizes(values: np.ndarray) -> np.ndarray:
+    """
+    Compute the number of bytes of the varint encoding of each of the given non-negative integers.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Array of non-negative integers (np.uint64).
+
+    Returns
+    -------
+    sizes : np.ndarray
+        Number of bytes of each encoded value.
+    """
+    sizes = np.ones(len(values), dtype=np.int64)
+    for byte_index in range(1, _MAX_VARINT_BYTES):
+        sizes += values >= np.uint64(1 << (7 * byte_index))
+    return sizes
+
+
+def _encode_varints(values: np.ndarray) -> tuple[bytes, np.ndarray]:
+    """
+    Encode the given non-negative integers as consecutive varints, i.e., 7 bits per byte starting with the least significant ones,
+    with the highest bit of each byte set if another byte of the same value follows.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Array of non-negative integers (np.uint64).
+
+    Returns
+    -------
+    encoded : bytes
+        The encoded values.
+    offsets : np.ndarray
+        Byte offset of each encoded value within the encoded bytes.
+    """
+    sizes = _varint_sizes(values)
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    encoded = np.zeros(offsets[-1], dtype=np.uint8)
+    for byte_index in range(int(sizes.max(initial=0))):
+        mask = sizes > byte_index
+        seven_bits = (values[mask] >> np.uint64(7 * byte_index)) & np.uint64(0x7F)
+        continuation = np.where(sizes[mask] > byte_index + 1, 0x80, 0).astype(np.uint64)
+        encoded[offsets[:-1][mask] + byte_index] = seven_bits | continuation
+    return encoded.tobytes(), offsets[:-1]
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """
+    Decode one varint starting at the given position.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded data.
+    position : int
+        Position of the first byte of the varint.
+
+    Returns
+    -------
+    value : int
+        The decoded value.
+    position : int
+        Position right after the varint.
+    """
+    value, shift = 0, 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class CompressedGraph(DataStructure, Generic[Node]):
+    """
+    Frozen (read-only) simple graph with compressed adjacency, intended for massive graphs which are only traversed.
+    Sorted neighbour ids of each node are delta-encoded (the first one relative to the node's own id, zigzag-encoded as it may be negative)
+    and stored as varints, so that neighbours close in the id space take a single byte instead of the 8 bytes of an id in a CSRGraph.
+    The record of each node starts with its byte length and degree, consecutive records are grouped into blocks of block_size nodes
+    and only the byte offset of each block is kept in the block index. Random access to a node therefore skips at most block_size - 1 records.
+    Only the structure of the graph is kept, edge data are not stored.
+    Decoding costs more per neighbour than reading a CSRGraph, which is traded for a several times smaller memory footprint.
+    """
+
+    def __init__(self, node_interner: NodeInterner[Node], data: bytes, block_offsets: np.ndarray, block_size: int, number_of_edges: int,
+                 is_directed: bool = True) -> None:
+        """
+        Constructor of the CompressedGraph class.
+        Typically, it is not called directly but through BaseGraph.compress() or CompressedGraph.from_graph().
+
+        Parameters
+        ----------
+        node_interner : NodeInterner[Node]
+            Interner of the nodes, taken over and must not be changed afterwards.
+        data : bytes
+            Encoded records of all nodes in the order of their ids.
+        block_offsets : np.ndarray
+            Byte offset of the record of every block_size-th node within data.
+        block_size : int
+            Number of nodes per block.
+        number_of_edges : int
+            Number of edges of the graph (each undirected edge counted once).
+        is_directed : bool (default True)
+            Whether the graph is directed. Undirected graphs store each edge in both directions.
+        """
+        super().__init__()
+        if block_size <= 0:
+            raise ValueError('Block size has to be positive.')
+        if len(block_offsets) != -(-len(node_interner) // block_size):
+            raise ValueError('The block index has to have exactly one entry per block of nodes.')
+        self._node_interner: NodeInterner[Node] = node_interner
+        self._nodes: list[Node] = node_interner.nodes
+        self._node_ids: dict[Node, int] = node_interner.ids
+        self._data: bytes = data
+        self._block_offsets: np.ndarray = block_offsets
+        self._block_size: int = block_size
+        self._number_of_edges: int = number_of_edges
+        self._is_directed: bool = is_directed
+
+    @classmethod
+    def from_graph(cls, graph: BaseGraph | CSRGraph, block_size: int = 16) -> CompressedGraph:
+        """
+        Build the compressed representation of the given graph from its CSR representation in O(V + E) (vectorized) time.
+
+        Parameters
+        ----------
+        graph : BaseGraph | CSRGraph
+            Graph to compress. Multigraphs are not supported.
+        block_size : int (default 16)
+            Number of nodes per block of the block index. Larger blocks make the index smaller but random access to a node slower.
+
+        Returns
+        -------
+        compressed_graph : CompressedGraph
+            Compressed representation of the given graph.
+        """
+        csr_graph = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        if block_size <= 0:
+            raise ValueError('Block size has to be positive.')
+        indptr = np.asarray(csr_graph.indptr, dtype=np.int64)
+        indices = np.asarray(csr_graph.indices, dtype=np.int64)
+        n_nodes, n_entries = len(indptr) - 1, len(indices)
+        degrees = np.diff(indptr)
+        edge_sources = np.repeat(np.arange(n_nodes, dtype=np.int64), degrees)
+
+        # each neighbour id is encoded relative to the previous neighbour, the first one relative to the node itself (zigzag-encoded)
+        is_first = np.zeros(n_entries, dtype=bool)
+        is_first[indptr[:-1][degrees > 0]] = True
+        previous = np.empty(n_entries, dtype=np.int64)
+        previous[1:] = indices[:-1]
+        previous[is_first] = edge_sources[is_first]
+        deltas = indices - previous
+        zigzag = np.where(deltas >= 0, 2 * deltas, -2 * deltas - 1)
+        edge_values = np.where(is_first, zigzag, deltas).astype(np.uint64)
+
+        # record of each node: [byte length of the rest, degree, neighbour deltas...]
+        edge_sizes_cumulative = np.zeros(n_entries + 1, dtype=np.int64)
+        np.cumsum(_varint_sizes(edge_values), out=edge_sizes_cumulative[1:])
+        degree_values = degrees.astype(np.uint64)
+        record_lengths = _varint_sizes(degree_values) + edge_sizes_cumulative[indptr[1:]] - edge_sizes_cumulative[indptr[:-1]]
+        values = np.empty(2 * n_nodes + n_entries, dtype=np.uint64)
+        record_starts = indptr[:-1] + 2 * np.arange(n_nodes, dtype=np.int64)
+        values[record_starts] = record_lengths.astype(np.uint64)
+        values[record_starts + 1] = degree_values
+        values[np.arange(n_entries, dtype=np.int64) + 2 * edge_sources + 2] = edge_values
+        data, offsets = _encode_varints(values)
+
+        block_offsets = offsets[record_starts[::block_size]] if n_nodes > 0 else np.zeros(0, dtype=np.int64)
+        return cls(csr_graph.node_interner, data, block_offsets, block_size, csr_graph.number_of_edges, csr_graph.is_directed)
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, CompressedGraph) and self._nodes == other._nodes and self._is_directed == other._is_directed and
+                all(list(self._neighbour_ids(node_id)) == list(other._neighbour_ids(node_id)) for node_id in range(len(self._nodes))))
+
+    @property
+    def name(self) -> str:
+        return 'Compressed Graph'
+
+    @property
+    def space_complexity(self) -> str:
+        return 'V + E'
+
+    @property
+    def is_directed(self) -> bool:
+        return self._is_directed
+
+    @property
+    def is_multigraph(self) -> bool:
+        return False
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Retrieve the number of bytes taken by the encoded adjacency and the block index (i.e., without the node table).
+
+        Returns
+        -------
+        nbytes : int
+            Size of the compressed adjacency in bytes.
+        """
+        return len(self._data) + self._block_offsets.nbytes
+
+    @property
+    def node_interner(self) -> NodeInterner[Node]:
+        return self._node_interner
+
+    @property
+    def nodes(self) -> NodesView[Node]:
+        return NodesView(self._node_ids)
+
+    def has_node(self, node: Node) -> bool:
+        return node in self._node_ids
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def number_of_edges(self) -> int:
+        return self._number_of_edges
+
+    def _record_position(self, node_id: int) -> int:
+        """
+        Find the position of the degree of the given node within the encoded data, skipping the preceding records of its block.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        position : int
+            Position of the degree varint of the node's record.
+        """
+        block, records_to_skip = divmod(node_id, self._block_size)
+        position = int(self._block_offsets[block])
+        for _ in range(records_to_skip):
+            record_length, position = _read_varint(self._data, position)
+            position += record_length
+        _, position = _read_varint(self._data, position)
+        return position
+
+    def _neighbour_ids(self, node_id: int) -> Iterator[int]:
+        """
+        Decode the sorted neighbour ids of the given node one by one.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        neighbour_ids : Iterator[int]
+            Iterator of the neighbour ids.
+        """
+        data = self._data
+        degree, position = _read_varint(data, self._record_position(node_id))
+        if degree == 0:
+            return
+        zigzag, position = _read_varint(data, position)
+        neighbour_id = node_id + (zigzag >> 1 if zigzag & 1 == 0 else -(zigzag >> 1) - 1)
+        yield neighbour_id
+        for _ in range(degree - 1):
+            delta, position = _read_varint(data, position)
+            neighbour_id += delta
+            yield neighbour_id
+
+    def neighbors(self, node: Node) -> list[Node]:
+        """
+        Return the adjacent nodes of a given node in the order of their ids, decoded in O(block_size + outdegree) time.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to find the neighbours.
+            If not present in the graph, empty list is returned.
+
+        Returns
+        -------
+        neighbours : list[Node]
+            Adjacent nodes of the node.
+        """
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return []
+        nodes = self._nodes
+        return [nodes[neighbour_id] for neighbour_id in self._neighbour_ids(node_id)]
+
+    def has_edge(self, source: Node, target: Node) -> bool:
+        if source not in self._node_ids:
+            raise KeyError('Source node is not present in the graph.')
+        if target not in self._node_ids:
+            raise KeyError('Target node is not present in the graph.')
+        target_id = self._node_ids[target]
+        for neighbour_id in self._neighbour_ids(self._node_ids[source]):
+            if neighbour_id >= target_id:
+                return neighbour_id == target_id
+        return False
+
+    def outdegree(self, node: Node) -> int:
+        node_id = self._node_interner.id_of(node)
+        return _read_varint(self._data, self._record_position(node_id))[0]
+
+    @property
+    def adjacency_list(self) -> dict[Node, dict[Node, None]]:
+        """
+        Materialize the adjacency list representation of this graph in O(V + E) time. Edge data are not stored, thus all edges carry None.
+
+        Returns
+        -------
+        adjacency_list: dict[Node, dict[Node, None]]
+            Adjacency list representation of the graph.
+        """
+        return {node: {self._nodes[neighbour_id]: None for neighbour_id in self._neighbour_ids(node_id)} for node_id, node in enumerate(self._nodes)}
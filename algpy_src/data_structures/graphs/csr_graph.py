@@ -0,0 +1,502 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Generic, Iterator, Optional, Sequence, TYPE_CHECKING, Any
+
+import numpy as np
+
+from algpy_src.base.constants import Node, SingleEdgeData, FlowEdgeData
+from algpy_src.base.memory_footprint import deep_sizeof
+from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+if TYPE_CHECKING:
+    from algpy_src.data_structures.graphs.base_graph import BaseGraph
+
+BINARY_FORMAT_VERSION = 1
+_FLOW_FIELDS = ('lower_bound', 'flow', 'upper_bound')
+_INT64_MIN, _INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)
+# integers of larger magnitude are not represented exactly by a 64-bit float
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _is_int64(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and _INT64_MIN <= value <= _INT64_MAX
+
+
+def nodes_to_array(nodes: list[Any]) -> np.ndarray:
+    """
+    Store a node table in an integer or string array if possible (which can be saved without pickling), otherwise fall back to an array of Python objects.
+
+    Parameters
+    ----------
+    nodes : list[Any]
+        Node table.
+
+    Returns
+    -------
+    nodes_array : np.ndarray
+        Integer array if all nodes are integers within the int64 range, string array if all nodes are strings which numpy stores exactly
+        (i.e., without trailing null characters, which are stripped from string arrays) and object array otherwise.
+    """
+    if all(_is_int64(node) for node in nodes):
+        return np.array(nodes, dtype=np.int64)
+    if all(isinstance(node, str) and not node.endswith('\x00') for node in nodes) and len(nodes) > 0:
+        return np.array(nodes, dtype=str)
+    nodes_array = np.empty(len(nodes), dtype=object)
+    nodes_array[:] = nodes
+    return nodes_array
+
+
+class CSRGraph(DataStructure, Generic[Node, SingleEdgeData]):
+    """
+    Frozen (read-only) simple graph in the compressed sparse row (CSR) format.
+    Nodes are interned to dense integer ids corresponding to their order in the original graph.
+    Neighbours of the node with id i are stored (sorted by their ids) in indices[indptr[i]:indptr[i + 1]]
+    and the respective edge data are stored at the same positions of the weights array.
+    In contrast to the adjacency list representation, this layout needs only three contiguous arrays and a node table,
+    which makes it suitable for large graphs which are traversed many times but rarely change.
+    """
+
+    def __init__(self, nodes: Sequence[Node] | NodeInterner[Node], indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, is_directed: bool = True,
+                 number_of_self_loops: Optional[int] = None, graph_attributes: Optional[dict[str, Node]] = None) -> None:
+        """
+        Constructor of the CSRGraph class.
+        Typically, it is not called directly but through BaseGraph.freeze() or CSRGraph.from_graph().
+
+        Parameters
+        ----------
+        nodes : Sequence[Node] | NodeInterner[Node]
+            Node table, i.e., node with id i is stored at position i. An interner is taken over and must not be changed afterwards.
+        indptr : np.ndarray
+            Array of length (number of nodes + 1) with offsets of each node's neighbourhood within the indices array.
+        indices : np.ndarray
+            Array of neighbour ids, sorted within each neighbourhood.
+        weights : np.ndarray
+            Array of edge data aligned with the indices array.
+        is_directed : bool (default True)
+            Whether the graph is directed. Undirected graphs store each edge in both directions.
+        number_of_self_loops : Optional[int] (default None)
+            Number of self loops of the graph. If not given, it is counted from the arrays in O(E) time.
+        graph_attributes : Optional[dict[str, Node]] (default None)
+            Graph-level attributes whose values are nodes of the graph (e.g., source and sink of a flow network).
+        """
+        super().__init__()
+        if len(indptr) != len(nodes) + 1:
+            raise ValueError('The indptr array has to have exactly one more entry than there are nodes.')
+        if len(indices) != len(weights):
+            raise ValueError('The indices and weights arrays have to be of the same length.')
+        self._node_interner: NodeInterner[Node] = nodes if isinstance(nodes, NodeInterner) else NodeInterner(nodes)
+        # direct references to the tables of the interner for the hot lookups below
+        self._nodes: list[Node] = self._node_interner.nodes
+        self._node_ids: dict[Node, int] = self._node_interner.ids
+        self._indptr: np.ndarray = indptr
+        self._indices: np.ndarray = indices
+        self._weights: np.ndarray = weights
+        self._is_directed: bool = is_directed
+        if number_of_self_loops is None:
+            number_of_self_loops = int(np.count_nonzero(self._indices == np.repeat(np.arange(len(self._nodes)), np.diff(self._indptr))))
+        self._number_of_self_loops: int = number_of_self_loops
+        self._graph_attributes: dict[str, Node] = dict(graph_attributes) if graph_attributes is not None else {}
+
+    @classmethod
+    def from_graph(cls, graph: BaseGraph, graph_attributes: Optional[dict[str, Node]] = None) -> CSRGraph:
+        """
+        Build the CSR representation of the given graph in O(V + E * log(max degree)) time.
+
+        Parameters
+        ----------
+        graph : BaseGraph
+            Graph to freeze. Multigraphs are not supported.
+        graph_attributes : Optional[dict[str, Node]] (default None)
+            Graph-level attributes whose values are nodes of the graph (e.g., source and sink of a flow network).
+
+        Returns
+        -------
+        csr_graph : CSRGraph
+            Frozen CSR representation of the given graph.
+        """
+        if graph.is_multigraph:
+            raise ValueError('CSR representation is only supported for simple graphs.')
+
+        node_interner = graph.node_interner.copy()
+        nodes, node_ids = node_interner.nodes, node_interner.ids
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        indices: list[int] = []
+        data: list[Any] = []
+        for node_id, node in enumerate(nodes):
+            neighbourhood = sorted((node_ids[neighbour], edge_data) for neighbour, edge_data in graph.adjacency_list[node].items())
+            indices.extend(neighbour_id for neighbour_id, _ in neighbourhood)
+            data.extend(edge_data for _, edge_data in neighbourhood)
+            indptr[node_id + 1] = len(indices)
+
+        return cls(node_interner, indptr, np.array(indices, dtype=np.int64), cls._build_weights_array(data), graph.is_directed,
+                   graph_attributes=graph_attributes)
+
+    @staticmethod
+    def _build_weights_array(data: list[Any]) -> np.ndarray:
+        """
+        Store edge data in a numeric array if possible, otherwise fall back to an array of Python objects.
+
+        Parameters
+        ----------
+        data : list[Any]
+            Edge data in the order of the indices array.
+
+        Returns
+        -------
+        weights : np.ndarray
+            Integer array if all edge data are integers fitting into 64 bits, float array if all edge data are floats or integers represented exactly by a float
+        and object array otherwise (e.g., for integers of arbitrary size).
+        """
+        if all(_is_int64(edge_data) for edge_data in data):
+            return np.array(data, dtype=np.int64)
+        if all(isinstance(edge_data, float) or isinstance(edge_data, int) and not isinstance(edge_data, bool) and abs(edge_data) <= _MAX_EXACT_FLOAT_INT
+               for edge_data in data):
+            return np.array(data, dtype=np.float64)
+        weights = np.empty(len(data), dtype=object)
+        weights[:] = data
+        return weights
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, CSRGraph) and self._nodes == other._nodes and self._is_directed == other._is_directed and
+                np.array_equal(self._indptr, other._indptr) and np.array_equal(self._indices, other._indices) and
+                len(self._weights) == len(other._weights) and all(a == b for a, b in zip(self._weights, other._weights)))
+
+    @property
+    def name(self) -> str:
+        return 'CSR Graph'
+
+    @property
+    def space_complexity(self) -> str:
+        return 'V + E'
+
+    @property
+    def is_directed(self) -> bool:
+        return self._is_directed
+
+    @property
+    def is_multigraph(self) -> bool:
+        return False
+
+    @property
+    def node_interner(self) -> NodeInterner[Node]:
+        return self._node_interner
+
+    @property
+    def graph_attributes(self) -> dict[str, Node]:
+        return self._graph_attributes
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def nodes(self) -> NodesView[Node]:
+        """
+        Retrieve the nodes of this graph in the order of node ids as a read-only view supporting O(1) membership checks.
+
+        Returns
+        -------
+        nodes : NodesView[Node]
+            Nodes of this graph.
+        """
+        return NodesView(self._node_ids)
+
+    def has_node(self, node: Node) -> bool:
+        return node in self._node_ids
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def number_of_edges(self) -> int:
+        """
+        Retrieve the number of edges of this graph.
+        In case of an undirected graph, each edge is counted only once despite being stored in both directions.
+
+        Returns
+        -------
+        number_of_edges : int
+            Number of edges of this graph.
+        """
+        if self._is_directed:
+            return len(self._indices)
+        return (len(self._indices) + self._number_of_self_loops) // 2
+
+    def node_id(self, node: Node) -> int:
+        """
+        Return the dense integer id of the given node.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose id to find.
+
+        Returns
+        -------
+        node_id : int
+            Position of the node in the node table.
+        """
+        if node not in self._node_ids:
+            raise KeyError('Node is not present in the graph.')
+        return self._node_ids[node]
+
+    def neighbors(self, node: Node) -> list[Node]:
+        """
+        Return the adjacent nodes of a given node in the order of their ids, read from a slice of the indices array in O(outdegree) time.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to find the neighbours.
+            If not present in the graph, empty list is returned.
+
+        Returns
+        -------
+        neighbours : list[Node]
+            Adjacent nodes of the node.
+        """
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return []
+        nodes = self._nodes
+        return [nodes[neighbour_id] for neighbour_id in self._indices[self._indptr[node_id]:self._indptr[node_id + 1]].tolist()]
+
+    def iter_out_edges(self, node: Node) -> Iterator[tuple[Node, SingleEdgeData]]:
+        """
+        Iterate over the outgoing edges of the given node in the order of neighbour ids.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose outgoing edges to iterate over.
+            If not present in the graph, nothing is yielded.
+
+        Returns
+        -------
+        out_edges : Iterator[tuple[Node, SingleEdgeData]]
+            Iterator of (neighbour, edge data) pairs.
+        """
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return iter(())
+        start, end = self._indptr[node_id], self._indptr[node_id + 1]
+        return zip((self._nodes[neighbour_id] for neighbour_id in self._indices[start:end].tolist()), self._weights[start:end].tolist())
+
+    def get_edge_data(self, source: Node, target: Node) -> SingleEdgeData | NoEdge:
+        """
+        Return data of the edge between two nodes, found by binary search within the sorted neighbourhood of source.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the edge.
+        target : Node
+            Target node of the edge.
+
+        Returns
+        -------
+        edge_data : SingleEdgeData | NoEdge
+            Data of the edge or NoEdge() object if there is no edge between the two nodes.
+        """
+        if source not in self._node_ids:
+            raise KeyError('Source node is not present in the graph.')
+        if target not in self._node_ids:
+            raise KeyError('Target node is not present in the graph.')
+        source_id, target_id = self._node_ids[source], self._node_ids[target]
+        start, end = self._indptr[source_id], self._indptr[source_id + 1]
+        position = start + int(np.searchsorted(self._indices[start:end], target_id))
+        if position < end and self._indices[position] == target_id:
+            edge_data = self._weights[position]
+            return edge_data.item() if isinstance(edge_data, np.generic) else edge_data
+        return NoEdge()
+
+    def outdegree(self, node: Node) -> int:
+        node_id = self.node_id(node)
+        return int(self._indptr[node_id + 1] - self._indptr[node_id])
+
+    @property
+    def adjacency_list(self) -> dict[Node, dict[Node, SingleEdgeData]]:
+        """
+        Materialize the adjacency list representation of this graph in O(V + E) time.
+
+        Returns
+        -------
+        adjacency_list: dict[Node, dict[Node, SingleEdgeData]]
+            Adjacency list representation of the graph, represented as a dict of node : neighbours pairs with
+            neighbours being a dict of neighbour : edge data.
+        """
+        indices = self._indices.tolist()
+        weights = self._weights.tolist()
+        adjacency_list: dict[Node, dict[Node, SingleEdgeData]] = {}
+        for node_id, node in enumerate(self._nodes):
+            start, end = int(self._indptr[node_id]), int(self._indptr[node_id + 1])
+            adjacency_list[node] = {self._nodes[indices[position]]: weights[position] for position in range(start, end)}
+        return adjacency_list
+
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the node objects, node table (interner), indptr, indices and weights arrays of this graph.
+        Memory-mapped arrays only count their in-memory headers, not the mapped files.
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already.
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        return {
+            'nodes': deep_sizeof(self._nodes, seen),
+            'node_table': deep_sizeof((self._node_interner,), seen),
+            'indptr': deep_sizeof((self._indptr,), seen),
+            'indices': deep_sizeof((self._indices,), seen),
+            'weights': deep_sizeof((self._weights,), seen),
+        }
+
+    def thaw(self, graph_class: Optional[type[BaseGraph]] = None, **kwargs: Any) -> BaseGraph:
+        """
+        Convert this frozen graph back to a mutable adjacency list based graph.
+
+        Parameters
+        ----------
+        graph_class : Optional[type[BaseGraph]] (default None)
+            Class of the graph to build. If not given, DiGraph or Graph is used based on directedness of this graph.
+        **kwargs : Any
+            Additional keyword arguments passed to the constructor of graph_class (e.g., source and sink of a FlowNetwork).
+            Each edge of an undirected graph is passed to the constructor only in one direction.
+
+        Returns
+        -------
+        graph : BaseGraph
+            Mutable graph with the same nodes and edges.
+        """
+        if graph_class is None:
+            from algpy_src.data_structures.graphs.digraph import DiGraph
+            from algpy_src.data_structures.graphs.graph import Graph
+            graph_class = DiGraph if self._is_directed else Graph
+        adjacency_list = self.adjacency_list
+        if not self._is_directed:
+            adjacency_list = {
+                node: {neighbour: edge_data for neighbour, edge_data in neighbourhood.items() if self._node_ids[neighbour] >= self._node_ids[node]}
+                for node, neighbourhood in adjacency_list.items()
+            }
+        return graph_class(adjacency_list, **kwargs)
+
+    def save_binary(self, path: str | os.PathLike[str]) -> None:
+        """
+        Save this graph in the binary on-disk format, i.e., a directory with a JSON metadata file and the CSR arrays stored as .npy files.
+        The index arrays and numeric edge data can be memory-mapped by CSRGraph.load_binary(), so that many processes can share one copy of the graph.
+        Edge data which are FlowEdgeData are stored as three numeric arrays (one per field, with a boolean mask of the flows which are None),
+        edge data which are all None are not stored at all and other edge data are stored as pickled object arrays.
+        Node tables which cannot be stored as integer or string arrays are pickled as well (see nodes_to_array()); such graphs can be loaded only with allow_pickle.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory to save the graph to. It is created if it does not exist yet and existing files of the format are overwritten.
+        """
+        os.makedirs(path, exist_ok=True)
+        weights = self._weights.tolist()
+        if all(edge_data is None for edge_data in weights):
+            edge_data_format = 'none'
+        elif len(weights) > 0 and all(isinstance(edge_data, FlowEdgeData) for edge_data in weights):
+            edge_data_format = 'flow'
+            for field in _FLOW_FIELDS:
+                values = [getattr(edge_data, field) for edge_data in weights]
+                field_array = self._build_weights_array([0 if value is None else value for value in values])
+                np.save(os.path.join(path, f'{field}s.npy'), field_array, allow_pickle=False)
+            # unassigned flows are zero in the flows array, thus integer flows keep their integer array
+            np.save(os.path.join(path, 'flow_nones.npy'), np.array([edge_data.flow is None for edge_data in weights], dtype=bool), allow_pickle=False)
+        elif self._weights.dtype == object:
+            edge_data_format = 'object'
+            np.save(os.path.join(path, 'weights.npy'), self._weights, allow_pickle=True)
+        else:
+            edge_data_format = 'numeric'
+            np.save(os.path.join(path, 'weights.npy'), self._weights, allow_pickle=False)
+
+        nodes_array = nodes_to_array(self._nodes)
+        np.save(os.path.join(path, 'nodes.npy'), nodes_array, allow_pickle=nodes_array.dtype == object)
+        np.save(os.path.join(path, 'indptr.npy'), np.asarray(self._indptr, dtype=np.int64), allow_pickle=False)
+        np.save(os.path.join(path, 'indices.npy'), np.asarray(self._indices, dtype=np.int64), allow_pickle=False)
+
+        metadata = {
+            'format_version': BINARY_FORMAT_VERSION,
+            'is_directed': self._is_directed,
+            'number_of_nodes': len(self._nodes),
+            'number_of_self_loops': self._number_of_self_loops,
+            'edge_data_format': edge_data_format,
+            'pickled': nodes_array.dtype == object or edge_data_format == 'object',
+            'graph_attributes': {attribute: self._node_ids[node] for attribute, node in self._graph_attributes.items()},
+        }
+        with open(os.path.join(path, 'metadata.json'), 'w', encoding='utf-8') as metadata_file:
+            json.dump(metadata, metadata_file)
+
+    @classmethod
+    def load_binary(cls, path: str | os.PathLike[str], mmap: bool = True, allow_pickle: bool = False) -> CSRGraph:
+        """
+        Load a graph saved by save_binary().
+        With mmap set, the index arrays and numeric edge data are memory-mapped read-only instead of being read,
+        thus loading costs O(V) (building of the node table) and the operating system shares the pages among all processes loading the same graph.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory the graph was saved to.
+        mmap : bool (default True)
+            Whether to memory-map the arrays (read-only) instead of reading them into memory.
+        allow_pickle : bool (default False)
+            Whether to load pickled node tables and edge data (see save_binary()).
+            Unpickling can execute arbitrary code, thus it should be allowed only for graphs from a trusted source.
+
+        Returns
+        -------
+        csr_graph : CSRGraph
+            The loaded graph.
+        """
+        with open(os.path.join(path, 'metadata.json'), encoding='utf-8') as metadata_file:
+            metadata = json.load(metadata_file)
+        if metadata.get('format_version') != BINARY_FORMAT_VERSION:
+            raise ValueError(f'Unsupported binary graph format version {metadata.get("format_version")}.')
+        if metadata.get('pickled') and not allow_pickle:
+            raise ValueError('The graph was saved with pickled node table or edge data, which can be loaded only with allow_pickle set.')
+        mmap_mode: Optional[Any] = 'r' if mmap else None
+
+        nodes_array = np.load(os.path.join(path, 'nodes.npy'), allow_pickle=allow_pickle)
+        nodes = nodes_array.tolist()
+        indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode=mmap_mode)
+        indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode=mmap_mode)
+
+        edge_data_format = metadata['edge_data_format']
+        weights: np.ndarray
+        if edge_data_format == 'numeric':
+            weights = np.load(os.path.join(path, 'weights.npy'), mmap_mode=mmap_mode)
+        elif edge_data_format == 'object':
+            weights = np.load(os.path.join(path, 'weights.npy'), allow_pickle=allow_pickle)
+        elif edge_data_format == 'flow':
+            lower_bounds, flows, upper_bounds = [np.load(os.path.join(path, f'{field}s.npy')).tolist() for field in _FLOW_FIELDS]
+            flow_nones = np.load(os.path.join(path, 'flow_nones.npy')).tolist()
+            weights = np.empty(len(indices), dtype=object)
+            weights[:] = [FlowEdgeData(lower_bound, None if flow_none else flow, upper_bound)
+                          for lower_bound, flow, upper_bound, flow_none in zip(lower_bounds, flows, upper_bounds, flow_nones)]
+        else:
+            weights = np.full(len(indices), None, dtype=object)
+
+        graph_attributes = {attribute: nodes[node_id] for attribute, node_id in metadata['graph_attributes'].items()}
+        return cls(nodes, indptr, indices, weights, metadata['is_directed'], metadata['number_of_self_loops'], graph_attributes)
@@ -14,7 +14,7 @@ class DiGraph(BaseGraph[Node, SingleEdgeData]):
     Adjacency list representation is assumed for simplicity.
     """
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None) -> None:
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None, store_edges: bool = True) -> None:
         """
         Constructor of the DiGraph class.
 
@@ -22,8 +22,10 @@ class DiGraph(BaseGraph[Node, SingleEdgeData]):
         ----------
         adjacency_list : Optional[dict[Node, dict[Node, dict[Node, EdgeData]]]] (default None)
             Optional adjacency list from which to build the graph.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
         """
-        super().__init__(adjacency_list)
+        super().__init__(adjacency_list, store_edges)
 
     @property
     def name(self) -> str:
@@ -54,9 +56,9 @@ class DiGraph(BaseGraph[Node, SingleEdgeData]):
         self.add_nodes_from({u, v})
         current_data = self.get_edge_data(u, v)
         if current_data != NoEdge():
-            self.edges.discard((u, v, current_data))
-        self._adjacency_list[u][v] = data
-        self.edges.add(edge)
+            self._forget_edge((u, v, current_data))
+        self._set_edge_entry(u, v, data)
+        self._record_edge(edge)
 
     @affects_adjacency_matrix
     def remove_edge(self, source: Node, target: Node, *data: SingleEdgeData) -> None:
@@ -73,12 +75,12 @@ class DiGraph(BaseGraph[Node, SingleEdgeData]):
         *data : SingleEdgeData
             Data of the edge to be removed. Only one entry has to be given for a simple graph.
         """
-        if source not in self.nodes or target not in self.nodes:
+        if source not in self._adjacency_list or target not in self._adjacency_list:
             return
         if len(data) > 1:
             raise ValueError('Simple graph cannot have more than 1 edge between two nodes.')
         present_data: SingleEdgeData | NoEdge = self._adjacency_list[source].get(target, NoEdge())
         if present_data == NoEdge() or (data and present_data != data[0]):
             return
-        del self._adjacency_list[source][target]
-        self.edges.discard((source, target, present_data))
+        self._delete_edge_entry(source, target)
+        self._forget_edge((source, target, present_data))
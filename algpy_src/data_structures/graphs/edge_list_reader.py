@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import csv
+import os
+from itertools import islice
+from typing import Any, Callable, Generic, Iterator, Literal, Optional, Sequence, TextIO, TypeVar
+
+from algpy_src.base.constants import Node, Edge, FlowEdgeData
+from algpy_src.data_structures.graphs.base_graph import BaseGraph
+
+_G = TypeVar('_G', bound=BaseGraph)
+EDGE_DATA_FORMATS = Literal['none', 'weight', 'flow']
+_DEFAULT_DATA_COLUMNS: dict[str, tuple[int, ...]] = {'none': (), 'weight': (2,), 'flow': (2, 3, 4)}
+
+
+def parse_number(value: str) -> int | float:
+    """
+    Parse a number from its string representation, preferring integers over floats (e.g., '3' is parsed as 3 but '3.0' and 'inf' as floats).
+
+    Parameters
+    ----------
+    value : str
+        String representation of the number.
+
+    Returns
+    -------
+    number : int | float
+        The parsed number.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class EdgeListReader(Generic[Node]):
+    """
+    Streaming reader of graphs stored as edge lists (one edge per line, columns separated by whitespace) or CSV files.
+    The file is read in chunks of a fixed number of lines which are parsed into columns of sources, targets and edge data,
+    thus the memory needed besides the built graph is bounded by the chunk size.
+    Node labels are interned, i.e., every distinct label is parsed only once and all its occurrences share one node object.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], delimiter: Optional[str] = None, comment: Optional[str] = '#', has_header: bool = False,
+                 source_column: int = 0, target_column: int = 1, data_format: EDGE_DATA_FORMATS = 'none', data_columns: Optional[Sequence[int]] = None,
+                 node_type: Callable[[str], Any] = str, number_type: Callable[[str], Any] = parse_number, chunk_size: int = 100_000,
+                 encoding: str = 'utf-8') -> None:
+        """
+        Constructor of the EdgeListReader class.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Path to the file to read.
+        delimiter : Optional[str] (default None)
+            Delimiter of the columns. If not given, columns are separated by any whitespace, otherwise the file is read as CSV (quoting is supported).
+        comment : Optional[str] (default '#')
+            Lines starting with this string are skipped, as are empty lines. If None or empty, no lines are treated as comments.
+        has_header : bool (default False)
+            Whether the first (non-comment) line is a header to be skipped.
+        source_column : int (default 0)
+            Index of the column with source nodes.
+        target_column : int (default 1)
+            Index of the column with target nodes.
+        data_format : EDGE_DATA_FORMATS (default 'none')
+            Format of the edge data: 'none' for no edge data (None is used), 'weight' for a single numeric column
+            and 'flow' for three numeric columns forming FlowEdgeData (lower bound, flow, upper bound), where an empty or 'None' flow is parsed as None.
+        data_columns : Optional[Sequence[int]] (default None)
+            Indices of the edge data columns. If not given, the columns following the target column are used, i.e., (2,) for weights and (2, 3, 4) for flows.
+        node_type : Callable[[str], Any] (default str)
+            Function parsing node labels to nodes (e.g., int).
+        number_type : Callable[[str], Any] (default parse_number)
+            Function parsing numeric edge data.
+        chunk_size : int (default 100_000)
+            Number of lines read and parsed at once.
+        encoding : str (default 'utf-8')
+            Encoding of the file.
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size has to be positive.')
+        self._path: str | os.PathLike[str] = path
+        self._delimiter: Optional[str] = delimiter
+        self._comment: Optional[str] = comment or None
+        self._has_header: bool = has_header
+        self._source_column: int = source_column
+        self._target_column: int = target_column
+        self._data_format: EDGE_DATA_FORMATS = data_format
+        self._data_columns: tuple[int, ...] = tuple(data_columns) if data_columns is not None else _DEFAULT_DATA_COLUMNS[data_format]
+        if len(self._data_columns) != len(_DEFAULT_DATA_COLUMNS[data_format]):
+            raise ValueError(f'Edge data format {data_format} requires exactly {len(_DEFAULT_DATA_COLUMNS[data_format])} data columns.')
+        self._node_type: Callable[[str], Any] = node_type
+        self._number_type: Callable[[str], Any] = number_type
+        self._chunk_size: int = chunk_size
+        self._encoding: str = encoding
+        self._nodes: dict[str, Node] = {}
+
+    @property
+    def nodes(self) -> list[Node]:
+        """
+        Retrieve the nodes read so far in the order of their first occurrence.
+
+        Returns
+        -------
+        nodes : list[Node]
+            Interned nodes read so far.
+        """
+        return list(self._nodes.values())
+
+    def _intern_node(self, label: str) -> Node:
+        node = self._nodes.get(label)
+        if node is None:
+            node = self._node_type(label)
+            self._nodes[label] = node
+        return node
+
+    def _iter_rows(self, file: TextIO) -> Iterator[tuple[int, list[str]]]:
+        """
+        Iterate over the rows of the file split into columns, skipping empty lines, comments and the header.
+
+        Parameters
+        ----------
+        file : TextIO
+            Opened file to read from.
+
+        Returns
+        -------
+        rows : Iterator[tuple[int, list[str]]]
+            Iterator of (line number, columns) pairs.
+        """
+        rows: Iterator[tuple[int, list[str]]]
+        if self._delimiter is None:
+            rows = ((line_number, line.split()) for line_number, line in enumerate(file, 1))
+        else:
+            reader = csv.reader(file, delimiter=self._delimiter)
+            rows = ((reader.line_num, columns) for columns in reader)
+        header_skipped = not self._has_header
+        for line_number, columns in rows:
+            if not columns or not any(columns) or self._comment is not None and columns[0].startswith(self._comment):
+                continue
+            if not header_skipped:
+                header_skipped = True
+                continue
+            yield line_number, columns
+
+    def _parse_edge_data(self, columns: list[str]) -> Any:
+        if self._data_format == 'none':
+            return None
+        if self._data_format == 'weight':
+            return self._number_type(columns[self._data_columns[0]])
+        lower_bound, flow, upper_bound = (columns[column].strip() for column in self._data_columns)
+        return FlowEdgeData(self._number_type(lower_bound), None if flow in ('', 'None') else self._number_type(flow), self._number_type(upper_bound))
+
+    def iter_chunks(self) -> Iterator[tuple[list[Node], list[Node], list[Any]]]:
+        """
+        Read the file chunk by chunk and parse each chunk into aligned columns of edge sources, targets and data.
+
+        Returns
+        -------
+        chunks : Iterator[tuple[list[Node], list[Node], list[Any]]]
+            Iterator of (sources, targets, data) columns of at most chunk_size edges each.
+        """
+        with open(self._path, newline='', encoding=self._encoding) as file:
+            rows = self._iter_rows(file)
+            while chunk := list(islice(rows, self._chunk_size)):
+                sources: list[Node] = []
+                targets: list[Node] = []
+                edge_data: list[Any] = []
+                for line_number, columns in chunk:
+                    try:
+                        sources.append(self._intern_node(columns[self._source_column].strip()))
+                        targets.append(self._intern_node(columns[self._target_column].strip()))
+                        edge_data.append(self._parse_edge_data(columns))
+                    except (IndexError, ValueError) as error:
+                        raise ValueError(f'Line {line_number} of {os.fspath(self._path)!r} could not be parsed as an edge: {error}') from error
+                yield sources, targets, edge_data
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """
+        Read the file chunk by chunk and iterate over its edges.
+
+        Returns
+        -------
+        edges : Iterator[Edge]
+            Iterator of edges represented as tuples of (source node, target node, edge data).
+        """
+        for sources, targets, edge_data in self.iter_chunks():
+            yield from zip(sources, targets, edge_data)
+
+    def load(self, graph_class: type[_G], nodes: Optional[Sequence[Node]] = None, **kwargs: Any) -> _G:
+        """
+        Build a graph from the file in a single streaming pass using the bulk construction of the graph class (see BaseGraph.from_edge_list()).
+
+        Parameters
+        ----------
+        graph_class : type[_G]
+            Class of the graph to build (e.g., DiGraph or FlowNetwork).
+        nodes : Optional[Sequence[Node]] (default None)
+            Nodes to add to the graph before the edges, e.g., to include isolated nodes or to fix the order of nodes.
+        **kwargs : Any
+            Additional keyword arguments passed to the constructor of the graph (e.g., source and sink of a FlowNetwork or store_edges).
+
+        Returns
+        -------
+        graph : _G
+            The built graph.
+        """
+        return graph_class.from_edge_list(self.iter_edges(), nodes, **kwargs)
@@ -1,17 +1,21 @@
-from typing import Optional, TypeVar, Generic
+from typing import Any, Iterable, Optional, Sequence, TypeVar, Generic
+
+import numpy as np
+from numpy.typing import DTypeLike
 
 from algpy_src.base.constants import Node, SingleEdgeData
 from algpy_src.data_structures.graphs.graph import Graph
-from algpy_src.data_structures.graphs.graph_utils.affects_adjacency_matrix import affects_adjacency_matrix
+from algpy_src.data_structures.graphs.graph_utils.columnar_feature_store import ColumnarFeatureStore
 from algpy_src.data_structures.graphs.graph_utils.no_feature_object import NoFeature
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
 
 F = TypeVar('F')
 
 
-class FeatureGraph(Graph, Generic[F]):
+class FeatureGraph(Graph, Generic[Node, F]):
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None, node_features: Optional[dict[Node, F]] = None) -> None:
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None, node_features: Optional[dict[Node, F]] = None,
+                 store_edges: bool = True, feature_columns: Optional[Sequence[str]] = None, feature_dtype: DTypeLike = np.float64) -> None:
         """
         Constructor of the FeatureGraph class.
 
@@ -21,15 +25,33 @@ class FeatureGraph(Graph, Generic[F]):
             Optional adjacency list from which to build the feature graph.
         node_features : Optional[dict[Node, F]] (default None)
             Node features mapping to start the graph from. If any nodes present here are not in the adjacency list, they are silently added.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
+        feature_columns : Optional[Sequence[str]] (default None)
+            Names of the features if they should be stored columnar, i.e., in a node-aligned NumPy array per feature (see ColumnarFeatureStore).
+            Features are then a single number if there is one column and a dict of column : number otherwise.
+            If None, features of any type are stored in a dict of node : features.
+        feature_dtype : DTypeLike (default np.float64)
+            Data type of the feature columns, only used if feature_columns are given.
         """
-        super().__init__(adjacency_list)
+        super().__init__(adjacency_list, store_edges)
         if node_features is None:
             node_features = {}
-        self._node_features: dict[Node, F] = node_features
+        self._node_features: dict[Node, F] = {}
+        self._feature_store: Optional[ColumnarFeatureStore] = None
+        if feature_columns is None:
+            self._node_features = node_features
+        else:
+            self._feature_store = ColumnarFeatureStore(feature_columns, feature_dtype, max(len(node_features), 16))
+            for node, features in node_features.items():
+                self._feature_store.set(node, features)
         self.add_nodes_from(set(node_features.keys()) - set(self._adjacency_list.keys()))
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, FeatureGraph) and self._adjacency_list == other.adjacency_list and self._node_features == other.node_features
+        return (isinstance(other, FeatureGraph) and not self._fingerprints_differ(other) and self._adjacency_list == other.adjacency_list and
+                self.node_features == other.node_features)
+
+    __hash__ = Graph.__hash__
 
     @property
     def name(self) -> str:
@@ -39,14 +61,29 @@ class FeatureGraph(Graph, Generic[F]):
     def node_features(self) -> dict[Node, F]:
         """
         Getter for the node features dictionary of the graph.
+        For columnar features, the dictionary is materialized from the feature columns, thus changing it does not change the graph.
 
         Returns
         -------
         node_features: dict[Node, F]
             Dictionary of node features assigned to each node.
         """
+        if self._feature_store is not None:
+            return self._feature_store.to_dict()
         return self._node_features
 
+    @property
+    def feature_store(self) -> Optional[ColumnarFeatureStore]:
+        """
+        Getter for the columnar feature store of the graph.
+
+        Returns
+        -------
+        feature_store : Optional[ColumnarFeatureStore]
+            Store of the node features, None if they are not stored columnar.
+        """
+        return self._feature_store
+
     def add_nodes_with_features_from(self, node_features_mapping: dict[Node, F]) -> None:
         """
         Add nodes along with their features from a bunch.
@@ -59,11 +96,10 @@ class FeatureGraph(Graph, Generic[F]):
         for node, feature in node_features_mapping.items():
             self.add_node_with_features(node, feature)
 
-    @affects_adjacency_matrix
     def add_node_with_features(self, node: Node, features: F) -> None:
         """
         Add a single node to the graph and assign its features.
-        If the node already exists, its features are rewritten.
+        If the node already exists, its features are rewritten without affecting the adjacency (and its cached adjacency matrix).
 
         Parameters
         ----------
@@ -72,8 +108,12 @@ class FeatureGraph(Graph, Generic[F]):
         features : F
             Features to be assigned to the node
         """
-        super().add_node(node)
-        self._node_features[node] = features
+        if node not in self._adjacency_list:
+            super().add_node(node)
+        if self._feature_store is not None:
+            self._feature_store.set(node, features)
+        else:
+            self._node_features[node] = features
 
     def remove_node(self, node: Node) -> None:
         """
@@ -86,7 +126,10 @@ class FeatureGraph(Graph, Generic[F]):
             Node to be removed.
         """
         super().remove_node(node)
-        self._node_features.pop(node)
+        if self._feature_store is not None:
+            self._feature_store.remove(node)
+        elif node in self._node_features:
+            del self._node_features[node]
 
     def get_node_features(self, node: Node) -> F | NoNode | NoFeature:
         """
@@ -103,6 +146,54 @@ class FeatureGraph(Graph, Generic[F]):
             Node features of the given node.
             Returns NoNode() object if the node is not present in the graph and NoFeature() object if it does not have features assigned.
         """
-        if node not in self.nodes:
+        if node not in self._adjacency_list:
             return NoNode()
+        if self._feature_store is not None:
+            return self._feature_store.get(node)
         return self._node_features.get(node, NoFeature())
+
+    def get_node_features_batch(self, nodes: Iterable[Node], column: Optional[str] = None) -> np.ndarray:
+        """
+        Return node features of the given nodes at once, in a single vectorized lookup for columnar features.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes with assigned features to retrieve the features for.
+        column : Optional[str] (default None)
+            Name of the feature to retrieve for columnar features, may be omitted if there is a single feature column.
+
+        Returns
+        -------
+        node_features : np.ndarray
+            Node features in the order of the given nodes.
+        """
+        if self._feature_store is not None:
+            return self._feature_store.get_batch(nodes, column)
+        return np.array([self._node_features[node] for node in nodes])
+
+    def set_node_features_batch(self, nodes: Iterable[Node], features: Any, column: Optional[str] = None) -> None:
+        """
+        Assign node features to the given existing nodes at once, in a single vectorized assignment for columnar features.
+        The adjacency (and its cached adjacency matrix) is not affected.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes of the graph to assign the features to.
+        features : Any
+            Node features in the order of the given nodes (an array or sequence) or single node features for all of them.
+        column : Optional[str] (default None)
+            Name of the feature to assign for columnar features, may be omitted if there is a single feature column.
+        """
+        nodes = list(nodes)
+        if any(node not in self._adjacency_list for node in nodes):
+            raise ValueError('Features can be assigned only to nodes of the graph.')
+        if self._feature_store is not None:
+            self._feature_store.set_batch(nodes, features, column)
+            return
+        if np.ndim(features) == 0:
+            features = [features] * len(nodes)
+        elif isinstance(features, np.ndarray):
+            features = features.tolist()
+        self._node_features.update(zip(nodes, features))
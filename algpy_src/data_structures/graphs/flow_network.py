@@ -1,5 +1,6 @@
 import math
-from typing import Optional, Generic
+from itertools import chain
+from typing import Iterable, Optional, Generic
 
 from algpy_src.base.constants import Node, FlowEdgeData, Edge
 from algpy_src.data_structures.graphs.digraph import DiGraph
@@ -8,11 +9,33 @@ from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
 
 
+def exact_flow_sum(flows: Iterable[int | float]) -> int | float:
+    """
+    Sum flows without loss of precision, i.e., exactly for integer flows and correctly rounded (see math.fsum()) if any flow is a float.
+
+    Parameters
+    ----------
+    flows : Iterable[int | float]
+        Flows to sum.
+
+    Returns
+    -------
+    total : int | float
+        Sum of the flows, an int if all flows are ints.
+    """
+    flows = list(flows)
+    if all(isinstance(flow, int) for flow in flows):
+        return sum(flows)
+    return math.fsum(flows)
+
+
 class FlowNetwork(DiGraph, Generic[Node]):
 
+    _graph_attribute_names = ('source', 'sink')
+
     def __init__(
             self, adjacency_list: Optional[dict[Node, dict[Node, FlowEdgeData]]] = None,
-            source: Node | NoNode = NoNode(), sink: Node | NoNode = NoNode(), check_input_flow_validity: bool = False,
+            source: Node | NoNode = NoNode(), sink: Node | NoNode = NoNode(), check_input_flow_validity: bool = False, store_edges: bool = True,
     ) -> None:
         """
         Constructor of the FlowNetwork class.
@@ -28,47 +51,125 @@ class FlowNetwork(DiGraph, Generic[Node]):
             Sink of the flow. If not given, an error is raised.
         check_input_flow_validity : bool (default False)
             Validity of flow given in this constructor may be optionally checked with computation cost of O(n^2).
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
 
         """
-        super().__init__(adjacency_list)
+        super().__init__(adjacency_list, store_edges)
         if isinstance(source, NoNode) or isinstance(sink, NoNode):
             raise ValueError('Both source and sink must be given.')
-        if source not in self.nodes or sink not in self.nodes:
+        if source not in self._adjacency_list or sink not in self._adjacency_list:
             raise ValueError('Source and sink must be present in the given adjacency list.')
         self._source: Node = source
         self._sink: Node = sink
-        if check_input_flow_validity and adjacency_list is not None:
-            self.check_flow_validity()
 
+        # total integer inflow and outflow of every node, number of edges with a float flow incident to every node
+        # and the edges with flow outside bounds, maintained on every change of an edge
+        # (running float totals would lose precision when large and small flows cancel, thus they are summed from the edges on demand)
+        self._inflows: dict[Node, int] = dict.fromkeys(self._adjacency_list, 0)
+        self._outflows: dict[Node, int] = dict.fromkeys(self._adjacency_list, 0)
+        self._float_flow_degrees: dict[Node, int] = dict.fromkeys(self._adjacency_list, 0)
+        self._out_of_bounds_edges: set[tuple[Node, Node]] = set()
         self._max_lower_bound = 0
-        for node in self.nodes:
-            for edge in self.adjacency_list[node].values():
+        for node in self._adjacency_list:
+            for out_neighbour, edge in self._adjacency_list[node].items():
                 self._max_lower_bound = max(self._max_lower_bound, edge.lower_bound)
+                self._track_flow_edge(node, out_neighbour, edge, 1)
 
-    def check_flow_validity(self) -> None:
-        for node in self.adjacency_list.keys():
+        if check_input_flow_validity and adjacency_list is not None:
+            self.check_flow_validity()
 
-            for out_neighbour, out_edge in self.adjacency_list[node].items():
-                if not self.is_flow_within_bounds(out_edge):
-                    raise ValueError(f'Given edge between nodes {node}, {out_neighbour} has initial flow of {out_edge.flow},'
-                                     f' which is outside the bounds of [{out_edge.lower_bound}, {out_edge.upper_bound}].')
+    def check_flow_validity(self) -> None:
+        """
+        Check that all flows are within bounds of their edges and that the flow balance of every node except for the source and sink is 0.
+        Thanks to the maintained flow totals of the nodes and the set of edges with flow outside bounds, this takes O(V) time for integer flows
+        (plus the degrees of the nodes with float flows, see get_node_balance()).
+        """
+        for node, out_neighbour in self._out_of_bounds_edges:
+            out_edge = self._adjacency_list[node][out_neighbour]
+            raise ValueError(f'Given edge between nodes {node}, {out_neighbour} has initial flow of {out_edge.flow},'
+                             f' which is outside the bounds of [{out_edge.lower_bound}, {out_edge.upper_bound}].')
 
+        for node in self._adjacency_list:
             if node != self._source and node != self._sink:
                 flow_balance = self.get_node_balance(node)
                 if not math.isclose(flow_balance, 0):
                     raise ValueError(f"Flow balance of node {node} is {flow_balance}, which does not follow Kirchhoff's law.")
 
+    def _track_flow_edge(self, source: Node, target: Node, edge_data: FlowEdgeData, sign: int) -> None:
+        """
+        Helper method to add (sign 1) or subtract (sign -1) the flow of an edge to or from the flow totals of its nodes in O(1) time.
+        Integer flows are added to the totals, float flows are only counted for both nodes.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the edge.
+        target : Node
+            Target node of the edge.
+        edge_data : FlowEdgeData
+            Data of the edge, unassigned flow (None) counts as 0.
+        sign : int
+            1 if the edge is added, -1 if it is removed.
+        """
+        if isinstance(edge_data.flow, int):
+            self._outflows[source] += sign * edge_data.flow
+            self._inflows[target] += sign * edge_data.flow
+        elif edge_data.flow is not None:
+            self._float_flow_degrees[source] += sign
+            self._float_flow_degrees[target] += sign
+        if sign < 0:
+            self._out_of_bounds_edges.discard((source, target))
+        elif not self.is_flow_within_bounds(edge_data):
+            self._out_of_bounds_edges.add((source, target))
+
+    def _insert_node(self, node: Node) -> None:
+        super()._insert_node(node)
+        self._inflows.setdefault(node, 0)
+        self._outflows.setdefault(node, 0)
+        self._float_flow_degrees.setdefault(node, 0)
+
+    def _delete_node(self, node: Node) -> None:
+        super()._delete_node(node)
+        del self._inflows[node]
+        del self._outflows[node]
+        del self._float_flow_degrees[node]
+
+    def _set_edge_entry(self, source: Node, target: Node, data: FlowEdgeData) -> None:
+        present_data = self._adjacency_list[source].get(target, NoEdge())
+        if not isinstance(present_data, NoEdge):
+            self._track_flow_edge(source, target, present_data, -1)
+        super()._set_edge_entry(source, target, data)
+        self._track_flow_edge(source, target, data, 1)
+
+    def _delete_edge_entry(self, source: Node, target: Node) -> None:
+        self._track_flow_edge(source, target, self._adjacency_list[source][target], -1)
+        super()._delete_edge_entry(source, target)
+
     @staticmethod
     def is_flow_within_bounds(edge_data: FlowEdgeData) -> bool:
         return edge_data.flow is None or edge_data.lower_bound <= edge_data.flow <= edge_data.upper_bound
 
     def get_node_balance(self, node: Node) -> int | float:
-        flow_balance = 0
-        for out_neighbour, out_edge in self.adjacency_list[node].items():
-            flow_balance -= out_edge.flow if out_edge.flow is not None else 0
-        for in_neighbour, in_edge in self.adjacency_list_transposed[node].items():
-            flow_balance += in_edge.flow if in_edge.flow is not None else 0
-        return flow_balance
+        """
+        Retrieve the flow balance of the given node, i.e., its total inflow minus its total outflow,
+        in O(1) time if all flows of its edges are integers and exactly summed from its edges in O(degree) time otherwise.
+
+        Parameters
+        ----------
+        node : Node
+            Node of the network.
+
+        Returns
+        -------
+        flow_balance : int | float
+            Flow balance of the node.
+        """
+        if self._float_flow_degrees[node] == 0:
+            return self._inflows[node] - self._outflows[node]
+        in_flows = (edge_data.flow for _, edge_data in self.iter_in_edges(node) if edge_data.flow is not None)
+        out_flows = (-edge_data.flow for _, edge_data in self.iter_out_edges(node) if edge_data.flow is not None)
+        return exact_flow_sum(chain(in_flows, out_flows))
 
     @property
     def source(self) -> Node:
@@ -79,17 +180,20 @@ class FlowNetwork(DiGraph, Generic[Node]):
         return self._sink
 
     def set_source(self, node: Node) -> None:
-        if node not in self.nodes:
+        if node not in self._adjacency_list:
             raise ValueError('Trying to set source which is not present in the graph.')
         self._source = node
 
     def set_sink(self, node: Node) -> None:
-        if node not in self.nodes:
+        if node not in self._adjacency_list:
             raise ValueError('Trying to set sink which is not present in the graph.')
         self._sink = node
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, FlowNetwork) and self._adjacency_list == other.adjacency_list and self._source == other.source and self._sink == other.sink
+        return (isinstance(other, FlowNetwork) and self._source == other.source and self._sink == other.sink and not self._fingerprints_differ(other) and
+                self._adjacency_list == other.adjacency_list)
+
+    __hash__ = DiGraph.__hash__
 
     @property
     def max_lower_bound(self) -> int:
@@ -120,6 +224,27 @@ class FlowNetwork(DiGraph, Generic[Node]):
             if self.is_flow_within_bounds(new_flow_edge):
                 self.add_edge((source, target, new_flow_edge))
 
+    @affects_adjacency_matrix
+    def set_flows(self, edge_flows: Iterable[tuple[Node, Node, int | float]]) -> None:
+        """
+        Change flows of many edges at once, e.g., to write back flows computed on a residual network.
+        Edges which do not exist and flows outside bounds are skipped as in change_flow_between_nodes(), but the adjacency matrix is invalidated only once.
+
+        Parameters
+        ----------
+        edge_flows : Iterable[tuple[Node, Node, int | float]]
+            Triples of source, target and new flow of the edges to change.
+        """
+        for source, target, new_flow in edge_flows:
+            current_flow_edge = self.get_edge_data(source, target)
+            if isinstance(current_flow_edge, NoEdge):
+                continue
+            new_flow_edge = FlowEdgeData(current_flow_edge.lower_bound, new_flow, current_flow_edge.upper_bound)
+            if self.is_flow_within_bounds(new_flow_edge):
+                self._forget_edge((source, target, current_flow_edge))
+                self._set_edge_entry(source, target, new_flow_edge)
+                self._record_edge((source, target, new_flow_edge))
+
     @affects_adjacency_matrix
     def add_edge(self, edge: Edge) -> None:
         super().add_edge(edge)
@@ -127,4 +252,12 @@ class FlowNetwork(DiGraph, Generic[Node]):
 
     @property
     def current_flow(self) -> float:
+        """
+        Getter for the value of the current flow, i.e., the absolute flow balance of the source (see get_node_balance()).
+
+        Returns
+        -------
+        current_flow : float
+            Value of the current flow.
+        """
         return abs(self.get_node_balance(self._source))
\ No newline at end of file
@@ -14,7 +14,7 @@ class Graph(DiGraph):
     Internally, Graph is represented as a DiGraph with edges going both ways.
     """
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None) -> None:
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, SingleEdgeData]]] = None, store_edges: bool = True) -> None:
         """
         Constructor of the Graph class.
 
@@ -24,8 +24,10 @@ class Graph(DiGraph):
             Optional adjacency list from which to build the graph.
             If one direction edges are given, they are filled to their other direction.
             If edges in both directions are given with conflicting data, this data is arbitrarily rewritten to one of the entries.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
         """
-        super().__init__(adjacency_list)
+        super().__init__(adjacency_list, store_edges)
         super()._fill_to_undirected()
 
     @property
@@ -56,7 +58,7 @@ class Graph(DiGraph):
         u, v, data = edge
         super().add_edge(edge)
         super().add_edge((v, u, data))
-        self.edges.remove((v, u, data))
+        self._forget_edge((v, u, data))
 
     @affects_adjacency_matrix
     def remove_edge(self, source: Node, target: Node, *data: SingleEdgeData) -> None:
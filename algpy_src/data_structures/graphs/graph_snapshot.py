@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from typing import Any, Generic, Iterable, Iterator, KeysView, Optional
+
+from algpy_src.base.constants import Node, EdgeData, Edge
+from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.graph_utils.edge_entries import AdjacencyEntries, collect_edges, count_edge_entries, edge_entry_size, number_of_edges_from_counts
+from algpy_src.data_structures.graphs.graph_utils.graph_fingerprint import graph_fingerprint
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_view import EdgeFilter, GraphView
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+# shared (never modified) neighbourhood of nodes which are not present in the snapshot
+_EMPTY_NEIGHBOURHOOD: dict[Any, Any] = {}
+
+
+class GraphSnapshot(DataStructure, Generic[Node, EdgeData]):
+    """
+    Immutable snapshot of a graph, typically created by BaseGraph.snapshot().
+    The snapshot shares the adjacency structures with the graph it was taken from, which copies them lazily (copy-on-write) once it is changed,
+    thus the snapshot keeps reflecting the state of the graph at the time of its creation.
+    It supports the read interface used by the traversal algorithms and can therefore be queried while the original graph is being changed.
+    """
+
+    def __init__(self, adjacency_list: dict[Node, dict[Node, EdgeData]], predecessors: Optional[dict[Node, dict[Node, EdgeData]]],
+                 is_directed: bool, is_multigraph: bool, graph_name: str, fingerprint: Optional[int] = None) -> None:
+        """
+        Constructor of the GraphSnapshot class.
+        Typically, it is not called directly but through BaseGraph.snapshot().
+
+        Parameters
+        ----------
+        adjacency_list : dict[Node, dict[Node, EdgeData]]
+            Adjacency list of the graph, which must not be changed afterwards.
+        predecessors : Optional[dict[Node, dict[Node, EdgeData]]]
+            Reverse adjacency (in-edge) index of a directed graph, which must not be changed afterwards. None for undirected graphs.
+        is_directed : bool
+            Whether the graph is directed.
+        is_multigraph : bool
+            Whether the graph is a multigraph.
+        graph_name : str
+            Name of the graph the snapshot was taken of.
+        fingerprint : Optional[int] (default None)
+            Structural fingerprint of the graph (see BaseGraph.fingerprint()) if it is already known, otherwise it is computed on first access.
+        """
+        super().__init__()
+        self._adjacency_list: dict[Node, dict[Node, EdgeData]] = adjacency_list
+        self._predecessors: Optional[dict[Node, dict[Node, EdgeData]]] = predecessors
+        self._is_directed: bool = is_directed
+        self._is_multigraph: bool = is_multigraph
+        self._graph_name: str = graph_name
+        self._number_of_edges: Optional[int] = None
+        self._fingerprint: Optional[int] = fingerprint
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, GraphSnapshot) and (self._fingerprint is None or other._fingerprint is None or self._fingerprint == other._fingerprint) and
+                self._adjacency_list == other._adjacency_list)
+
+    def __hash__(self) -> int:
+        return self.fingerprint()
+
+    def fingerprint(self) -> int:
+        """
+        Retrieve the structural fingerprint of the snapshot (see BaseGraph.fingerprint()), equal to the fingerprint of the graph at the time of the snapshot.
+        It is taken over from the graph or computed on first access in O(V + E) time, later accesses take O(1) time.
+
+        Returns
+        -------
+        fingerprint : int
+            Fingerprint of the snapshot, a non-negative integer below 2 ** 64.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = graph_fingerprint(self._adjacency_entries())
+        return self._fingerprint
+
+    @property
+    def name(self) -> str:
+        return f'{self._graph_name} Snapshot'
+
+    @property
+    def space_complexity(self) -> str:
+        return 'V + E'
+
+    @property
+    def is_directed(self) -> bool:
+        return self._is_directed
+
+    @property
+    def is_multigraph(self) -> bool:
+        return self._is_multigraph
+
+    @property
+    def nodes(self) -> NodesView[Node]:
+        return NodesView(self._adjacency_list)
+
+    def has_node(self, node: Node) -> bool:
+        return node in self._adjacency_list
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self._adjacency_list)
+
+    @property
+    def number_of_edges(self) -> int:
+        """
+        Retrieve the number of edges of the snapshot, counted once in O(V + E) time.
+        In case of an undirected graph, each edge is counted only once despite being internally represented as a directed graph.
+
+        Returns
+        -------
+        number_of_edges : int
+            Number of edges of the snapshot.
+        """
+        if self._number_of_edges is None:
+            number_of_entries, number_of_self_loop_entries = count_edge_entries(self._adjacency_entries(), self._is_multigraph)
+            self._number_of_edges = number_of_edges_from_counts(number_of_entries, number_of_self_loop_entries, self._is_directed)
+        return self._number_of_edges
+
+    @property
+    def edges(self) -> set[Edge]:
+        """
+        Retrieve the edges of the snapshot, built in O(V + E) time.
+        Only one direction of each edge of an undirected graph is retrieved.
+
+        Returns
+        -------
+        edges : set[Edge]
+            Edges of the snapshot as tuples of (source node, destination node, edge data).
+        """
+        return collect_edges(self._adjacency_entries(), self._is_directed, self._is_multigraph)
+
+    def _adjacency_entries(self) -> AdjacencyEntries:
+        return ((node, neighbourhood.items()) for node, neighbourhood in self._adjacency_list.items())
+
+    @property
+    def adjacency_list(self) -> dict[Node, dict[Node, EdgeData]]:
+        """
+        Getter for the adjacency list of the snapshot. It is shared with the original graph, thus it must be treated as read-only.
+
+        Returns
+        -------
+        adjacency_list: dict[Node, dict[Node, EdgeData]]
+            Adjacency list representation of the snapshot.
+        """
+        return self._adjacency_list
+
+    @property
+    def adjacency_list_transposed(self) -> dict[Node, dict[Node, EdgeData]]:
+        if self._predecessors is not None:
+            return self._predecessors
+        return self._adjacency_list
+
+    def neighbors(self, node: Node) -> KeysView[Node]:
+        return self._adjacency_list.get(node, _EMPTY_NEIGHBOURHOOD).keys()
+
+    def in_neighbors(self, node: Node) -> KeysView[Node]:
+        return self.adjacency_list_transposed.get(node, _EMPTY_NEIGHBOURHOOD).keys()
+
+    def iter_out_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        return iter(self._adjacency_list.get(node, _EMPTY_NEIGHBOURHOOD).items())
+
+    def iter_in_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        return iter(self.adjacency_list_transposed.get(node, _EMPTY_NEIGHBOURHOOD).items())
+
+    def get_edge_data(self, source: Node, target: Node) -> EdgeData | NoEdge:
+        if source not in self._adjacency_list:
+            raise KeyError('Source node is not present in the graph.')
+        if target not in self._adjacency_list:
+            raise KeyError('Target node is not present in the graph.')
+        return self._adjacency_list[source].get(target, NoEdge())
+
+    def outdegree(self, node: Node) -> int:
+        return sum(edge_entry_size(data, self._is_multigraph) for data in self._adjacency_list.get(node, {}).values())
+
+    def indegree(self, node: Node) -> int:
+        return sum(edge_entry_size(data, self._is_multigraph) for data in self.adjacency_list_transposed.get(node, {}).values())
+
+    def subgraph_view(self, nodes: Iterable[Node]) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy read-only view of the subgraph induced by the given nodes in O(number of given nodes) time, without copying any edges.
+        The view can be used as an input of the traversal and shortest paths algorithms, which then only touch the nodes and edges of the subgraph.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes to restrict the view to, nodes not present in the snapshot are ignored.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view of the induced subgraph.
+        """
+        return GraphView(self, nodes)
+
+    def edge_filter_view(self, edge_filter: EdgeFilter) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy read-only view of the snapshot restricted to the edges passing the given predicate in O(1) time, without copying any edges.
+        The predicate is evaluated only for edges the view is queried for.
+
+        Parameters
+        ----------
+        edge_filter : EdgeFilter
+            Predicate called as edge_filter(source, target, edge data) deciding whether an edge is kept.
+            In case of a multigraph, it is called for every single edge. In case of an undirected graph, it should not depend on the order of the nodes.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view with filtered edges.
+        """
+        return GraphView(self, edge_filter=edge_filter)
@@ -11,6 +11,7 @@ def affects_adjacency_matrix(func: Callable) -> Callable:
     func : Callable
         The function to decorate.
         This decorator is used as an identifier of this function rendering the graph's adjacency matrix cache unusable.
+        Graphs with the incremental adjacency matrix enabled keep their matrix up to date instead, so nothing is invalidated for them.
 
     Returns
     -------
@@ -19,7 +20,8 @@ def affects_adjacency_matrix(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs) -> Any:
-        self._adjacency_matrix = []
-        self._adjacency_matrix_is_actual = False
+        if self._incremental_adjacency_matrix is None:
+            self._adjacency_matrix = []
+            self._adjacency_matrix_is_actual = False
         return func(self, *args, **kwargs)
     return wrapper
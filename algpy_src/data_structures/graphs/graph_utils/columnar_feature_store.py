@@ -0,0 +1,271 @@
+from typing import Any, Generic, Iterable, Optional, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from algpy_src.base.constants import Node
+from algpy_src.data_structures.graphs.graph_utils.no_feature_object import NoFeature
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ColumnarFeatureStore(Generic[Node]):
+    """
+    Columnar storage of node features: one NumPy array per feature (column), aligned by the row index of the nodes.
+    Nodes get a row when their features are set first, rows of removed nodes are filled by the last row, thus all rows stay contiguous.
+    Features of a node are a single value if the store has one column and a dict of column : value otherwise.
+    Features of a batch of nodes can be read and written in a vectorized way (see get_batch() and set_batch()).
+    """
+
+    def __init__(self, columns: Sequence[str] = ('feature',), dtype: DTypeLike = np.float64, initial_capacity: int = 16) -> None:
+        """
+        Constructor of the ColumnarFeatureStore class.
+
+        Parameters
+        ----------
+        columns : Sequence[str] (default ('feature',))
+            Names of the features, at least one.
+        dtype : DTypeLike (default np.float64)
+            Data type of all feature columns.
+        initial_capacity : int (default 16)
+            Number of rows allocated up front, the capacity is doubled whenever it is exceeded.
+        """
+        if len(columns) == 0:
+            raise ValueError('Feature store needs at least one column.')
+        if len(set(columns)) != len(columns):
+            raise ValueError('Feature column names have to be unique.')
+        self._columns: tuple[str, ...] = tuple(columns)
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._rows: dict[Node, int] = {}
+        self._nodes: list[Node] = []
+        self._values: dict[str, np.ndarray] = {column: np.zeros(max(initial_capacity, 1), dtype=self._dtype) for column in self._columns}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._rows
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """
+        Getter for the names of the feature columns.
+
+        Returns
+        -------
+        columns : tuple[str, ...]
+            Names of the features.
+        """
+        return self._columns
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Getter for the data type of the feature columns.
+
+        Returns
+        -------
+        dtype : np.dtype
+            Data type of all feature columns.
+        """
+        return self._dtype
+
+    @property
+    def nodes(self) -> list[Node]:
+        """
+        Getter for the nodes with features in the order of their rows. It must be treated as read-only.
+
+        Returns
+        -------
+        nodes : list[Node]
+            Node of row i stored at position i.
+        """
+        return self._nodes
+
+    def column(self, column: Optional[str] = None) -> np.ndarray:
+        """
+        Retrieve a read-only view of the values of one feature for all nodes (aligned with nodes) in O(1) time.
+        The view reflects later changes of the existing rows, but it is not valid anymore once rows are added or removed.
+
+        Parameters
+        ----------
+        column : Optional[str] (default None)
+            Name of the feature, may be omitted if the store has a single column.
+
+        Returns
+        -------
+        values : np.ndarray
+            Values of the feature, value of node nodes[i] at position i.
+        """
+        view = self._values[self._column_name(column)][:len(self._nodes)]
+        view.flags.writeable = False
+        return view
+
+    def rows_of(self, nodes: Iterable[Node]) -> np.ndarray:
+        """
+        Retrieve the rows of the given nodes.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes with features.
+
+        Returns
+        -------
+        rows : np.ndarray
+            Integer array of the rows of the nodes.
+        """
+        return np.fromiter((self._rows[node] for node in nodes), dtype=np.int64)
+
+    def get(self, node: Node) -> Any:
+        """
+        Retrieve the features of the given node in O(number of columns) time.
+
+        Parameters
+        ----------
+        node : Node
+            Node to retrieve the features for.
+
+        Returns
+        -------
+        features : Any
+            Feature value of the node if the store has a single column, dict of column : value otherwise, or NoFeature() if the node has no features.
+        """
+        row = self._rows.get(node)
+        if row is None:
+            return NoFeature()
+        if len(self._columns) == 1:
+            return _to_python(self._values[self._columns[0]][row])
+        return {column: _to_python(self._values[column][row]) for column in self._columns}
+
+    def set(self, node: Node, features: Any) -> None:
+        """
+        Set the features of the given node in amortized O(number of columns) time, adding a row for it if it has no features yet.
+
+        Parameters
+        ----------
+        node : Node
+            Node to set the features of.
+        features : Any
+            Feature value if the store has a single column, otherwise dict of column : value of (some of) the features.
+            Features which are not given are zero for a new row and keep their values for an existing one.
+        """
+        row = self._row_of(node)
+        if len(self._columns) == 1:
+            self._values[self._columns[0]][row] = features
+            return
+        for column, value in features.items():
+            self._values[self._column_name(column)][row] = value
+
+    def get_batch(self, nodes: Iterable[Node], column: Optional[str] = None) -> np.ndarray:
+        """
+        Retrieve the values of one feature for a batch of nodes in a single vectorized lookup.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes with features.
+        column : Optional[str] (default None)
+            Name of the feature, may be omitted if the store has a single column.
+
+        Returns
+        -------
+        values : np.ndarray
+            Values of the feature in the order of the given nodes (a copy).
+        """
+        return self._values[self._column_name(column)][self.rows_of(nodes)]
+
+    def set_batch(self, nodes: Iterable[Node], values: Any, column: Optional[str] = None) -> None:
+        """
+        Set the values of one feature for a batch of nodes in a single vectorized assignment, adding rows for nodes without features.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes to set the feature of.
+        values : Any
+            Values of the feature in the order of the given nodes (an array or sequence) or a single value for all of them.
+            Other features of newly added rows are zero.
+        column : Optional[str] (default None)
+            Name of the feature, may be omitted if the store has a single column.
+        """
+        column = self._column_name(column)
+        rows = np.fromiter((self._row_of(node) for node in nodes), dtype=np.int64)
+        # the column is looked up only now as adding rows may reallocate it
+        self._values[column][rows] = values
+
+    def remove(self, node: Node) -> None:
+        """
+        Remove the features of the given node in O(number of columns) time by moving the last row into its row.
+        Nothing changes if the node has no features.
+
+        Parameters
+        ----------
+        node : Node
+            Node to remove the features of.
+        """
+        row = self._rows.pop(node, None)
+        if row is None:
+            return
+        last_node = self._nodes.pop()
+        last_row = len(self._nodes)
+        if row != last_row:
+            for values in self._values.values():
+                values[row] = values[last_row]
+            self._nodes[row] = last_node
+            self._rows[last_node] = row
+        for values in self._values.values():
+            values[last_row] = 0
+
+    def to_dict(self) -> dict[Node, Any]:
+        """
+        Materialize the features of all nodes in O(number of nodes * number of columns) time.
+
+        Returns
+        -------
+        features : dict[Node, Any]
+            Dict of node : features, with features as returned by get().
+        """
+        if len(self._columns) == 1:
+            return dict(zip(self._nodes, self.column().tolist()))
+        column_lists = [self.column(column).tolist() for column in self._columns]
+        return {node: dict(zip(self._columns, row_values)) for node, *row_values in zip(self._nodes, *column_lists)}
+
+    def _column_name(self, column: Optional[str]) -> str:
+        if column is None:
+            if len(self._columns) > 1:
+                raise ValueError(f'Feature column has to be given for a store with columns {self._columns}.')
+            return self._columns[0]
+        if column not in self._values:
+            raise KeyError(f'Unknown feature column {column}.')
+        return column
+
+    def _row_of(self, node: Node) -> int:
+        """
+        Return the row of the given node, appending a (zero-filled) row for it if it has no features yet.
+
+        Parameters
+        ----------
+        node : Node
+            Node to find the row of.
+
+        Returns
+        -------
+        row : int
+            Row of the node.
+        """
+        row = self._rows.get(node)
+        if row is not None:
+            return row
+        row = len(self._nodes)
+        capacity = len(self._values[self._columns[0]])
+        if row == capacity:
+            for column in self._columns:
+                grown = np.zeros(2 * capacity, dtype=self._dtype)
+                grown[:capacity] = self._values[column]
+                self._values[column] = grown
+        self._rows[node] = row
+        self._nodes.append(node)
+        return row
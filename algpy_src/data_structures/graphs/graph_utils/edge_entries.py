@@ -0,0 +1,133 @@
+from typing import Any, Iterable
+
+from algpy_src.base.constants import Edge
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+
+# adjacency given as (node, iterable of (neighbour, adjacency list entry) pairs) pairs, e.g., built from adjacency_list.items() or iter_out_edges()
+AdjacencyEntries = Iterable[tuple[Any, Iterable[tuple[Any, Any]]]]
+
+
+def edge_entry_size(data: Any, is_multigraph: bool) -> int:
+    """
+    Find the number of edges represented by one adjacency list entry.
+
+    Parameters
+    ----------
+    data : Any
+        Adjacency list entry, i.e., edge data, set of edge data or dict of key : edge data (the latter two in case of a multigraph), or NoEdge().
+    is_multigraph : bool
+        Whether the entry belongs to a multigraph.
+
+    Returns
+    -------
+    entry_size : int
+        Number of (parallel) edges of the entry, 0 for NoEdge().
+    """
+    if isinstance(data, NoEdge):
+        return 0
+    if isinstance(data, set) or is_multigraph and isinstance(data, dict):
+        return len(data)
+    return 1
+
+
+def single_edges_data(data: Any, is_multigraph: bool) -> Iterable[Any]:
+    """
+    Iterate over data of each edge represented by one adjacency list entry.
+
+    Parameters
+    ----------
+    data : Any
+        Adjacency list entry, i.e., edge data, set of edge data or dict of key : edge data (the latter two in case of a multigraph).
+    is_multigraph : bool
+        Whether the entry belongs to a multigraph.
+
+    Returns
+    -------
+    single_edges_data : Iterable[Any]
+        Data of each of the (parallel) edges of the entry.
+    """
+    if isinstance(data, set):
+        return data
+    if is_multigraph and isinstance(data, dict):
+        return data.values()
+    return (data,)
+
+
+def count_edge_entries(adjacency: AdjacencyEntries, is_multigraph: bool) -> tuple[int, int]:
+    """
+    Count the edges stored in the given adjacency entries and the self-loops among them in O(V + E) time.
+
+    Parameters
+    ----------
+    adjacency : AdjacencyEntries
+        Pairs of node and its (neighbour, adjacency list entry) pairs.
+    is_multigraph : bool
+        Whether the adjacency belongs to a multigraph.
+
+    Returns
+    -------
+    counts : tuple[int, int]
+        Number of edges over all entries and number of self-loop edges among them.
+    """
+    number_of_entries, number_of_self_loop_entries = 0, 0
+    for node, out_entries in adjacency:
+        for neighbour, data in out_entries:
+            entry_size = edge_entry_size(data, is_multigraph)
+            number_of_entries += entry_size
+            if node == neighbour:
+                number_of_self_loop_entries += entry_size
+    return number_of_entries, number_of_self_loop_entries
+
+
+def number_of_edges_from_counts(number_of_entries: int, number_of_self_loop_entries: int, is_directed: bool) -> int:
+    """
+    Compute the number of edges of a graph from the counts of its edge entries (see count_edge_entries()).
+    Undirected graphs store each edge in both directions except for self-loops, which are stored once.
+
+    Parameters
+    ----------
+    number_of_entries : int
+        Number of edges over all adjacency list entries.
+    number_of_self_loop_entries : int
+        Number of self-loop edges among them.
+    is_directed : bool
+        Whether the graph is directed.
+
+    Returns
+    -------
+    number_of_edges : int
+        Number of edges with each undirected edge counted once.
+    """
+    if is_directed:
+        return number_of_entries
+    return (number_of_entries + number_of_self_loop_entries) // 2
+
+
+def collect_edges(adjacency: AdjacencyEntries, is_directed: bool, is_multigraph: bool) -> set[Edge]:
+    """
+    Collect the edges stored in the given adjacency entries in O(V + E) time.
+    Only one direction of each edge of an undirected graph is collected.
+
+    Parameters
+    ----------
+    adjacency : AdjacencyEntries
+        Pairs of node and its (neighbour, adjacency list entry) pairs.
+    is_directed : bool
+        Whether the adjacency belongs to a directed graph.
+    is_multigraph : bool
+        Whether the adjacency belongs to a multigraph.
+
+    Returns
+    -------
+    edges : set[Edge]
+        Edges as tuples of (source node, destination node, edge data).
+    """
+    edges: set[Edge] = set()
+    visited_nodes: set[Any] = set()
+    for node, out_entries in adjacency:
+        for neighbour, data in out_entries:
+            if not is_directed and neighbour in visited_nodes:
+                continue
+            edges.update((node, neighbour, single_edge_data) for single_edge_data in single_edges_data(data, is_multigraph))
+        visited_nodes.add(node)
+    return edges
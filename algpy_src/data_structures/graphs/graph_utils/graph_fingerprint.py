@@ -0,0 +1,124 @@
+from typing import Any, Iterable, Optional
+
+# fingerprints are sums of node and edge tokens modulo 2 ** 64, thus they can be updated by adding and subtracting tokens in any order
+FINGERPRINT_MASK = (1 << 64) - 1
+
+
+def data_hash(data: Any) -> int:
+    """
+    Hash edge data consistently with their equality, including unhashable containers (dicts, sets and lists) of hashable objects.
+    Other unhashable data are hashed to 0, i.e., they are not distinguished by the fingerprint.
+
+    Parameters
+    ----------
+    data : Any
+        Edge data to hash.
+
+    Returns
+    -------
+    data_hash : int
+        Hash of the data, equal for equal data.
+    """
+    try:
+        return hash(data)
+    except TypeError:
+        pass
+    if isinstance(data, dict):
+        return sum(hash((key, data_hash(value))) for key, value in data.items()) & FINGERPRINT_MASK
+    if isinstance(data, set):
+        return hash(frozenset(data))
+    if isinstance(data, (list, tuple)):
+        return hash(tuple(data_hash(item) for item in data))
+    return 0
+
+
+def node_token(node: Any) -> int:
+    """
+    Compute the contribution of a node to the fingerprint of a graph.
+
+    Parameters
+    ----------
+    node : Any
+        Node of the graph.
+
+    Returns
+    -------
+    token : int
+        Token of the node.
+    """
+    return hash((node,))
+
+
+def single_edge_token(source: Any, target: Any, data: Any, key: Optional[Any] = None) -> int:
+    """
+    Compute the contribution of a single edge to the fingerprint of a graph.
+
+    Parameters
+    ----------
+    source : Any
+        Source node of the edge.
+    target : Any
+        Target node of the edge.
+    data : Any
+        Data of the edge.
+    key : Optional[Any] (default None)
+        Key of the edge if it is stored in a dict of key : edge data entry of a multigraph.
+
+    Returns
+    -------
+    token : int
+        Token of the edge.
+    """
+    if key is None:
+        return hash((source, target, data_hash(data)))
+    return hash((source, target, key, data_hash(data)))
+
+
+def edge_entry_token(source: Any, target: Any, data: Any) -> int:
+    """
+    Compute the contribution of one adjacency list entry to the fingerprint of a graph, i.e., the sum of tokens of all the edges it represents.
+    Sets and dicts are treated as multiedge entries regardless of the type of the graph, so that equal entries always get equal tokens.
+
+    Parameters
+    ----------
+    source : Any
+        Source node of the entry.
+    target : Any
+        Target node of the entry.
+    data : Any
+        Adjacency list entry, i.e., edge data, set of edge data or dict of key : edge data.
+
+    Returns
+    -------
+    token : int
+        Token of the entry.
+    """
+    if isinstance(data, (set, frozenset)):
+        return sum(single_edge_token(source, target, single_edge_data) for single_edge_data in data)
+    if isinstance(data, dict):
+        return sum(single_edge_token(source, target, single_edge_data, key) for key, single_edge_data in data.items())
+    return single_edge_token(source, target, data)
+
+
+def graph_fingerprint(adjacency: Iterable[tuple[Any, Iterable[tuple[Any, Any]]]]) -> int:
+    """
+    Compute the structural fingerprint of a graph from scratch in O(V + E) time.
+    It is independent of the order of nodes and edges and equal for graphs with equal nodes and adjacency list entries
+    (different graphs collide only with a negligible probability), but it depends on the hash seed of the Python process.
+
+    Parameters
+    ----------
+    adjacency : Iterable[tuple[Any, Iterable[tuple[Any, Any]]]]
+        Pairs of node and its (neighbour, adjacency list entry) pairs.
+
+    Returns
+    -------
+    fingerprint : int
+        Fingerprint of the graph, a non-negative integer below 2 ** 64.
+    """
+    fingerprint = 0
+    for node, out_entries in adjacency:
+        fingerprint += node_token(node)
+        for neighbour, data in out_entries:
+            fingerprint += edge_entry_token(node, neighbour, data)
+    return fingerprint & FINGERPRINT_MASK
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Optional
+
+
+class GraphChangeKind(StrEnum):
+
+    NODE_ADDED = 'node added'
+    NODE_REMOVED = 'node removed'
+    EDGE_ADDED = 'edge added'
+    EDGE_REMOVED = 'edge removed'
+    EDGE_DATA_CHANGED = 'edge data changed'
+
+
+@dataclass(frozen=True)
+class GraphDelta:
+    """
+    Single recorded change of a graph.
+    Node changes only use the source field (the changed node), edge changes describe one (directed) adjacency list entry.
+    In case of a multigraph, every single edge is recorded separately (with its key in case of a keyed multigraph).
+    """
+    version: int
+    kind: GraphChangeKind
+    source: Any
+    target: Any = None
+    data: Any = None
+    previous_data: Any = None
+    key: Optional[int] = None
+
+
+class GraphJournal:
+    """
+    Append-only journal of changes of a graph, see BaseGraph.enable_journal().
+    Each recorded change increments the version of the journal by one, thus the changes since any retained version can be retrieved by slicing in O(number of changes) time.
+    Optionally, only a bounded number of latest changes is retained, so that the journal does not grow with the whole history of the graph.
+    """
+
+    def __init__(self, max_deltas: Optional[int] = None) -> None:
+        """
+        Constructor of the GraphJournal class.
+
+        Parameters
+        ----------
+        max_deltas : Optional[int] (default None)
+            Minimum number of latest changes to retain. Older changes are discarded in batches (keeping at most twice as many changes),
+            so that discarding costs amortized O(1) per change. If not given, all changes are retained.
+        """
+        if max_deltas is not None and max_deltas <= 0:
+            raise ValueError('Maximum number of retained deltas has to be positive.')
+        self._max_deltas: Optional[int] = max_deltas
+        self._deltas: list[GraphDelta] = []
+        self._version: int = 0
+        self._oldest_version: int = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Retrieve the current version, i.e., the total number of changes recorded since the journal was created.
+
+        Returns
+        -------
+        version : int
+            Current version.
+        """
+        return self._version
+
+    @property
+    def oldest_version(self) -> int:
+        """
+        Retrieve the oldest version whose following changes are all retained.
+
+        Returns
+        -------
+        oldest_version : int
+            Oldest version deltas_since() can be called with.
+        """
+        return self._oldest_version
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def record(self, kind: GraphChangeKind, source: Any, target: Any = None, data: Any = None, previous_data: Any = None, key: Optional[int] = None) -> None:
+        """
+        Record a change of the graph under a new version.
+
+        Parameters
+        ----------
+        kind : GraphChangeKind
+            Kind of the change.
+        source : Any
+            Changed node or source node of the changed edge.
+        target : Any (default None)
+            Target node of the changed edge.
+        data : Any (default None)
+            New data of the changed edge (or data of the removed edge).
+        previous_data : Any (default None)
+            Data of the edge before the change in case of an edge data change.
+        key : Optional[int] (default None)
+            Key of the changed edge in case of a keyed multigraph.
+        """
+        self._version += 1
+        self._deltas.append(GraphDelta(self._version, kind, source, target, data, previous_data, key))
+        if self._max_deltas is not None and len(self._deltas) >= 2 * self._max_deltas:
+            del self._deltas[:len(self._deltas) - self._max_deltas]
+            self._oldest_version = self._deltas[0].version - 1
+
+    def deltas_since(self, version: int) -> list[GraphDelta]:
+        """
+        Retrieve all changes recorded after the given version, in the order they were made.
+
+        Parameters
+        ----------
+        version : int
+            Version after which to retrieve the changes, e.g., the version at which a consumer last synchronized with the graph.
+
+        Returns
+        -------
+        deltas : list[GraphDelta]
+            Changes with versions greater than the given version.
+        """
+        if version > self._version:
+            raise ValueError(f'Version {version} is newer than the current version {self._version}.')
+        if version < self._oldest_version:
+            raise ValueError(f'Changes since version {version} are no longer retained, the oldest retained version is {self._oldest_version}.')
+        return self._deltas[version - self._oldest_version:]
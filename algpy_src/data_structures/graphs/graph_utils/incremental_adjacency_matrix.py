@@ -0,0 +1,128 @@
+from typing import Generic, Any, Optional
+
+import numpy as np
+
+from algpy_src.base.constants import Node
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+
+
+class IncrementalAdjacencyMatrix(Generic[Node]):
+    """
+    NumPy-backed adjacency matrix which is updated in place on each change of the graph instead of being rebuilt.
+    Row and column i correspond to the i-th node in the order of being added to the graph, missing edges are represented by a single shared NoEdge() object.
+    The underlying array is over-allocated and its capacity is doubled once it is exhausted so that adding a node costs amortized O(V) time.
+    The list of lists representation (see to_list()) is converted at most once between two changes and cached until the next change.
+    """
+
+    def __init__(self, adjacency_list: dict[Node, dict[Node, Any]], initial_capacity: int = 16) -> None:
+        """
+        Constructor of the IncrementalAdjacencyMatrix class.
+
+        Parameters
+        ----------
+        adjacency_list : dict[Node, dict[Node, Any]]
+            Adjacency list of the graph at the time of enabling the incremental adjacency matrix.
+        initial_capacity : int (default 16)
+            Minimal number of nodes the underlying array is allocated for.
+        """
+        self._no_edge: NoEdge = NoEdge()
+        self._node_index: dict[Node, int] = {}
+        self._list_cache: Optional[list[list[Any]]] = None
+        capacity = max(initial_capacity, len(adjacency_list))
+        self._matrix: np.ndarray = np.full((capacity, capacity), self._no_edge, dtype=object)
+        for node in adjacency_list:
+            self.add_node(node)
+        for node, neighbourhood in adjacency_list.items():
+            for neighbour, edge_data in neighbourhood.items():
+                self.set_entry(node, neighbour, edge_data)
+
+    @property
+    def capacity(self) -> int:
+        return self._matrix.shape[0]
+
+    @property
+    def node_index(self) -> dict[Node, int]:
+        """
+        Getter for the mapping of nodes to their row (and column) index in the matrix.
+
+        Returns
+        -------
+        node_index : dict[Node, int]
+            Mapping of node : index pairs.
+        """
+        return self._node_index
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Getter for the current adjacency matrix.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            View of the used part of the underlying array of shape (number of nodes, number of nodes).
+        """
+        n_nodes = len(self._node_index)
+        return self._matrix[:n_nodes, :n_nodes]
+
+    def add_node(self, node: Node) -> None:
+        """
+        Add a row and a column for a new node, doubling the capacity of the underlying array if needed.
+
+        Parameters
+        ----------
+        node : Node
+            Node to add. Nothing changes if the node already has an index.
+        """
+        if node in self._node_index:
+            return
+        self._list_cache = None
+        n_nodes = len(self._node_index)
+        if n_nodes == self.capacity:
+            grown_matrix = np.full((2 * self.capacity, 2 * self.capacity), self._no_edge, dtype=object)
+            grown_matrix[:n_nodes, :n_nodes] = self._matrix
+            self._matrix = grown_matrix
+        self._node_index[node] = n_nodes
+
+    def remove_node(self, node: Node) -> None:
+        """
+        Remove the row and the column of the given node, shifting the following rows and columns by one to keep the node order.
+
+        Parameters
+        ----------
+        node : Node
+            Node to remove. Nothing changes if the node does not have an index.
+        """
+        index = self._node_index.pop(node, None)
+        if index is None:
+            return
+        self._list_cache = None
+        n_nodes = len(self._node_index) + 1
+        self._matrix[index:n_nodes - 1, :n_nodes] = self._matrix[index + 1:n_nodes, :n_nodes]
+        self._matrix[:n_nodes - 1, index:n_nodes - 1] = self._matrix[:n_nodes - 1, index + 1:n_nodes]
+        self._matrix[n_nodes - 1, :n_nodes] = self._no_edge
+        self._matrix[:n_nodes, n_nodes - 1] = self._no_edge
+        for other_node, other_index in self._node_index.items():
+            if other_index > index:
+                self._node_index[other_node] = other_index - 1
+
+    def set_entry(self, source: Node, target: Node, edge_data: Any) -> None:
+        self._list_cache = None
+        self._matrix[self._node_index[source], self._node_index[target]] = edge_data
+
+    def delete_entry(self, source: Node, target: Node) -> None:
+        self._list_cache = None
+        self._matrix[self._node_index[source], self._node_index[target]] = self._no_edge
+
+    def to_list(self) -> list[list[Any]]:
+        """
+        Convert the matrix to a list of lists in O(V^2) time on the first call after a change, later calls return the cached conversion in O(1) time.
+
+        Returns
+        -------
+        matrix_list : list[list[Any]]
+            Adjacency matrix as a list of rows, which must be treated as read-only.
+        """
+        if self._list_cache is None:
+            self._list_cache = self.matrix.tolist()
+        return self._list_cache
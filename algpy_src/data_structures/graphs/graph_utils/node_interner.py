@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Iterator
+
+from algpy_src.base.constants import Node
+
+
+class NodeInterner(Generic[Node]):
+    """
+    Two-way mapping between nodes (arbitrary hashable objects) and dense integer ids 0, 1, ..., n - 1 assigned in the order of interning.
+    Algorithms may translate nodes to ids once, work on int-indexed lists or NumPy arrays internally (without hashing and comparing user objects)
+    and translate the ids back to nodes only at the boundary of their results.
+    """
+
+    def __init__(self, nodes: Iterable[Node] = ()) -> None:
+        """
+        Constructor of the NodeInterner class.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node] (default ())
+            Nodes to intern in the given order. Repeated nodes keep the id of their first occurrence.
+        """
+        self._nodes: list[Node] = []
+        self._ids: dict[Node, int] = {}
+        for node in nodes:
+            self.intern(node)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._ids
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._nodes)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, NodeInterner) and self._nodes == other._nodes
+
+    @property
+    def nodes(self) -> list[Node]:
+        """
+        Getter for the node table, i.e., node with id i is stored at position i. It must be treated as read-only.
+
+        Returns
+        -------
+        nodes : list[Node]
+            Interned nodes in the order of their ids.
+        """
+        return self._nodes
+
+    @property
+    def ids(self) -> dict[Node, int]:
+        """
+        Getter for the mapping of nodes to their ids. It must be treated as read-only.
+
+        Returns
+        -------
+        ids : dict[Node, int]
+            Ids of the interned nodes.
+        """
+        return self._ids
+
+    def intern(self, node: Node) -> int:
+        """
+        Return the id of the given node, assigning the next free id to it if it has not been interned yet.
+
+        Parameters
+        ----------
+        node : Node
+            Node to intern.
+
+        Returns
+        -------
+        node_id : int
+            Id of the node.
+        """
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._ids[node] = node_id
+            self._nodes.append(node)
+        return node_id
+
+    def id_of(self, node: Node) -> int:
+        """
+        Return the id of an interned node.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose id to find.
+
+        Returns
+        -------
+        node_id : int
+            Id of the node.
+        """
+        if node not in self._ids:
+            raise KeyError('Node is not present in the graph.')
+        return self._ids[node]
+
+    def node_of(self, node_id: int) -> Node:
+        """
+        Return the node with the given id.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        node : Node
+            Node with the given id.
+        """
+        if not 0 <= node_id < len(self._nodes):
+            raise KeyError(f'There is no node with id {node_id}.')
+        return self._nodes[node_id]
+
+    def ids_of(self, nodes: Iterable[Node]) -> list[int]:
+        return [self.id_of(node) for node in nodes]
+
+    def nodes_of(self, node_ids: Iterable[int]) -> list[Node]:
+        return [self.node_of(node_id) for node_id in node_ids]
+
+    def copy(self) -> NodeInterner[Node]:
+        interner: NodeInterner[Node] = NodeInterner()
+        interner._nodes = list(self._nodes)
+        interner._ids = dict(self._ids)
+        return interner
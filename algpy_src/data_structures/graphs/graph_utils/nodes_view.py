@@ -0,0 +1,52 @@
+from collections.abc import Collection, Iterator, Mapping, Sequence, Set
+from typing import Any, Generic
+
+from algpy_src.base.constants import Node
+
+
+class NodesView(Collection[Node], Generic[Node]):
+    """
+    Lightweight read-only view of the nodes of a graph, backed by the keys of a dictionary indexed by nodes.
+    Creating the view costs O(1), membership checks are O(1) dictionary lookups and iteration follows the order of nodes being added to the graph.
+    The view reflects all further changes to the graph, thus the graph should not be changed while iterating over it.
+    """
+
+    def __init__(self, node_mapping: Mapping[Node, Any]) -> None:
+        """
+        Constructor of the NodesView class.
+
+        Parameters
+        ----------
+        node_mapping : Mapping[Node, Any]
+            Mapping whose keys are the nodes of the graph (e.g., its adjacency list).
+        """
+        self._node_mapping = node_mapping
+
+    def __contains__(self, node: object) -> bool:
+        try:
+            return node in self._node_mapping
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._node_mapping)
+
+    def __reversed__(self) -> Iterator[Node]:
+        return reversed(list(self._node_mapping))
+
+    def __len__(self) -> int:
+        return len(self._node_mapping)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the view with another collection of nodes.
+        Node order matters for comparison with other views and sequences (as nodes used to be represented by a list), but not for comparison with sets.
+        """
+        if isinstance(other, NodesView | Sequence):
+            return list(self) == list(other)
+        if isinstance(other, Set):
+            return set(self) == set(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self._node_mapping))
@@ -0,0 +1,82 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    Lock allowing either any number of concurrent readers or a single writer.
+    Writers are preferred, i.e., once a writer waits for the lock, no new readers are admitted, so that a steady stream of readers cannot starve writers.
+    The lock is not reentrant: a thread holding it must not acquire it again (not even for reading), otherwise it may deadlock.
+    """
+
+    def __init__(self) -> None:
+        self._condition: threading.Condition = threading.Condition(threading.Lock())
+        self._active_readers: int = 0
+        self._waiting_writers: int = 0
+        self._writer_active: bool = False
+
+    @property
+    def waiting_writers(self) -> int:
+        """
+        Retrieve the number of writers currently waiting for the lock.
+
+        Returns
+        -------
+        waiting_writers : int
+            Number of threads blocked in acquire_write().
+        """
+        return self._waiting_writers
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            while self._writer_active or self._waiting_writers > 0:
+                self._condition.wait()
+            self._active_readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            if self._active_readers == 0:
+                raise RuntimeError('Cannot release a read lock which is not held.')
+            self._active_readers -= 1
+            if self._active_readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer_active or self._active_readers > 0:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer_active = True
+
+    def release_write(self) -> None:
+        with self._condition:
+            if not self._writer_active:
+                raise RuntimeError('Cannot release a write lock which is not held.')
+            self._writer_active = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """
+        Context manager holding the lock for reading (shared with other readers) for the duration of the with block.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """
+        Context manager holding the lock for writing (exclusively) for the duration of the with block.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Iterable, Iterator, KeysView, Optional, Protocol
+
+from algpy_src.base.constants import Node, EdgeData, Edge
+from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.graph_utils.edge_entries import AdjacencyEntries, collect_edges, count_edge_entries, edge_entry_size, number_of_edges_from_counts
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+EdgeFilter = Callable[[Any, Any, Any], bool]
+
+
+class ViewableGraph(Protocol):
+    """
+    Read interface of a graph which a GraphView can be taken of (BaseGraph, GraphSnapshot or another GraphView).
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def is_directed(self) -> bool: ...
+
+    @property
+    def is_multigraph(self) -> bool: ...
+
+    @property
+    def nodes(self) -> NodesView: ...
+
+    def has_node(self, node: Any) -> bool: ...
+
+    def iter_out_edges(self, node: Any) -> Iterator[tuple[Any, Any]]: ...
+
+    def iter_in_edges(self, node: Any) -> Iterator[tuple[Any, Any]]: ...
+
+    def get_edge_data(self, source: Any, target: Any) -> Any: ...
+
+
+class GraphView(DataStructure, Generic[Node, EdgeData]):
+    """
+    Lazy read-only view of a part of a graph, typically created by BaseGraph.subgraph_view() or BaseGraph.edge_filter_view().
+    The view restricts the graph to a selection of nodes (induced subgraph) and/or to edges passing a predicate without copying any adjacency structures.
+    Each query is answered by filtering the respective part of the underlying graph, thus it costs as much as the same query on the graph
+    and algorithms running on the view only touch the nodes and edges of the viewed region.
+    The node selection is fixed at creation of the view, while edge changes of the underlying graph are reflected by the view.
+    """
+
+    def __init__(self, graph: ViewableGraph, nodes: Optional[Iterable[Node]] = None, edge_filter: Optional[EdgeFilter] = None) -> None:
+        """
+        Constructor of the GraphView class.
+        Typically, it is not called directly but through BaseGraph.subgraph_view() or BaseGraph.edge_filter_view().
+
+        Parameters
+        ----------
+        graph : ViewableGraph
+            Graph to take the view of.
+        nodes : Optional[Iterable[Node]] (default None)
+            Nodes to restrict the view to, nodes not present in the graph are ignored. If not given, all nodes of the graph are kept.
+        edge_filter : Optional[EdgeFilter] (default None)
+            Predicate called as edge_filter(source, target, edge data) deciding whether an edge is kept. If not given, all edges between kept nodes are kept.
+            In case of a multigraph, it is called for every single edge. In case of an undirected graph, it should not depend on the order of the nodes.
+        """
+        super().__init__()
+        self._graph: ViewableGraph = graph
+        self._nodes: Optional[dict[Node, None]] = None
+        if nodes is not None:
+            self._nodes = {node: None for node in nodes if graph.has_node(node)}
+        self._edge_filter: Optional[EdgeFilter] = edge_filter
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, GraphView) and self.nodes == other.nodes and self.adjacency_list == other.adjacency_list
+
+    @property
+    def name(self) -> str:
+        return f'{self._graph.name} View'
+
+    @property
+    def space_complexity(self) -> str:
+        return 'V'
+
+    @property
+    def is_directed(self) -> bool:
+        return self._graph.is_directed
+
+    @property
+    def is_multigraph(self) -> bool:
+        return self._graph.is_multigraph
+
+    @property
+    def nodes(self) -> NodesView[Node]:
+        if self._nodes is None:
+            return self._graph.nodes
+        return NodesView(self._nodes)
+
+    def has_node(self, node: Node) -> bool:
+        if self._nodes is None:
+            return self._graph.has_node(node)
+        return node in self._nodes
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def number_of_edges(self) -> int:
+        """
+        Retrieve the number of edges of the view, counted in O(V + E) time of the viewed region.
+        In case of an undirected graph, each edge is counted only once despite being internally represented as a directed graph.
+
+        Returns
+        -------
+        number_of_edges : int
+            Number of edges of the view.
+        """
+        number_of_entries, number_of_self_loop_entries = count_edge_entries(self._adjacency_entries(), self.is_multigraph)
+        return number_of_edges_from_counts(number_of_entries, number_of_self_loop_entries, self.is_directed)
+
+    @property
+    def edges(self) -> set[Edge]:
+        """
+        Retrieve the edges of the view, built in O(V + E) time of the viewed region.
+        Only one direction of each edge of an undirected graph is retrieved.
+
+        Returns
+        -------
+        edges : set[Edge]
+            Edges of the view as tuples of (source node, destination node, edge data).
+        """
+        return collect_edges(self._adjacency_entries(), self.is_directed, self.is_multigraph)
+
+    def _adjacency_entries(self) -> AdjacencyEntries:
+        return ((node, self.iter_out_edges(node)) for node in self.nodes)
+
+    def _filter_entry(self, source: Node, target: Node, data: Any) -> Any:
+        """
+        Restrict an adjacency list entry of the underlying graph to the edges passing the edge filter.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the entry.
+        target : Node
+            Target node of the entry.
+        data : Any
+            Edge data or the collection of edge data in case of a multigraph.
+
+        Returns
+        -------
+        filtered_data : Any
+            The entry itself if no filter is set, the filtered entry if some edges pass the filter, NoEdge() object otherwise.
+        """
+        if self._edge_filter is None:
+            return data
+        if not self.is_multigraph:
+            return data if self._edge_filter(source, target, data) else NoEdge()
+        if isinstance(data, dict):
+            filtered_dict = {key: single_edge_data for key, single_edge_data in data.items() if self._edge_filter(source, target, single_edge_data)}
+            return filtered_dict if filtered_dict else NoEdge()
+        if isinstance(data, set):
+            filtered_set = {single_edge_data for single_edge_data in data if self._edge_filter(source, target, single_edge_data)}
+            return filtered_set if filtered_set else NoEdge()
+        return data if self._edge_filter(source, target, data) else NoEdge()
+
+    def iter_out_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        """
+        Iterate over the outgoing edges of the given node which are part of the view, in O(outdegree) time of the node in the underlying graph.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose outgoing edges to iterate over.
+            If not present in the view, nothing is yielded.
+
+        Returns
+        -------
+        out_edges : Iterator[tuple[Node, EdgeData]]
+            Iterator of (neighbour, edge data) pairs.
+        """
+        if not self.has_node(node):
+            return
+        for neighbour, data in self._graph.iter_out_edges(node):
+            if self._nodes is not None and neighbour not in self._nodes:
+                continue
+            filtered_data = self._filter_entry(node, neighbour, data)
+            if not isinstance(filtered_data, NoEdge):
+                yield neighbour, filtered_data
+
+    def iter_in_edges(self, node: Node) -> Iterator[tuple[Node, EdgeData]]:
+        """
+        Iterate over the incoming edges of the given node which are part of the view, in O(indegree) time of the node in the underlying graph.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose incoming edges to iterate over.
+            If not present in the view, nothing is yielded.
+
+        Returns
+        -------
+        in_edges : Iterator[tuple[Node, EdgeData]]
+            Iterator of (predecessor, edge data) pairs.
+        """
+        if not self.has_node(node):
+            return
+        for predecessor, data in self._graph.iter_in_edges(node):
+            if self._nodes is not None and predecessor not in self._nodes:
+                continue
+            filtered_data = self._filter_entry(predecessor, node, data)
+            if not isinstance(filtered_data, NoEdge):
+                yield predecessor, filtered_data
+
+    def neighbors(self, node: Node) -> KeysView[Node]:
+        """
+        Return the adjacent nodes of a given node within the view, in the order of the underlying graph.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to find the neighbours.
+            If not present in the view, empty collection is returned.
+
+        Returns
+        -------
+        neighbours : KeysView[Node]
+            Adjacent nodes of the node.
+        """
+        return {neighbour: None for neighbour, _ in self.iter_out_edges(node)}.keys()
+
+    def in_neighbors(self, node: Node) -> KeysView[Node]:
+        return {predecessor: None for predecessor, _ in self.iter_in_edges(node)}.keys()
+
+    def get_edge_data(self, source: Node, target: Node) -> EdgeData | NoEdge:
+        if not self.has_node(source):
+            raise KeyError('Source node is not present in the graph.')
+        if not self.has_node(target):
+            raise KeyError('Target node is not present in the graph.')
+        data = self._graph.get_edge_data(source, target)
+        if isinstance(data, NoEdge):
+            return data
+        return self._filter_entry(source, target, data)
+
+    def outdegree(self, node: Node) -> int:
+        return sum(edge_entry_size(data, self.is_multigraph) for _, data in self.iter_out_edges(node))
+
+    def indegree(self, node: Node) -> int:
+        return sum(edge_entry_size(data, self.is_multigraph) for _, data in self.iter_in_edges(node))
+
+    @property
+    def adjacency_list(self) -> dict[Node, dict[Node, EdgeData]]:
+        """
+        Materialize the adjacency list of the view in O(V + E) time of the viewed region.
+
+        Returns
+        -------
+        adjacency_list: dict[Node, dict[Node, EdgeData]]
+            Adjacency list representation of the view, represented as a dict of node : neighbours pairs with
+            neighbours being a dict of neighbour : edge data.
+        """
+        return {node: dict(self.iter_out_edges(node)) for node in self.nodes}
+
+    @property
+    def adjacency_list_transposed(self) -> dict[Node, dict[Node, EdgeData]]:
+        return {node: dict(self.iter_in_edges(node)) for node in self.nodes}
+
+    def subgraph_view(self, nodes: Iterable[Node]) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy view of the subgraph of this view induced by the given nodes.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes to restrict the view to, nodes not present in this view are ignored.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view of the induced subgraph.
+        """
+        return GraphView(self, nodes)
+
+    def edge_filter_view(self, edge_filter: EdgeFilter) -> GraphView[Node, EdgeData]:
+        """
+        Create a lazy view of this view restricted to the edges passing the given predicate.
+
+        Parameters
+        ----------
+        edge_filter : EdgeFilter
+            Predicate called as edge_filter(source, target, edge data) deciding whether an edge is kept.
+
+        Returns
+        -------
+        view : GraphView[Node, EdgeData]
+            Read-only view with filtered edges.
+        """
+        return GraphView(self, edge_filter=edge_filter)
@@ -1,29 +1,76 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
-from algpy_src.base.constants import Node, Edge, MultiEdgeData
+from algpy_src.base.constants import Node, Edge, MultiEdgeData, KeyedMultiEdgeData
 from algpy_src.data_structures.graphs.base_graph import BaseGraph
 from algpy_src.data_structures.graphs.graph_utils.affects_adjacency_matrix import affects_adjacency_matrix
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
 
 
-class MultiDiGraph(BaseGraph[Node, MultiEdgeData]):
+class MultiDiGraph(BaseGraph[Node, MultiEdgeData | KeyedMultiEdgeData]):
     """
     Directed multigraph class.
     Adjacency list representation is assumed for simplicity.
+    By default, parallel edges between two nodes are represented by a set of their data, thus parallel edges with equal data collapse into one.
+    In the keyed mode, each parallel edge gets its own integer key instead and the entry is a dict of key : edge data.
     """
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, MultiEdgeData]]] = None) -> None:
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, Any]]] = None, store_edges: bool = True, keyed: bool = False) -> None:
         """
         Constructor of the MultiDiGraph class.
 
         Parameters
         ----------
-        adjacency_list : Optional[dict[Node, dict[Node, dict[Node, MultiEdgeData]]]] (default None)
+        adjacency_list : Optional[dict[Node, dict[Node, MultiEdgeData | KeyedMultiEdgeData]]] (default None)
             Optional adjacency list from which to build the graph.
+            In the keyed mode, entries may be either dicts of key : edge data or collections of edge data, which then get new keys.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
+            Keyed multigraphs are always memory-lean as a set of (source, target, data) tuples cannot hold parallel edges with equal data.
+        keyed : bool (default False)
+            Whether to store parallel edges under their own integer keys.
         """
-        super().__init__(adjacency_list)
+        self._keyed: bool = keyed
+        self._next_edge_key: int = 0
+        if keyed and adjacency_list is not None:
+            adjacency_list = self._to_keyed_adjacency_list(adjacency_list)
+        super().__init__(adjacency_list, store_edges and not keyed)
+
+    def _to_keyed_adjacency_list(self, adjacency_list: dict[Node, dict[Node, Any]]) -> dict[Node, dict[Node, KeyedMultiEdgeData]]:
+        """
+        Helper method to convert the given adjacency list to the keyed form, assigning new keys to edges which do not have any yet.
+
+        Parameters
+        ----------
+        adjacency_list : dict[Node, dict[Node, Any]]
+            Adjacency list with entries being either dicts of key : edge data or collections of edge data.
+
+        Returns
+        -------
+        keyed_adjacency_list : dict[Node, dict[Node, KeyedMultiEdgeData]]
+            Adjacency list with entries being dicts of key : edge data.
+        """
+        self._next_edge_key = 1 + max((key for neighbourhood in adjacency_list.values() for entry in neighbourhood.values() if isinstance(entry, dict)
+                                       for key in entry), default=-1)
+        keyed_adjacency_list: dict[Node, dict[Node, KeyedMultiEdgeData]] = {}
+        for node, neighbourhood in adjacency_list.items():
+            keyed_adjacency_list[node] = {}
+            for neighbour, entry in neighbourhood.items():
+                if isinstance(entry, dict):
+                    keyed_adjacency_list[node][neighbour] = dict(entry)
+                else:
+                    keyed_adjacency_list[node][neighbour] = {self._new_edge_key(): single_edge_data for single_edge_data in entry}
+        return keyed_adjacency_list
+
+    def _new_edge_key(self) -> int:
+        key = self._next_edge_key
+        self._next_edge_key += 1
+        return key
+
+    @property
+    def is_keyed(self) -> bool:
+        return self._keyed
 
     @property
     def name(self) -> str:
@@ -51,11 +98,76 @@ class MultiDiGraph(BaseGraph[Node, MultiEdgeData]):
         edge : Edge
             The edge to add represented as a tuple of (source node, destination node, edge data).
         """
+        if self._keyed:
+            self.add_edge_with_key(edge)
+            return
+        u, v, data = edge
+        self.add_nodes_from({u, v})
+        if v in self._adjacency_list[u]:
+            self._add_to_edge_entry(u, v, data)
+        else:
+            self._set_edge_entry(u, v, {data})
+        self._record_edge(edge)
+
+    def add_edge_with_key(self, edge: Edge) -> int:
+        """
+        Add a single edge to a keyed multigraph under a new key in O(1) time.
+        Parallel edges with equal data are kept as separate edges.
+
+        Parameters
+        ----------
+        edge : Edge
+            The edge to add represented as a tuple of (source node, destination node, edge data).
+
+        Returns
+        -------
+        key : int
+            Key of the added edge, unique within the graph.
+        """
+        key = self._new_edge_key()
+        self._insert_keyed_edge(edge, key)
+        return key
+
+    @affects_adjacency_matrix
+    def _insert_keyed_edge(self, edge: Edge, key: int) -> None:
+        """
+        Helper method to insert a single edge of a keyed multigraph under the given key.
+
+        Parameters
+        ----------
+        edge : Edge
+            The edge to add represented as a tuple of (source node, destination node, edge data).
+        key : int
+            Key of the edge.
+        """
+        if not self._keyed:
+            raise ValueError('Edges with keys can only be added to a keyed multigraph.')
         u, v, data = edge
         self.add_nodes_from({u, v})
-        current_data: MultiEdgeData = self._adjacency_list[u].get(v, set())
-        self._adjacency_list[u][v] = current_data.union({data})
-        self.edges.add(edge)
+        if v in self._adjacency_list[u]:
+            self._add_to_edge_entry(u, v, data, key)
+        else:
+            self._set_edge_entry(u, v, {key: data})
+
+    @affects_adjacency_matrix
+    def remove_edge_by_key(self, source: Node, target: Node, key: int) -> None:
+        """
+        Remove a single edge of a keyed multigraph by its key in O(1) time.
+        If such an edge is not present in the graph, it is silently ignored.
+
+        Parameters
+        ----------
+        source : Node
+            Source node of the edge to remove.
+        target : Node
+            Target node of the edge to remove.
+        key : int
+            Key of the edge to remove.
+        """
+        if not self._keyed:
+            raise ValueError('Edges can only be removed by their keys from a keyed multigraph.')
+        if source in self._adjacency_list and key in self._adjacency_list[source].get(target, {}):
+            self._remove_from_edge_entry(source, target, key=key)
 
     @affects_adjacency_matrix
     def remove_edge(self, source: Node, target: Node, *data: MultiEdgeData) -> None:
@@ -73,18 +185,48 @@ class MultiDiGraph(BaseGraph[Node, MultiEdgeData]):
             Data of the edge to be removed.
             If not given, all edges between the two nodes are removed.
             Otherwise, each corresponding data entry is removed from the multiedge between the two nodes.
+            In the keyed mode, one parallel edge is removed for each occurrence of the data.
         """
-        if source not in self.nodes or target not in self.nodes:
+        if source not in self._adjacency_list or target not in self._adjacency_list:
+            return
+        present_data: MultiEdgeData | KeyedMultiEdgeData | NoEdge = self._adjacency_list[source].get(target, NoEdge())
+        if isinstance(present_data, NoEdge):
             return
-        present_data: MultiEdgeData | NoEdge = self._adjacency_list[source].get(target, NoEdge())
-        if not isinstance(present_data, NoEdge):
-            if not data:
-                del self._adjacency_list[source][target]
-                for single_edge_data in present_data:
-                    self.edges.discard((source, target, single_edge_data))
-            else:
-                for single_edge_data in data:
-                    self.edges.discard((source, target, single_edge_data))
-                self._adjacency_list[source][target] -= set(data)
-                if self._adjacency_list[source][target] == set():
-                    del self._adjacency_list[source][target]
+        if isinstance(present_data, dict):
+            for key in self._find_edge_keys(present_data, data):
+                self.remove_edge_by_key(source, target, key)
+        elif not data:
+            self._delete_edge_entry(source, target)
+            for single_edge_data in present_data:
+                self._forget_edge((source, target, single_edge_data))
+        else:
+            for single_edge_data in data:
+                self._forget_edge((source, target, single_edge_data))
+                if single_edge_data in present_data:
+                    self._remove_from_edge_entry(source, target, single_edge_data)
+
+    @staticmethod
+    def _find_edge_keys(present_data: KeyedMultiEdgeData, data: tuple[Any, ...]) -> list[int]:
+        """
+        Helper method to find keys of the parallel edges to remove based on their data.
+
+        Parameters
+        ----------
+        present_data : KeyedMultiEdgeData
+            Keyed entry of the multiedge.
+        data : tuple[Any, ...]
+            Data of the edges to remove, one edge is removed for each occurrence. If empty, all edges are removed.
+
+        Returns
+        -------
+        keys : list[int]
+            Keys of the edges to remove.
+        """
+        if not data:
+            return list(present_data)
+        keys: list[int] = []
+        for single_edge_data in data:
+            key = next((key for key, edge_data in present_data.items() if edge_data == single_edge_data and key not in keys), None)
+            if key is not None:
+                keys.append(key)
+        return keys
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 from algpy_src.base.constants import Node, Edge, MultiEdgeData
 from algpy_src.data_structures.graphs.graph_utils.affects_adjacency_matrix import affects_adjacency_matrix
@@ -13,16 +13,21 @@ class MultiGraph(MultiDiGraph):
     Adjacency list representation is assumed for simplicity.
     """
 
-    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, MultiEdgeData]]] = None) -> None:
+    def __init__(self, adjacency_list: Optional[dict[Node, dict[Node, Any]]] = None, store_edges: bool = True, keyed: bool = False) -> None:
         """
         Constructor of the MultiGraph class.
 
         Parameters
         ----------
-        adjacency_list : Optional[dict[Node, dict[Node, dict[Node, MultiEdgeData]]]] (default None)
+        adjacency_list : Optional[dict[Node, dict[Node, MultiEdgeData | KeyedMultiEdgeData]]] (default None)
             Optional adjacency list from which to build the graph.
+            In the keyed mode, entries may be either dicts of key : edge data or collections of edge data, which then get new keys.
+        store_edges : bool (default True)
+            Whether to keep the set of edges materialized next to the adjacency list. If False, the graph is memory-lean (see BaseGraph).
+        keyed : bool (default False)
+            Whether to store parallel edges under their own integer keys. Both directions of an edge share the same key.
         """
-        super().__init__(adjacency_list)
+        super().__init__(adjacency_list, store_edges, keyed)
         super()._fill_to_undirected()
 
     @property
@@ -50,10 +55,50 @@ class MultiGraph(MultiDiGraph):
         edge : Edge
             The edge to add represented as a tuple of (nodeA, nodeB, edge data).
         """
+        if self._keyed:
+            self.add_edge_with_key(edge)
+            return
         u, v, data = edge
         super().add_edge(edge)
         super().add_edge((v, u, data))
-        self.edges.remove((v, u, data))
+        self._forget_edge((v, u, data))
+
+    def add_edge_with_key(self, edge: Edge) -> int:
+        """
+        Add a single edge to a keyed multigraph under a new key (shared by both directions of the edge) in O(1) time.
+
+        Parameters
+        ----------
+        edge : Edge
+            The edge to add represented as a tuple of (nodeA, nodeB, edge data).
+
+        Returns
+        -------
+        key : int
+            Key of the added edge, unique within the graph.
+        """
+        u, v, data = edge
+        key = super().add_edge_with_key(edge)
+        if u != v:
+            self._insert_keyed_edge((v, u, data), key)
+        return key
+
+    def remove_edge_by_key(self, source: Node, target: Node, key: int) -> None:
+        """
+        Remove a single edge of a keyed multigraph by its key (in both directions) in O(1) time.
+        If such an edge is not present in the graph, it is silently ignored.
+
+        Parameters
+        ----------
+        source : Node
+            One node of the edge to remove.
+        target : Node
+            The other node of the edge to remove.
+        key : int
+            Key of the edge to remove.
+        """
+        super().remove_edge_by_key(source, target, key)
+        super().remove_edge_by_key(target, source, key)
 
     @affects_adjacency_matrix
     def remove_edge(self, source: Node, target: Node, *data: MultiEdgeData) -> None:
@@ -73,4 +118,5 @@ class MultiGraph(MultiDiGraph):
             Otherwise, each corresponding data entry is removed from the multiedge between the two nodes.
         """
         super().remove_edge(source, target, *data)
-        super().remove_edge(target, source, *data)
+        if not self._keyed:
+            super().remove_edge(target, source, *data)
@@ -0,0 +1,277 @@
+from itertools import chain
+from typing import Any, Generic, cast
+
+from algpy_src.base.constants import Node
+from algpy_src.data_structures.graphs.flow_network import FlowNetwork, exact_flow_sum
+
+
+class ResidualNetwork(Generic[Node]):
+    """
+    Residual graph of a flow network with nodes numbered by the node interner of the network and edges stored in flat arrays
+    of lower bounds, flows and capacities (upper bounds), indexed by edge number.
+    Every edge e is paired with two residual arcs: the forward arc 2 * e, which can increase its flow up to the capacity,
+    and the backward arc 2 * e + 1, which can decrease its flow down to the lower bound.
+    Flows are changed in place in O(1) time per arc, the flow network itself is updated only by write_flows().
+    """
+
+    def __init__(self, flow_network: FlowNetwork[Node]) -> None:
+        """
+        Constructor of the ResidualNetwork class, building the residual graph in O(V + E) time.
+
+        Parameters
+        ----------
+        flow_network : FlowNetwork[Node]
+            Flow network to build the residual graph of. Unassigned flows (None) are taken as 0.
+        """
+        node_interner = flow_network.node_interner
+        self._nodes: list[Node] = list(node_interner.nodes)
+        node_ids = node_interner.ids
+        self._source_id: int = node_ids[flow_network.source]
+        self._sink_id: int = node_ids[flow_network.sink]
+
+        self._edge_tails: list[int] = []
+        self._edge_heads: list[int] = []
+        self._lower_bounds: list[int | float] = []
+        self._flows: list[int | float] = []
+        self._capacities: list[int | float] = []
+        self._initial_flows: list[int | float | None] = []
+        # forward arcs in the order of the adjacency list and backward arcs in the order of the transposed adjacency list of each node
+        self._forward_arcs: list[list[int]] = [[] for _ in self._nodes]
+        self._backward_arcs: list[list[int]] = [[] for _ in self._nodes]
+        self._forward_arcs_by_head: dict[int, list[int]] = {}
+
+        edge_numbers: dict[tuple[Node, Node], int] = {}
+        for node, out_neighbourhood in flow_network.adjacency_list.items():
+            node_id = node_ids[node]
+            for out_neighbour, flow_edge in out_neighbourhood.items():
+                edge_number = len(self._flows)
+                edge_numbers[(node, out_neighbour)] = edge_number
+                self._edge_tails.append(node_id)
+                self._edge_heads.append(node_ids[out_neighbour])
+                self._lower_bounds.append(flow_edge.lower_bound)
+                self._flows.append(flow_edge.flow if flow_edge.flow is not None else 0)
+                self._capacities.append(flow_edge.upper_bound)
+                self._initial_flows.append(flow_edge.flow)
+                self._forward_arcs[node_id].append(2 * edge_number)
+        for node, in_neighbourhood in flow_network.adjacency_list_transposed.items():
+            self._backward_arcs[node_ids[node]].extend(2 * edge_numbers[(in_neighbour, node)] + 1 for in_neighbour in in_neighbourhood)
+
+    @property
+    def nodes(self) -> list[Node]:
+        """
+        Getter for the nodes of the network, node with id i stored at position i.
+
+        Returns
+        -------
+        nodes : list[Node]
+            Nodes of the network ordered by their ids.
+        """
+        return self._nodes
+
+    @property
+    def source_id(self) -> int:
+        """
+        Getter for the id of the source of the flow.
+
+        Returns
+        -------
+        source_id : int
+            Id of the source node.
+        """
+        return self._source_id
+
+    @property
+    def sink_id(self) -> int:
+        """
+        Getter for the id of the sink of the flow.
+
+        Returns
+        -------
+        sink_id : int
+            Id of the sink node.
+        """
+        return self._sink_id
+
+    @property
+    def number_of_edges(self) -> int:
+        """
+        Getter for the number of edges of the flow network (half the number of residual arcs).
+
+        Returns
+        -------
+        number_of_edges : int
+            Number of edges.
+        """
+        return len(self._flows)
+
+    @property
+    def flows(self) -> list[int | float]:
+        """
+        Getter for the current flows of the edges, indexed by edge number. It must be treated as read-only.
+
+        Returns
+        -------
+        flows : list[int | float]
+            Flow of edge e stored at position e.
+        """
+        return self._flows
+
+    @property
+    def current_flow(self) -> int | float:
+        """
+        Getter for the value of the current flow, i.e., the absolute flow balance of the source, summed exactly from its edges in O(degree) time.
+
+        Returns
+        -------
+        current_flow : int | float
+            Value of the current flow.
+        """
+        out_flows = (self._flows[arc >> 1] for arc in self._forward_arcs[self._source_id])
+        in_flows = (-self._flows[arc >> 1] for arc in self._backward_arcs[self._source_id])
+        return abs(exact_flow_sum(chain(out_flows, in_flows)))
+
+    def forward_arcs(self, node_id: int) -> list[int]:
+        """
+        Retrieve the forward arcs of the out-edges of the given node, in the order of its adjacency list.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        forward_arcs : list[int]
+            Forward arcs leaving the node.
+        """
+        return self._forward_arcs[node_id]
+
+    def forward_arcs_by_head(self, node_id: int) -> list[int]:
+        """
+        Retrieve the forward arcs of the out-edges of the given node sorted by their head nodes.
+        The order is computed on the first request for the node and then cached.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        forward_arcs : list[int]
+            Forward arcs leaving the node in ascending order of their head nodes.
+        """
+        sorted_arcs = self._forward_arcs_by_head.get(node_id)
+        if sorted_arcs is None:
+            sorted_arcs = sorted(self._forward_arcs[node_id], key=lambda arc: cast(Any, self._nodes[self._edge_heads[arc >> 1]]))
+            self._forward_arcs_by_head[node_id] = sorted_arcs
+        return sorted_arcs
+
+    def backward_arcs(self, node_id: int) -> list[int]:
+        """
+        Retrieve the backward arcs of the in-edges of the given node, in the order of its transposed adjacency list.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        backward_arcs : list[int]
+            Backward arcs leaving the node (i.e., running against its in-edges).
+        """
+        return self._backward_arcs[node_id]
+
+    def head(self, arc: int) -> int:
+        """
+        Find the node the given residual arc leads to.
+
+        Parameters
+        ----------
+        arc : int
+            Residual arc.
+
+        Returns
+        -------
+        head_id : int
+            Id of the head of the edge for a forward arc and of its tail for a backward arc.
+        """
+        return self._edge_tails[arc >> 1] if arc & 1 else self._edge_heads[arc >> 1]
+
+    def residual_capacity(self, arc: int) -> int | float:
+        """
+        Find by how much the flow can be pushed along the given residual arc.
+
+        Parameters
+        ----------
+        arc : int
+            Residual arc.
+
+        Returns
+        -------
+        residual_capacity : int | float
+            Capacity minus flow of the edge for a forward arc and flow minus lower bound for a backward arc.
+        """
+        edge_number = arc >> 1
+        if arc & 1:
+            return self._flows[edge_number] - self._lower_bounds[edge_number]
+        return self._capacities[edge_number] - self._flows[edge_number]
+
+    def push(self, arc: int, amount: int | float) -> None:
+        """
+        Push the given amount of flow along the residual arc, i.e., increase the flow of its edge for a forward arc and decrease it for a backward arc.
+
+        Parameters
+        ----------
+        arc : int
+            Residual arc.
+        amount : int | float
+            Amount of flow to push, at most the residual capacity of the arc.
+        """
+        edge_number = arc >> 1
+        self.set_flow(edge_number, self._flows[edge_number] - amount if arc & 1 else self._flows[edge_number] + amount)
+
+    def set_flow(self, edge_number: int, flow: int | float) -> None:
+        """
+        Set the flow of the given edge.
+
+        Parameters
+        ----------
+        edge_number : int
+            Number of the edge.
+        flow : int | float
+            New flow of the edge.
+        """
+        self._flows[edge_number] = flow
+
+    def edge(self, edge_number: int) -> tuple[Node, Node]:
+        """
+        Retrieve the end nodes of the given edge.
+
+        Parameters
+        ----------
+        edge_number : int
+            Number of the edge.
+
+        Returns
+        -------
+        edge : tuple[Node, Node]
+            Source and target node of the edge.
+        """
+        return self._nodes[self._edge_tails[edge_number]], self._nodes[self._edge_heads[edge_number]]
+
+    def write_flows(self, flow_network: FlowNetwork[Node]) -> None:
+        """
+        Write the flows of all edges whose flow changed back to the flow network (the one the residual graph was built from) in a single update.
+
+        Parameters
+        ----------
+        flow_network : FlowNetwork[Node]
+            Flow network to update.
+        """
+        flow_network.set_flows(
+            (*self.edge(edge_number), flow) for edge_number, (flow, initial_flow) in enumerate(zip(self._flows, self._initial_flows))
+            if flow != initial_flow
+        )
+        self._initial_flows = list(self._flows)
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict, namedtuple
+from typing import Any, Generic, Iterator, TYPE_CHECKING
+
+import numpy as np
+
+from algpy_src.base.constants import Node, SingleEdgeData
+from algpy_src.data_structures.data_structure import DataStructure
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph, nodes_to_array
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
+
+if TYPE_CHECKING:
+    from algpy_src.data_structures.graphs.base_graph import BaseGraph
+
+SHARDED_FORMAT_VERSION = 1
+ShardCacheInfo = namedtuple('ShardCacheInfo', 'hits misses max_shards current_shards')
+Shard = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ShardedGraph(DataStructure, Generic[Node, SingleEdgeData]):
+    """
+    Read-only disk-backed simple graph for graphs whose edges do not fit into memory.
+    Nodes are split by their ids into shards of shard_size consecutive nodes and the CSR arrays (indptr, indices and weights)
+    of each shard are stored in a separate file. Only the node table is kept in memory, while shards are loaded on demand
+    and the most recently used ones are kept in a bounded LRU cache. Cache hits and misses are counted (see cache_info()) to help with sizing the cache.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], cache_shards: int = 8, allow_pickle: bool = False) -> None:
+        """
+        Constructor of the ShardedGraph class, opening a graph written by ShardedGraph.write() (or built by ShardedGraph.from_graph()).
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            Directory the sharded graph was written to.
+        cache_shards : int (default 8)
+            Maximum number of shards kept in memory at once.
+        allow_pickle : bool (default False)
+            Whether to load a pickled node table and pickled edge data of the shards (written for nodes and edge data of arbitrary types).
+            Unpickling can execute arbitrary code, thus it should be allowed only for graphs from a trusted source.
+        """
+        super().__init__()
+        if cache_shards <= 0:
+            raise ValueError('The cache has to hold at least one shard.')
+        with open(os.path.join(path, 'metadata.json'), encoding='utf-8') as metadata_file:
+            metadata = json.load(metadata_file)
+        if metadata.get('format_version') != SHARDED_FORMAT_VERSION:
+            raise ValueError(f'Unsupported sharded graph format version {metadata.get("format_version")}.')
+        if metadata.get('pickled') and not allow_pickle:
+            raise ValueError('The graph was written with pickled node table or edge data, which can be loaded only with allow_pickle set.')
+        self._allow_pickle: bool = allow_pickle
+        self._path: str | os.PathLike[str] = path
+        self._shard_size: int = metadata['shard_size']
+        self._number_of_edges: int = metadata['number_of_edges']
+        self._is_directed: bool = metadata['is_directed']
+        self._node_interner: NodeInterner[Node] = NodeInterner(np.load(os.path.join(path, 'nodes.npy'), allow_pickle=allow_pickle).tolist())
+        self._nodes: list[Node] = self._node_interner.nodes
+        self._node_ids: dict[Node, int] = self._node_interner.ids
+        self._cache_shards: int = cache_shards
+        self._cache: OrderedDict[int, Shard] = OrderedDict()
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
+
+    @staticmethod
+    def write(graph: BaseGraph | CSRGraph, path: str | os.PathLike[str], shard_size: int = 65_536) -> None:
+        """
+        Write the given graph to disk in the sharded format.
+        The graph is written shard by shard from its CSR arrays, thus a memory-mapped CSRGraph (see CSRGraph.load_binary())
+        can be sharded without reading all of its edges into memory at once.
+
+        Parameters
+        ----------
+        graph : BaseGraph | CSRGraph
+            Graph to write. Multigraphs are not supported.
+        path : str | os.PathLike[str]
+            Directory to write the graph to. It is created if it does not exist yet.
+        shard_size : int (default 65_536)
+            Number of nodes per shard.
+        """
+        if shard_size <= 0:
+            raise ValueError('Shard size has to be positive.')
+        csr_graph = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        os.makedirs(path, exist_ok=True)
+        nodes = csr_graph.node_interner.nodes
+        nodes_array = nodes_to_array(nodes)
+        np.save(os.path.join(path, 'nodes.npy'), nodes_array, allow_pickle=nodes_array.dtype == object)
+        indptr = csr_graph.indptr
+        for shard_id, first_node_id in enumerate(range(0, len(nodes), shard_size)):
+            last_node_id = min(first_node_id + shard_size, len(nodes))
+            start, end = int(indptr[first_node_id]), int(indptr[last_node_id])
+            np.savez(os.path.join(path, f'shard_{shard_id}.npz'), indptr=np.asarray(indptr[first_node_id:last_node_id + 1], dtype=np.int64) - start,
+                     indices=np.asarray(csr_graph.indices[start:end], dtype=np.int64), weights=np.asarray(csr_graph.weights[start:end]))
+        metadata = {
+            'format_version': SHARDED_FORMAT_VERSION,
+            'is_directed': csr_graph.is_directed,
+            'shard_size': shard_size,
+            'number_of_edges': csr_graph.number_of_edges,
+            'pickled': nodes_array.dtype == object or csr_graph.weights.dtype == object,
+        }
+        with open(os.path.join(path, 'metadata.json'), 'w', encoding='utf-8') as metadata_file:
+            json.dump(metadata, metadata_file)
+
+    @classmethod
+    def from_graph(cls, graph: BaseGraph | CSRGraph, path: str | os.PathLike[str], shard_size: int = 65_536, cache_shards: int = 8,
+                   allow_pickle: bool = False) -> ShardedGraph:
+        """
+        Write the given graph to disk in the sharded format (see write()) and open it.
+
+        Parameters
+        ----------
+        graph : BaseGraph | CSRGraph
+            Graph to write. Multigraphs are not supported.
+        path : str | os.PathLike[str]
+            Directory to write the graph to.
+        shard_size : int (default 65_536)
+            Number of nodes per shard.
+        cache_shards : int (default 8)
+            Maximum number of shards kept in memory at once.
+        allow_pickle : bool (default False)
+            Whether to open the graph if its node table or edge data had to be pickled (see the constructor).
+
+        Returns
+        -------
+        sharded_graph : ShardedGraph
+            The opened sharded graph.
+        """
+        cls.write(graph, path, shard_size)
+        return cls(path, cache_shards, allow_pickle)
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, ShardedGraph) and self._nodes == other._nodes and self._is_directed == other._is_directed and
+                self.adjacency_list == other.adjacency_list)
+
+    @property
+    def name(self) -> str:
+        return 'Sharded Graph'
+
+    @property
+    def space_complexity(self) -> str:
+        return 'V + cached shards'
+
+    @property
+    def is_directed(self) -> bool:
+        return self._is_directed
+
+    @property
+    def is_multigraph(self) -> bool:
+        return False
+
+    @property
+    def shard_size(self) -> int:
+        return self._shard_size
+
+    @property
+    def number_of_shards(self) -> int:
+        return -(-len(self._nodes) // self._shard_size)
+
+    @property
+    def node_interner(self) -> NodeInterner[Node]:
+        return self._node_interner
+
+    @property
+    def nodes(self) -> NodesView[Node]:
+        return NodesView(self._node_ids)
+
+    def has_node(self, node: Node) -> bool:
+        return node in self._node_ids
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def number_of_edges(self) -> int:
+        return self._number_of_edges
+
+    def cache_info(self) -> ShardCacheInfo:
+        """
+        Retrieve statistics of the shard cache.
+
+        Returns
+        -------
+        cache_info : ShardCacheInfo
+            Named tuple of (hits, misses, max_shards, current_shards).
+        """
+        return ShardCacheInfo(self._cache_hits, self._cache_misses, self._cache_shards, len(self._cache))
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached shards and reset the cache statistics.
+        """
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _shard(self, shard_id: int) -> Shard:
+        """
+        Retrieve the arrays of the given shard, loading it from disk on a cache miss and evicting the least recently used shard if the cache is full.
+
+        Parameters
+        ----------
+        shard_id : int
+            Id of the shard.
+
+        Returns
+        -------
+        shard : Shard
+            The (indptr, indices, weights) arrays of the shard with indptr relative to the start of the shard.
+        """
+        shard = self._cache.get(shard_id)
+        if shard is not None:
+            self._cache_hits += 1
+            self._cache.move_to_end(shard_id)
+            return shard
+        self._cache_misses += 1
+        with np.load(os.path.join(self._path, f'shard_{shard_id}.npz'), allow_pickle=self._allow_pickle) as shard_file:
+            shard = (shard_file['indptr'], shard_file['indices'], shard_file['weights'])
+        self._cache[shard_id] = shard
+        if len(self._cache) > self._cache_shards:
+            self._cache.popitem(last=False)
+        return shard
+
+    def _neighbourhood(self, node_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve the neighbour ids and edge data of the given node.
+
+        Parameters
+        ----------
+        node_id : int
+            Id of the node.
+
+        Returns
+        -------
+        neighbourhood : tuple[np.ndarray, np.ndarray]
+            Sorted neighbour ids and the aligned edge data.
+        """
+        shard_id, local_id = divmod(node_id, self._shard_size)
+        indptr, indices, weights = self._shard(shard_id)
+        start, end = indptr[local_id], indptr[local_id + 1]
+        return indices[start:end], weights[start:end]
+
+    def neighbors(self, node: Node) -> list[Node]:
+        """
+        Return the adjacent nodes of a given node in the order of their ids.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to find the neighbours.
+            If not present in the graph, empty list is returned.
+
+        Returns
+        -------
+        neighbours : list[Node]
+            Adjacent nodes of the node.
+        """
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return []
+        nodes = self._nodes
+        return [nodes[neighbour_id] for neighbour_id in self._neighbourhood(node_id)[0].tolist()]
+
+    def iter_out_edges(self, node: Node) -> Iterator[tuple[Node, SingleEdgeData]]:
+        """
+        Iterate over the outgoing edges of the given node in the order of neighbour ids.
+
+        Parameters
+        ----------
+        node : Node
+            Node whose outgoing edges to iterate over.
+            If not present in the graph, nothing is yielded.
+
+        Returns
+        -------
+        out_edges : Iterator[tuple[Node, SingleEdgeData]]
+            Iterator of (neighbour, edge data) pairs.
+        """
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return iter(())
+        neighbour_ids, weights = self._neighbourhood(node_id)
+        return zip((self._nodes[neighbour_id] for neighbour_id in neighbour_ids.tolist()), weights.tolist())
+
+    def get_edge_data(self, source: Node, target: Node) -> SingleEdgeData | NoEdge:
+        if source not in self._node_ids:
+            raise KeyError('Source node is not present in the graph.')
+        if target not in self._node_ids:
+            raise KeyError('Target node is not present in the graph.')
+        neighbour_ids, weights = self._neighbourhood(self._node_ids[source])
+        target_id = self._node_ids[target]
+        position = int(np.searchsorted(neighbour_ids, target_id))
+        if position < len(neighbour_ids) and neighbour_ids[position] == target_id:
+            edge_data = weights[position]
+            return edge_data.item() if isinstance(edge_data, np.generic) else edge_data
+        return NoEdge()
+
+    def outdegree(self, node: Node) -> int:
+        return len(self._neighbourhood(self._node_interner.id_of(node))[0])
+
+    @property
+    def adjacency_list(self) -> dict[Node, dict[Node, Any]]:
+        """
+        Materialize the adjacency list representation of the whole graph in O(V + E) time and memory, reading all shards one after another.
+
+        Returns
+        -------
+        adjacency_list: dict[Node, dict[Node, Any]]
+            Adjacency list representation of the graph.
+        """
+        return {node: dict(self.iter_out_edges(node)) for node in self._nodes}
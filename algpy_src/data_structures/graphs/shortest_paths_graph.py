@@ -1,11 +1,21 @@
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import Any, Generic, Iterable, Iterator, Optional
+
+import numpy as np
+
 from algpy_src.base.constants import Node, SingleEdgeData
 from algpy_src.data_structures.graphs.digraph import DiGraph
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
 from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
-from algpy_src.data_structures.linear.stack import Stack
+
+# predecessor id of sources and unreachable nodes in the predecessor matrix
+NO_PREDECESSOR = -1
 
 
-class ShortestPathsGraph(DiGraph):
+class ShortestPathsGraph(DiGraph, Generic[Node]):
 
     def __init__(self, adjacency_list: dict[Node, dict[Node, SingleEdgeData]], shortest_path_lengths: dict[Node, dict[Node, int | float]],
                  shortest_path_predecessors: dict[Node, dict[Node, Node | NoNode]]) -> None:
@@ -24,10 +34,50 @@ class ShortestPathsGraph(DiGraph):
         super().__init__(adjacency_list)
         self._shortest_path_lengths = shortest_path_lengths
         self._shortest_path_predecessors = shortest_path_predecessors
+        # array-backed results (see from_arrays()), rows correspond to sources and columns to the ids of the nodes in the node interner
+        self._path_node_interner: Optional[NodeInterner[Node]] = None
+        self._source_rows: dict[Node, int] = {}
+        self._distances: Optional[np.ndarray] = None
+        self._predecessor_ids: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_arrays(cls, adjacency_list: dict[Node, dict[Node, Any]], node_interner: NodeInterner[Node], sources: Iterable[Node],
+                    distances: np.ndarray, predecessor_ids: np.ndarray) -> ShortestPathsGraph[Node]:
+        """
+        Build a shortest paths graph keeping its results in compact matrices instead of dicts of dicts,
+        i.e., 8 bytes per distance and per predecessor, which makes all-pairs results feasible for large graphs.
+
+        Parameters
+        ----------
+        adjacency_list : dict[Node, dict[Node, SingleEdgeData]]
+            Adjacency list from which to build the shortest paths graph.
+        node_interner : NodeInterner[Node]
+            Interner numbering the nodes of the graph, which is copied.
+        sources : Iterable[Node]
+            Sources of the shortest paths, i-th source corresponding to the i-th row of the matrices.
+        distances : np.ndarray
+            Float matrix of shortest path lengths from the source of the row to the node with the id of the column, inf if it is not reachable.
+        predecessor_ids : np.ndarray
+            Integer matrix of ids of predecessors of the node with the id of the column on the shortest path from the source of the row,
+            NO_PREDECESSOR for the source itself and unreachable nodes.
+
+        Returns
+        -------
+        shortest_paths_graph : ShortestPathsGraph
+            Array-backed shortest paths graph.
+        """
+        shortest_paths_graph: ShortestPathsGraph[Node] = cls(adjacency_list, {}, {})
+        shortest_paths_graph._path_node_interner = node_interner.copy()
+        shortest_paths_graph._source_rows = {source: row for row, source in enumerate(sources)}
+        shortest_paths_graph._distances = distances
+        shortest_paths_graph._predecessor_ids = predecessor_ids
+        return shortest_paths_graph
 
     def __eq__(self, other: object) -> bool:
-        return (isinstance(other, ShortestPathsGraph) and self._adjacency_list == other.adjacency_list and
-                self._shortest_path_lengths == other._shortest_path_lengths and self._shortest_path_predecessors == other._shortest_path_predecessors)
+        return (isinstance(other, ShortestPathsGraph) and not self._fingerprints_differ(other) and self._adjacency_list == other.adjacency_list and
+                self.shortest_path_lengths == other.shortest_path_lengths and self.shortest_path_predecessors == other.shortest_path_predecessors)
+
+    __hash__ = DiGraph.__hash__
 
     @property
     def name(self) -> str:
@@ -35,11 +85,56 @@ class ShortestPathsGraph(DiGraph):
 
     @property
     def shortest_path_lengths(self) -> dict[Node, dict[Node, int | float]]:
-        return self._shortest_path_lengths
+        """
+        Getter for the shortest path lengths from each source to the nodes reachable from it.
+        For an array-backed graph (see from_arrays()), the mapping is materialized from the distance matrix on every access.
+
+        Returns
+        -------
+        shortest_path_lengths : dict[Node, dict[Node, int | float]]
+            Mapping of shortest path lengths from node i to node j.
+        """
+        if self._distances is None:
+            return self._shortest_path_lengths
+        nodes = self._path_nodes
+        return {source: {nodes[node_id]: length for node_id, length in zip(reached_ids.tolist(), self._distances[row, reached_ids].tolist())}
+                for source, row, reached_ids in self._iter_reached_ids()}
 
     @property
     def shortest_path_predecessors(self) -> dict[Node, dict[Node, Node | NoNode]]:
-        return self._shortest_path_predecessors
+        """
+        Getter for the predecessors of the nodes reachable from each source on their shortest paths.
+        For an array-backed graph (see from_arrays()), the mapping is materialized from the predecessor matrix on every access.
+
+        Returns
+        -------
+        shortest_path_predecessors : dict[Node, dict[Node, Node | NoNode]]
+            Mapping of predecessors of node j on shortest path from node i.
+        """
+        if self._distances is None or self._predecessor_ids is None:
+            return self._shortest_path_predecessors
+        nodes = self._path_nodes
+        return {source: {nodes[node_id]: nodes[predecessor_id] if predecessor_id != NO_PREDECESSOR else NoNode()
+                         for node_id, predecessor_id in zip(reached_ids.tolist(), self._predecessor_ids[row, reached_ids].tolist())}
+                for source, row, reached_ids in self._iter_reached_ids()}
+
+    def _iter_reached_ids(self) -> Iterator[tuple[Node, int, np.ndarray]]:
+        """
+        Iterate over the sources of an array-backed graph along with their rows and the ids of the nodes reachable from them.
+
+        Returns
+        -------
+        reached_ids : Iterator[tuple[Node, int, np.ndarray]]
+            Triples of source, its row in the matrices and the ids of the nodes with finite distance from it.
+        """
+        assert self._distances is not None
+        for source, row in self._source_rows.items():
+            yield source, row, np.flatnonzero(np.isfinite(self._distances[row]))
+
+    @property
+    def _path_nodes(self) -> list[Node]:
+        assert self._path_node_interner is not None
+        return self._path_node_interner.nodes
 
     def shortest_path_length(self, source: Node, target: Node) -> int | float:
         """
@@ -57,11 +152,43 @@ class ShortestPathsGraph(DiGraph):
         shortest_path_length : int | float
             Length of the shortest path from source to target or inf if such path does not exist.
         """
-        return self._shortest_path_lengths.get(source, {}).get(target, float('inf'))
+        if self._distances is None or self._path_node_interner is None:
+            return self._shortest_path_lengths.get(source, {}).get(target, float('inf'))
+        row = self._source_rows.get(source)
+        target_id = self._path_node_interner.ids.get(target)
+        if row is None or target_id is None:
+            return float('inf')
+        return self._distances[row, target_id].item()
+
+    def path_lengths(self, pairs: Iterable[tuple[Node, Node]]) -> np.ndarray:
+        """
+        Return lengths of the shortest paths between many pairs of nodes at once.
+        For an array-backed graph (see from_arrays()), the lengths are gathered from the distance matrix in a single vectorized lookup.
 
-    def shortest_path(self, source: Node, target: Node) -> TraversalGraph | None:
+        Parameters
+        ----------
+        pairs : Iterable[tuple[Node, Node]]
+            Pairs of starting and end node.
+
+        Returns
+        -------
+        path_lengths : np.ndarray
+            Float array of the shortest path lengths of the pairs in the given order, inf for pairs without a path.
         """
-        Return the shortest path between two nodes as line traversal graph if it exists.
+        if self._distances is None or self._path_node_interner is None:
+            return np.fromiter((self.shortest_path_length(source, target) for source, target in pairs), dtype=np.float64)
+        node_ids = self._path_node_interner.ids
+        indices = np.array([(self._source_rows.get(source, -1), node_ids.get(target, -1)) for source, target in pairs], dtype=np.int64).reshape(-1, 2)
+        rows, target_ids = indices[:, 0], indices[:, 1]
+        lengths = np.full(len(indices), np.inf)
+        is_known = (rows >= 0) & (target_ids >= 0)
+        lengths[is_known] = self._distances[rows[is_known], target_ids[is_known]]
+        return lengths
+
+    def iter_path(self, source: Node, target: Node) -> Iterator[Node]:
+        """
+        Iterate over the nodes of the shortest path between two nodes, from source to target, without building any graph.
+        Nothing is yielded if the path does not exist.
 
         Parameters
         ----------
@@ -72,47 +199,56 @@ class ShortestPathsGraph(DiGraph):
 
         Returns
         -------
-        shortest_path_graph : TraversalGraph | None
-            Shortest path from source to target given as line traversal graph or None if it does not exist.
+        path_nodes : Iterator[Node]
+            Nodes of the shortest path in their order on the path.
         """
         if self.shortest_path_length(source, target) == float('inf'):
-            return None
-        shortest_path_nodes: Stack[Node] = Stack()
-        shortest_path_nodes.push(target)
-        if target == source:
-            one_node_traversal_graph = TraversalGraph()
-            one_node_traversal_graph.add_node(source)
-            return one_node_traversal_graph
+            return
+        if self._predecessor_ids is None or self._path_node_interner is None:
+            predecessors = self._shortest_path_predecessors[source]
+            reverse_path: list[Node] = [target]
+            while reverse_path[-1] != source:
+                predecessor = predecessors[reverse_path[-1]]
+                if isinstance(predecessor, NoNode):
+                    return
+                reverse_path.append(predecessor)
+            yield from reversed(reverse_path)
+            return
+
+        predecessor_ids = self._predecessor_ids[self._source_rows[source]]
+        source_id = self._path_node_interner.ids[source]
+        reverse_path_ids: list[int] = [self._path_node_interner.ids[target]]
+        while reverse_path_ids[-1] != source_id:
+            predecessor_id = int(predecessor_ids[reverse_path_ids[-1]])
+            if predecessor_id == NO_PREDECESSOR:
+                return
+            reverse_path_ids.append(predecessor_id)
+        nodes = self._path_nodes
+        for node_id in reversed(reverse_path_ids):
+            yield nodes[node_id]
 
-        predecessor = self._shortest_path_predecessors[source][target]
-        while not isinstance(predecessor, NoNode):
-            shortest_path_nodes.push(predecessor)
-            if predecessor == source:
-                return self._reconstruct_path(shortest_path_nodes)
-            predecessor = self._shortest_path_predecessors[source][predecessor]
-        return None
-
-    def _reconstruct_path(self, reverse_order_nodes: Stack[Node]) -> TraversalGraph:
+    def shortest_path(self, source: Node, target: Node) -> TraversalGraph | None:
         """
-        Convenience function to reconstruct the path from a stack of nodes in reverse order.
+        Return the shortest path between two nodes as line traversal graph if it exists.
+        Use iter_path() to get the nodes of the path without building a graph.
 
         Parameters
         ----------
-        reverse_order_nodes : Stack[Node]
-            Stack of nodes, whose LIFO order corresponds to the desired path order.
+        source : Node
+            Starting node.
+        target : Node
+            End node.
 
         Returns
         -------
-        path_graph : TraversalGraph
-            Line traversal graph corresponding to the LIFO order of the given stack.
+        shortest_path_graph : TraversalGraph | None
+            Shortest path from source to target given as line traversal graph or None if it does not exist.
         """
-        current = reverse_order_nodes.pop()
-        path_graph: TraversalGraph = TraversalGraph()
-        path_graph.add_node(current)
-
-        while not reverse_order_nodes.is_empty:
-            following = reverse_order_nodes.pop()
-            path_graph.add_edge((current, following, self._adjacency_list[current].get(following, 0)))
-            current = following
-
-        return path_graph
+        path_nodes = list(self.iter_path(source, target))
+        if not path_nodes:
+            return None
+        path_adjacency_list: dict[Node, dict[Node, Any]] = {
+            current: {following: self._adjacency_list[current].get(following, 0)} for current, following in pairwise(path_nodes)
+        }
+        path_adjacency_list[path_nodes[-1]] = {}
+        return TraversalGraph(path_adjacency_list)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Generic, Iterator, TYPE_CHECKING
+
+from algpy_src.base.constants import Node, EdgeData
+from algpy_src.data_structures.graphs.graph_utils.read_write_lock import ReadWriteLock
+
+if TYPE_CHECKING:
+    from algpy_src.algorithms.algorithm import Algorithm
+    from algpy_src.data_structures.graphs.base_graph import BaseGraph
+
+# methods changing the graph (or its lazily built caches), which are run under the exclusive write lock
+_WRITE_METHODS = frozenset({
+    'add_node', 'add_nodes_from', 'remove_node', 'remove_nodes_from', 'add_edge', 'add_edges_from', 'remove_edge', 'remove_edges_from',
+    'add_edge_with_key', 'remove_edge_by_key', 'add_node_with_features', 'add_nodes_with_features_from', 'set_node_features_batch',
+    'set_source', 'set_sink', 'change_flow_between_nodes', 'set_flows',
+    'enable_incremental_adjacency_matrix', 'disable_incremental_adjacency_matrix', 'enable_journal', 'disable_journal', 'snapshot',
+})
+# attributes whose first read after a change builds a cache of the graph, thus they are also retrieved under the write lock
+_CACHE_BUILDING_ATTRIBUTES = frozenset({'adjacency_matrix', 'adjacency_matrix_array'})
+# methods returning live views or lazy iterators over the adjacency, whose results are materialized while the read lock is held
+_VIEW_METHODS = frozenset({'neighbors', 'in_neighbors', 'iter_out_edges', 'iter_in_edges'})
+
+
+class ThreadSafeGraph(Generic[Node, EdgeData]):
+    """
+    Thread-safe wrapper of a graph (e.g., DiGraph or Graph) guarding all access to it by a reader-writer lock.
+    Methods changing the graph take the lock exclusively, while all other methods and attributes of the wrapped graph are available as well
+    and share the lock, thus any number of threads may read the graph (or run algorithms on it, see run_algorithm()) concurrently.
+    Neighbourhood views and edge iterators are returned materialized as lists, since they would otherwise be read after the lock is released.
+    Lazily built state of the graph which reads would otherwise create is built while the write lock is held, so that reads under the shared lock never change the graph:
+    the edge count (of a memory-lean graph) and the fingerprint eagerly after every change, the node interner on the first read after it was invalidated.
+    Other live structures of the graph (e.g., nodes, edges or adjacency_list) may only be iterated over within a read_locked() block.
+    """
+
+    def __init__(self, graph: BaseGraph[Node, EdgeData]) -> None:
+        """
+        Constructor of the ThreadSafeGraph class.
+
+        Parameters
+        ----------
+        graph : BaseGraph[Node, EdgeData]
+            Graph to guard. It must not be accessed directly (i.e., bypassing this wrapper) by other threads afterwards.
+        """
+        self._graph: BaseGraph[Node, EdgeData] = graph
+        self._lock: ReadWriteLock = ReadWriteLock()
+        self._build_lazy_state()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in _WRITE_METHODS:
+            return self._locked_method(getattr(self._graph, name), self._lock.write_locked, rebuild_lazy_state=True)
+        if name in _CACHE_BUILDING_ATTRIBUTES:
+            with self._lock.write_locked():
+                return getattr(self._graph, name)
+        with self._read_locked():
+            attribute = getattr(self._graph, name)
+        if not callable(attribute):
+            return attribute
+        if name in _VIEW_METHODS:
+            return self._locked_method(attribute, self._read_locked, materialize=True)
+        return self._locked_method(attribute, self._read_locked)
+
+    def __eq__(self, other: object) -> bool:
+        with self._read_locked():
+            return self._graph == (other._graph if isinstance(other, ThreadSafeGraph) else other)
+
+    def __hash__(self) -> int:
+        with self._read_locked():
+            return hash(self._graph)
+
+    def _build_lazy_state(self) -> None:
+        """
+        Build the state of the graph which is otherwise created lazily on first read and then maintained by every change in O(1) time:
+        the edge count (of a memory-lean graph) and the structural fingerprint.
+        The node interner is not rebuilt here, since a node removal invalidates it and rebuilding it takes O(V) time (see _read_locked()).
+        Must be called while the write lock is held (or before the wrapper is shared).
+        """
+        _ = self._graph.number_of_edges, self._graph.fingerprint()
+
+    @contextmanager
+    def _read_locked(self) -> Iterator[None]:
+        """
+        Hold the lock for reading, after building the node interner of the graph under the write lock if it was invalidated by a node removal,
+        so that readers using the interner (e.g., algorithms or freezing the graph) never build it under the shared lock.
+        Thus consecutive node removals cost O(1) each and only the first read after them rebuilds the interner in O(V) time.
+        """
+        while True:
+            with self._lock.read_locked():
+                if self._graph.has_node_interner:
+                    yield
+                    return
+            with self._lock.write_locked():
+                _ = self._graph.node_interner
+
+    def _locked_method(self, method: Callable[..., Any], locked: Callable[[], ContextManager[None]], materialize: bool = False,
+                       rebuild_lazy_state: bool = False) -> Callable[..., Any]:
+        """
+        Wrap the given method of the graph so that each call holds the lock.
+
+        Parameters
+        ----------
+        method : Callable[..., Any]
+            Bound method of the wrapped graph.
+        locked : Callable[[], ContextManager[None]]
+            Either read_locked or write_locked of the lock.
+        materialize : bool (default False)
+            Whether to turn the result into a list while the lock is held.
+        rebuild_lazy_state : bool (default False)
+            Whether to rebuild the lazily built state of the graph after the call while the lock is held (for changes of the graph).
+
+        Returns
+        -------
+        locked_method : Callable[..., Any]
+            The wrapped method.
+        """
+        def locked_method(*args: Any, **kwargs: Any) -> Any:
+            with locked():
+                result = method(*args, **kwargs)
+                if rebuild_lazy_state:
+                    self._build_lazy_state()
+                return list(result) if materialize else result
+        return locked_method
+
+    @property
+    def graph(self) -> BaseGraph[Node, EdgeData]:
+        """
+        Getter for the wrapped graph. Accessing it directly is only safe within a read_locked() or write_locked() block.
+
+        Returns
+        -------
+        graph : BaseGraph[Node, EdgeData]
+            The wrapped graph.
+        """
+        return self._graph
+
+    def read_locked(self) -> ContextManager[None]:
+        """
+        Hold the lock for reading for the duration of a with block, e.g., to iterate over live views of the wrapped graph
+        or to perform several reads on one consistent state of the graph. The wrapper itself must not be used within the block.
+        """
+        return self._read_locked()
+
+    def write_locked(self) -> ContextManager[None]:
+        """
+        Hold the lock exclusively for the duration of a with block, e.g., to perform several changes of the wrapped graph atomically.
+        The wrapper itself must not be used within the block.
+        """
+        return self._write_locked_block()
+
+    @contextmanager
+    def _write_locked_block(self) -> Iterator[None]:
+        with self._lock.write_locked():
+            try:
+                yield
+            finally:
+                self._build_lazy_state()
+
+    def run_algorithm(self, algorithm: Algorithm, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run the given algorithm on the wrapped graph while holding the lock for reading, i.e., concurrently with other readers but not with changes of the graph.
+        Algorithms changing their input instance (e.g., relational classification on a FeatureGraph) must not be run this way.
+        The algorithm instance counts its operations, thus each thread should use its own instance.
+
+        Parameters
+        ----------
+        algorithm : Algorithm
+            Algorithm to run with the wrapped graph as its input instance.
+        *args : Any
+            Additional arguments passed to the run function of the algorithm.
+        **kwargs : Any
+            Additional keyword arguments passed to the run function of the algorithm.
+
+        Returns
+        -------
+        result : Any
+            Result of the run function of the algorithm.
+        """
+        with self._read_locked():
+            return algorithm.run_algorithm(self._graph, *args, **kwargs)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from algpy_src.base.constants import Node, SingleEdgeData
 from algpy_src.data_structures.graphs.digraph import DiGraph
@@ -17,8 +17,30 @@ class TraversalGraph(DiGraph):
         """
         super().__init__(adjacency_list)
 
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> 'TraversalGraph':
+        """
+        Build a traversal graph of the given nodes (without edges) in one pass instead of adding the nodes one by one.
+
+        Parameters
+        ----------
+        nodes : Iterable[Node]
+            Nodes in the order of traversal.
+
+        Returns
+        -------
+        traversal_graph : TraversalGraph
+            Traversal graph with node order corresponding to the given order.
+        """
+        adjacency_list: dict[Any, dict[Any, Any]] = {node: {} for node in nodes}
+        return cls(adjacency_list)
+
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, TraversalGraph) and list(self._adjacency_list.items()) == list(other._adjacency_list.items())
+        # equal traversal graphs also have to store their nodes in the same order, which determines the order of traversal
+        return (isinstance(other, TraversalGraph) and not self._fingerprints_differ(other) and len(self._adjacency_list) == len(other._adjacency_list) and
+                all(item == other_item for item, other_item in zip(self._adjacency_list.items(), other._adjacency_list.items())))
+
+    __hash__ = DiGraph.__hash__
 
     @property
     def name(self) -> str:
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Generic
+
+import numpy as np
+
+from algpy_src.base.constants import Node
+from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.shortest_paths_graph import NO_PREDECESSOR, ShortestPathsGraph
+from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
+
+
+@dataclass
+class TraversalResult(Generic[Node]):
+    """
+    Lightweight result of a graph traversal (e.g., BFS or DFS) in plain arrays aligned with the order of visit,
+    thus sized by the number of visited nodes rather than by the traversed graph.
+    The traversal graph is built only if asked for (see to_graph()).
+    """
+    # visited nodes in the order of their visit
+    order: list[Node]
+    # position (in order) of the node from which each visited node was discovered, NO_PREDECESSOR for roots
+    parents: np.ndarray
+    # number of edges from the root of the traversal tree to each visited node
+    distances: np.ndarray
+
+    @cached_property
+    def positions(self) -> dict[Node, int]:
+        """
+        Getter for the positions of the visited nodes in the order of visit, built on first access in O(number of visited nodes) time.
+
+        Returns
+        -------
+        positions : dict[Node, int]
+            Dict of visited node : position.
+        """
+        return {node: position for position, node in enumerate(self.order)}
+
+    def parent_of(self, node: Node) -> Node | NoNode:
+        """
+        Return the node from which the given visited node was discovered.
+
+        Parameters
+        ----------
+        node : Node
+            Visited node.
+
+        Returns
+        -------
+        parent : Node | NoNode
+            Parent of the node in the traversal tree, NoNode() for roots.
+        """
+        parent_position = int(self.parents[self.positions[node]])
+        return NoNode() if parent_position == NO_PREDECESSOR else self.order[parent_position]
+
+    def distance_of(self, node: Node) -> int | float:
+        """
+        Return the number of edges from the root of the traversal tree to the given node.
+
+        Parameters
+        ----------
+        node : Node
+            Node of the traversed graph.
+
+        Returns
+        -------
+        distance : int | float
+            Depth of the node in the traversal tree, inf for nodes which were not visited.
+        """
+        position = self.positions.get(node)
+        return float('inf') if position is None else int(self.distances[position])
+
+    def to_graph(self) -> TraversalGraph:
+        """
+        Build the traversal graph with node order corresponding to the order of traversal.
+
+        Returns
+        -------
+        traversal_graph : TraversalGraph
+            Traversal graph of the visited nodes.
+        """
+        return TraversalGraph.from_nodes(self.order)
+
+
+@dataclass
+class ShortestPathsResult(Generic[Node]):
+    """
+    Lightweight result of a shortest paths search in plain matrices over the ids of the nodes in the node interner, rows corresponding to the sources.
+    The shortest paths graph is built only if asked for (see to_graph()).
+    """
+    # adjacency list of the searched graph, kept by reference and copied only by to_graph()
+    adjacency_list: dict[Node, dict[Node, Any]]
+    node_interner: NodeInterner[Node]
+    sources: list[Node]
+    # shortest path lengths, inf for unreachable nodes
+    distances: np.ndarray
+    # ids of predecessors on the shortest paths, NO_PREDECESSOR for the sources and unreachable nodes
+    predecessor_ids: np.ndarray
+
+    def to_graph(self) -> ShortestPathsGraph[Node]:
+        """
+        Build the array-backed shortest paths graph of the result (see ShortestPathsGraph.from_arrays()).
+
+        Returns
+        -------
+        shortest_paths_graph : ShortestPathsGraph[Node]
+            Shortest paths graph sharing the matrices of the result.
+        """
+        return ShortestPathsGraph.from_arrays(self.adjacency_list, self.node_interner, self.sources, self.distances, self.predecessor_ids)
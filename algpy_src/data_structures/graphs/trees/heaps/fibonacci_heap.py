@@ -4,6 +4,7 @@ import math
 from typing import TypeVar, Generic, Iterator
 
 from algpy_src.base.constants import Comparable
+from algpy_src.base.memory_footprint import deep_sizeof
 from algpy_src.data_structures.container import Container
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
 from algpy_src.data_structures.graphs.trees.heaps.heap_node import HeapNode
@@ -435,3 +436,34 @@ class FibonacciHeap(Container, Generic[_K, _V]):
             else:
                 self._cut(node, parent)
                 self._cascading_cut(parent)
+
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the keys and priorities of the heap nodes and the heap nodes themselves (with their sibling, parent and child links).
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already.
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        nodes: list[HeapNode] = []
+        if not isinstance(self._root_list_root, NoNode):
+            stack = [self._root_list_root]
+            visited = {id(self._root_list_root)}
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                for linked_node in (node.successor, node.child):
+                    if linked_node is not None and id(linked_node) not in visited:
+                        visited.add(id(linked_node))
+                        stack.append(linked_node)
+        return {
+            'keys': deep_sizeof((node.key for node in nodes), seen),
+            'priorities': deep_sizeof((node.priority for node in nodes), seen),
+            'heap_nodes': deep_sizeof(nodes, seen),
+        }
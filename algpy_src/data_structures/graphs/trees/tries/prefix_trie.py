@@ -2,6 +2,7 @@ import string
 from typing import Optional, Self, Generic, Iterable, Sequence, cast
 from typing import TypeVar
 
+from algpy_src.base.memory_footprint import deep_sizeof, shallow_sizeof
 from algpy_src.data_structures.container import Container
 from algpy_src.data_structures.graphs.trees.tries.trie_node import TrieNode
 
@@ -148,4 +149,31 @@ class PrefixTrie(Container, Generic[T]):
             node_position = self._alphabet[word_node.key]
             word_node.parent.children[node_position] = None
 
-        return True
\ No newline at end of file
+        return True
+
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the alphabet, keys of the trie nodes, their child arrays and the trie nodes themselves.
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already.
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        nodes: list[TrieNode] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(child for child in node.children if child is not None)
+        return {
+            'alphabet': deep_sizeof((self._alphabet,), seen),
+            'keys': deep_sizeof((node.key for node in nodes), seen),
+            'child_arrays': shallow_sizeof((node.children for node in nodes), seen),
+            'trie_nodes': deep_sizeof(nodes, seen),
+        }
@@ -1,6 +1,7 @@
 from typing import TypeVar, Generic, cast, Optional
 
 from algpy_src.base.constants import Hashable
+from algpy_src.base.memory_footprint import deep_sizeof, shallow_sizeof
 from algpy_src.data_structures.container import Container
 from algpy_src.data_structures.linear.linked_list import LinkedList
 
@@ -175,3 +176,26 @@ class HashTable(Container, Generic[_K, _V]):
                     return node.value[1]
         return None
 
+    def _memory_components(self, seen: set[int]) -> dict[str, int]:
+        """
+        Measure the keys, values, key-value tuples, collision chains (linked lists with their nodes) and the bucket array of the hash table.
+
+        Parameters
+        ----------
+        seen : set[int]
+            Ids of objects which were counted already.
+
+        Returns
+        -------
+        components : dict[str, int]
+            Number of bytes of each component.
+        """
+        chains = [bucket for bucket in self._hash_table if bucket != self._EMPTY_BUCKET]
+        entries = [node.value for chain in chains for node in chain]
+        return {
+            'keys': deep_sizeof((key for key, _ in entries), seen),
+            'values': deep_sizeof((value for _, value in entries), seen),
+            'entry_tuples': shallow_sizeof(entries, seen),
+            'chains': deep_sizeof(chains, seen),
+            'bucket_array': shallow_sizeof((self._hash_table,), seen),
+        }
@@ -50,3 +50,11 @@ def test_relational_classification_run_algorithm(
     else:
         with pytest.raises(ValueError):
             relational_classification.run_algorithm(feature_graph)
+
+
+def test_relational_classification_columnar_features(relational_classification: RelationalClassificationAlgorithm) -> None:
+    feature_graph: FeatureGraph = FeatureGraph({1: {2: 1.0}, 3: {2: 1.0}, 4: {3: 1.0}}, node_features={1: 1.0, 4: 0.0}, feature_columns=('label',))
+    adjacency_matrix = feature_graph.adjacency_matrix
+    converged, labelled_graph = relational_classification.run_algorithm(feature_graph)
+    assert converged and labelled_graph.node_features == {1: 1.0, 2: 1.0, 3: 0.0, 4: 0.0}
+    assert labelled_graph.adjacency_matrix is adjacency_matrix
@@ -51,7 +51,7 @@ def test_worst_case(edmonds_karp: EdmondsKarpAlgorithm) -> None:
         True,
         expected_flow_network
     )
-    assert edmonds_karp.n_ops == 50
+    assert edmonds_karp.n_ops == 49
     assert worst_case_args['input_instance'].current_flow == 3
 
 def test_simple_case_zero_initial_flow(edmonds_karp: EdmondsKarpAlgorithm) -> None:
@@ -113,4 +113,37 @@ def test_improves_ford_fulkersons_worst_case(edmonds_karp: EdmondsKarpAlgorithm)
     res, inp = edmonds_karp.run_algorithm(input_instance, find_initial_feasible=True)
     assert res is True
     assert inp.current_flow == 200
-    assert edmonds_karp.n_ops == 48
\ No newline at end of file
+    assert edmonds_karp.n_ops == 45
+
+def test_accepts_frozen_flow_network(edmonds_karp: EdmondsKarpAlgorithm) -> None:
+    input_instance: FlowNetwork[int] = FlowNetwork(
+        adjacency_list={
+            0: {1: FlowEdgeData(0, None, 100), 2: FlowEdgeData(0, None, 100)},
+            1: {2: FlowEdgeData(0, None, 1), 3: FlowEdgeData(0, None, 100)},
+            2: {3: FlowEdgeData(0, None, 100)}, 3: {4: FlowEdgeData(0, None, 200)}, 4: {},
+        },
+        source=0, sink=4
+    )
+    res, inp = edmonds_karp.run_algorithm(input_instance.freeze(), source=0, sink=4)
+    assert res is True
+    assert inp.current_flow == 200
+    assert input_instance.current_flow == 0
+    res, inp = edmonds_karp.run_algorithm(input_instance.freeze())
+    assert res is True
+    assert inp.current_flow == 200
+
+
+def test_writes_each_flow_once(edmonds_karp: EdmondsKarpAlgorithm) -> None:
+    input_instance: FlowNetwork[int] = FlowNetwork(
+        adjacency_list={
+            0: {1: FlowEdgeData(0, None, 100), 2: FlowEdgeData(0, None, 100)},
+            1: {2: FlowEdgeData(0, None, 1), 3: FlowEdgeData(0, None, 100)},
+            2: {3: FlowEdgeData(0, None, 100)}, 3: {4: FlowEdgeData(0, None, 200)}, 4: {},
+        },
+        source=0, sink=4
+    )
+    journal = input_instance.enable_journal()
+    res, inp = edmonds_karp.run_algorithm(input_instance)
+    assert res is True and inp.current_flow == 200
+    changed_edges = [(delta.source, delta.target) for delta in journal.deltas_since(0)]
+    assert sorted(changed_edges) == [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3), (3, 4)]
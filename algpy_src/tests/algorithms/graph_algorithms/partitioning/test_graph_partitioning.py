@@ -0,0 +1,105 @@
+import pytest
+
+from algpy_src.algorithms.graph_algorithms.partitioning.graph_partitioning import GraphPartitioningAlgorithm, GraphPartition
+from algpy_src.base.constants import GraphSize
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+
+
+def two_triangles() -> dict[int, dict[int, None]]:
+    return {1: {2: None, 3: None}, 2: {3: None}, 3: {4: None}, 4: {5: None, 6: None}, 5: {6: None}}
+
+
+def grid_graph(size: int) -> Graph:
+    g: Graph = Graph()
+    g.add_nodes_from((row, column) for row in range(size) for column in range(size))
+    for row in range(size):
+        for column in range(size):
+            if row + 1 < size:
+                g.add_edge(((row, column), (row + 1, column), None))
+            if column + 1 < size:
+                g.add_edge(((row, column), (row, column + 1), None))
+    return g
+
+
+@pytest.fixture
+def partitioning() -> GraphPartitioningAlgorithm:
+    return GraphPartitioningAlgorithm()
+
+
+def test_graph_partitioning_base(partitioning: GraphPartitioningAlgorithm) -> None:
+    assert partitioning.name == 'Graph Partitioning'
+    assert partitioning.best_case_time_complexity == '|V| + |E|'
+    assert partitioning.average_case_time_complexity == '(|V| + |E|) * n_iterations'
+    assert partitioning.worst_case_time_complexity == '(|V| + |E|) * max_iterations'
+    assert partitioning.space_complexity == '|V| + |E|'
+    assert partitioning.get_worst_case_arguments(GraphSize(*(4, 3))) == {
+        'input_instance': Graph({0: {1: None, 2: None, 3: None}, 1: {0: None}, 2: {0: None}, 3: {0: None}}),
+        'n_parts': 2
+    }
+
+
+def test_worst_case(partitioning: GraphPartitioningAlgorithm) -> None:
+    assert partitioning.n_ops == 0
+    worst_case_args = partitioning.get_worst_case_arguments(GraphSize(*(6, 5)))
+    assert partitioning.run_algorithm(**worst_case_args) == (True, GraphPartition(
+        parts=[{1, 2}, {0, 3, 4, 5}], assignment={0: 1, 1: 0, 2: 0, 3: 1, 4: 1, 5: 1}, boundary_nodes=[{1, 2}, {0}], edge_cut=2
+    ))
+    assert partitioning.n_ops == 31
+
+
+@pytest.mark.parametrize('graph_class', [Graph, DiGraph])
+def test_graph_partitioning_cuts_bridge(partitioning: GraphPartitioningAlgorithm, graph_class: type[DiGraph]) -> None:
+    graph = graph_class(two_triangles())
+    expected_partition: GraphPartition = GraphPartition(
+        parts=[{1, 2, 3}, {4, 5, 6}], assignment={1: 0, 2: 0, 3: 0, 4: 1, 5: 1, 6: 1}, boundary_nodes=[{3}, {4}], edge_cut=1
+    )
+    assert partitioning.run_algorithm(graph) == (True, expected_partition)
+    assert partitioning.run_algorithm(graph.freeze()) == (True, expected_partition)
+    assert partitioning.run_algorithm(graph.snapshot()) == (True, expected_partition)
+    # assignment follows the node ids of the graph's interner
+    assert list(partitioning.run_algorithm(graph.compress())[1].assignment) == graph.compress().node_interner.nodes
+
+
+def test_graph_partitioning_grid(partitioning: GraphPartitioningAlgorithm) -> None:
+    graph = grid_graph(10)
+    converged, partition = partitioning.run_algorithm(graph, n_parts=4, max_imbalance=0.1)
+    assert converged
+    assert partition.n_parts == 4
+    assert set().union(*partition.parts) == set(graph.nodes)
+    assert sum(len(part) for part in partition.parts) == graph.number_of_nodes
+    assert all(len(part) <= 28 for part in partition.parts)
+    assert all(partition.assignment[node] == part_id for part_id, part in enumerate(partition.parts) for node in part)
+    expected_edge_cut = sum(1 for u, v, _ in graph.edges if partition.assignment[u] != partition.assignment[v])
+    assert partition.edge_cut == expected_edge_cut
+    # region growing on its own cuts along whole BFS layers, refinement has to do better than a third of all edges
+    assert partition.edge_cut < graph.number_of_edges // 3
+    for part_id, boundary in enumerate(partition.boundary_nodes):
+        assert boundary == {node for node in partition.parts[part_id]
+                            if any(partition.assignment[neighbour] != part_id for neighbour in graph.neighbors(node))}
+
+
+def test_graph_partitioning_single_part_and_components(partitioning: GraphPartitioningAlgorithm) -> None:
+    graph: Graph = Graph({1: {2: None}, 3: {4: None}})
+    graph.add_node(5)
+    assert partitioning.run_algorithm(graph, n_parts=1) == (True, GraphPartition(
+        parts=[{1, 2, 3, 4, 5}], assignment={1: 0, 2: 0, 3: 0, 4: 0, 5: 0}, boundary_nodes=[set()], edge_cut=0
+    ))
+    converged, partition = partitioning.run_algorithm(graph, n_parts=2)
+    assert converged and partition.edge_cut == 0
+    assert sorted(len(part) for part in partition.parts) == [2, 3]
+
+
+def test_graph_partitioning_subgraph_views(partitioning: GraphPartitioningAlgorithm) -> None:
+    graph: Graph = Graph(two_triangles())
+    _, partition = partitioning.run_algorithm(graph)
+    first_view, second_view = partition.subgraph_views(graph)
+    assert set(first_view.nodes) == {1, 2, 3}
+    assert set(second_view.nodes) == {4, 5, 6}
+    assert set(first_view.neighbors(3)) == {1, 2}
+
+
+@pytest.mark.parametrize(('n_parts', 'max_imbalance'), [(0, 0.1), (7, 0.1), (2, -0.5)])
+def test_graph_partitioning_invalid_arguments(partitioning: GraphPartitioningAlgorithm, n_parts: int, max_imbalance: float) -> None:
+    with pytest.raises(ValueError):
+        partitioning.run_algorithm(Graph(two_triangles()), n_parts=n_parts, max_imbalance=max_imbalance)
@@ -3,11 +3,12 @@ from typing import Optional
 import pytest
 
 from algpy_src.algorithms.graph_algorithms.traversal.shortest_paths.simple_dijkstra import DijkstraShortestPathsAlgorithm
-from algpy_src.base.constants import GraphSize, SingleEdgeData, Node
+from algpy_src.base.constants import GraphSize, SingleEdgeData, Node, SHORTEST_PATHS_STORAGE
 from algpy_src.data_structures.graphs.digraph import DiGraph
 from algpy_src.data_structures.graphs.graph import Graph
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
 from algpy_src.data_structures.graphs.shortest_paths_graph import ShortestPathsGraph
+from algpy_src.data_structures.graphs.traversal_result import ShortestPathsResult
 
 
 @pytest.fixture
@@ -48,6 +49,7 @@ def test_worst_case(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
     assert dijkstra.n_ops == 25  # TODO: Update when Fib heap n_ops counting is implemented
 
 
+@pytest.mark.parametrize('storage', ['dicts', 'arrays'])
 @pytest.mark.parametrize(
     ('input_adjacency_list', 'source', 'target', 'expected_path_lengths', 'expected_path_predecessors', 'expected_n_ops'),
     [
@@ -113,17 +115,17 @@ def test_worst_case(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
 def test_dijkstra_run_algorithm(
         dijkstra: DijkstraShortestPathsAlgorithm, input_adjacency_list: dict[Node, dict[Node, SingleEdgeData]],
         source: Node | NoNode, target: Node | NoNode, expected_path_lengths: Optional[dict[Node, dict[Node, int | float]]],
-        expected_path_predecessors: Optional[dict[Node, dict[Node, Node | NoNode]]], expected_n_ops: int
+        expected_path_predecessors: Optional[dict[Node, dict[Node, Node | NoNode]]], expected_n_ops: int, storage: SHORTEST_PATHS_STORAGE
 ) -> None:
 
     digraph = DiGraph(input_adjacency_list)
 
     if expected_path_lengths is None or expected_path_predecessors is None:
         with pytest.raises(ValueError):
-            dijkstra.run_algorithm(digraph, source=source, target=target)
+            dijkstra.run_algorithm(digraph, source=source, target=target, storage=storage)
     else:
         expected_shortest_path_graph = ShortestPathsGraph(input_adjacency_list, expected_path_lengths, expected_path_predecessors)
-        result, sp_graph = dijkstra.run_algorithm(digraph, source=source, target=target, fill_weight_value=1)
+        result, sp_graph = dijkstra.run_algorithm(digraph, source=source, target=target, fill_weight_value=1, storage=storage)
 
         if (source != NoNode() and expected_path_lengths == {}) or (target != NoNode() and expected_path_predecessors == {}):
             assert result is False
@@ -131,3 +133,59 @@ def test_dijkstra_run_algorithm(
             assert result is True
 
         assert sp_graph == expected_shortest_path_graph
+
+
+def test_dijkstra_accepts_frozen_graph(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
+    input_adjacency_list: dict[int, dict[int, int]] = {0: {1: 5, 2: 1}, 1: {}, 2: {1: 1}}
+    result, sp_graph = dijkstra.run_algorithm(DiGraph(input_adjacency_list).freeze(), source=0, target=1)
+    assert result is True
+    expected_path_lengths: dict[int, dict[int, int | float]] = {0: {0: 0, 1: 2, 2: 1}}
+    expected_path_predecessors: dict[int, dict[int, int | NoNode]] = {0: {0: NoNode(), 1: 2, 2: 0}}
+    assert sp_graph == ShortestPathsGraph(input_adjacency_list, expected_path_lengths, expected_path_predecessors)
+    assert dijkstra.n_ops == 3
+
+
+def test_dijkstra_accepts_graph_snapshot(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
+    input_adjacency_list: dict[int, dict[int, int]] = {0: {1: 5, 2: 1}, 1: {}, 2: {1: 1}}
+    g = DiGraph(input_adjacency_list)
+    snapshot = g.snapshot()
+    g.remove_edge(2, 1)
+    result, sp_graph = dijkstra.run_algorithm(snapshot, source=0, target=1)
+    assert result is True
+    expected_path_lengths: dict[int, dict[int, int | float]] = {0: {0: 0, 1: 2, 2: 1}}
+    expected_path_predecessors: dict[int, dict[int, int | NoNode]] = {0: {0: NoNode(), 1: 2, 2: 0}}
+    assert sp_graph == ShortestPathsGraph(input_adjacency_list, expected_path_lengths, expected_path_predecessors)
+    assert dijkstra.n_ops == 3
+
+
+def test_dijkstra_array_storage(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
+    worst_case_args = dijkstra.get_worst_case_arguments(GraphSize(*(5, 5)))
+    _, dict_sp_graph = dijkstra.run_algorithm(**worst_case_args)
+    dict_n_ops = dijkstra.n_ops
+    result, array_sp_graph = dijkstra.run_algorithm(**worst_case_args, storage='arrays')
+    assert result is True and dijkstra.n_ops == dict_n_ops
+    assert array_sp_graph == dict_sp_graph
+    assert list(array_sp_graph.iter_path(3, 4)) == list(dict_sp_graph.iter_path(3, 4)) == [3, 0, 4]
+    assert array_sp_graph.path_lengths([(1, 3), (2, 2), (3, 5)]).tolist() == [2.0, 0.0, float('inf')]
+
+    result, array_sp_graph = dijkstra.run_algorithm(DiGraph({0: {1: 5, 2: 1}, 1: {}, 2: {1: 1}}).snapshot(), source=0, target=1, storage='arrays')
+    assert result is True and array_sp_graph.shortest_path_lengths == {0: {0: 0, 1: 2, 2: 1}}
+
+
+def test_dijkstra_array_result(dijkstra: DijkstraShortestPathsAlgorithm) -> None:
+    digraph = DiGraph({0: {1: 5, 2: 1}, 1: {}, 2: {1: 1}, 3: {}})
+    _, sp_graph = dijkstra.run_algorithm(digraph, source=0)
+    graph_n_ops = dijkstra.n_ops
+    result, sp_result = dijkstra.run_algorithm(digraph, source=0, result_mode='arrays')
+    assert result is True and dijkstra.n_ops == graph_n_ops
+    assert isinstance(sp_result, ShortestPathsResult) and sp_result.sources == [0]
+    node_ids = [sp_result.node_interner.id_of(node) for node in range(4)]
+    assert sp_result.distances[0, node_ids].tolist() == [0, 2, 1, float('inf')]
+    assert sp_result.predecessor_ids[0, node_ids[1]] == node_ids[2]
+    assert sp_result.to_graph() == sp_graph
+
+    result, sp_result = dijkstra.run_algorithm(digraph, source=1, target=0, result_mode='arrays')
+    assert result is False and sp_result.sources == [] and sp_result.distances.shape == (0, 4)
+    with pytest.raises(ValueError):
+        dijkstra.run_algorithm(digraph, source=0, storage='dicts', result_mode='arrays')  # type: ignore[call-overload]
+    assert dijkstra.run_algorithm(digraph, source=0, storage='arrays', result_mode='arrays')[1].to_graph() == sp_graph
@@ -67,3 +67,27 @@ def test_bfs_run_algorithm(
     assert bfs.n_ops == expected_n_ops
     assert bfs.run_algorithm(digraph, element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
     assert bfs.n_ops == expected_n_ops
+    assert bfs.run_algorithm(digraph.freeze(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert bfs.n_ops == expected_n_ops
+    assert bfs.run_algorithm(digraph.snapshot(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert bfs.n_ops == expected_n_ops
+    assert bfs.run_algorithm(digraph.compress(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert bfs.n_ops == expected_n_ops
+
+
+def test_bfs_array_result(bfs: BreadthFirstSearch) -> None:
+    digraph = DiGraph({1: {2: None, 4: None, 6: None}, 2: {3: None}, 3: {}, 4: {5: None}, 5: {}, 6: {7: None}, 7: {}, 8: {}})
+    _, traversal_graph = bfs.run_algorithm(digraph, root=1)
+    graph_n_ops = bfs.n_ops
+    result, traversal_result = bfs.run_algorithm(digraph, root=1, result_mode='arrays')
+    assert result is True and bfs.n_ops == graph_n_ops
+    assert traversal_result.order == [1, 2, 4, 6, 3, 5, 7]
+    assert traversal_result.parents.tolist() == [-1, 0, 0, 0, 1, 2, 3] and traversal_result.distances.tolist() == [0, 1, 1, 1, 2, 2, 2]
+    assert [traversal_result.parent_of(node) for node in range(1, 8)] == [NoNode(), 1, 2, 1, 4, 1, 6]
+    assert [traversal_result.distance_of(node) for node in range(1, 9)] == [0, 1, 2, 1, 2, 1, 2, float('inf')]
+    assert traversal_result.to_graph() == traversal_graph
+
+    result, traversal_result = bfs.run_algorithm(digraph.snapshot(), element_to_search=4, result_mode='arrays')
+    assert result is True and traversal_result.order == [1, 2, 4]
+    assert bfs.run_algorithm(DiGraph(), result_mode='arrays')[1].to_graph() == TraversalGraph()
+    assert bfs.run_algorithm(digraph, root=9, result_mode='arrays')[1].to_graph() == bfs.run_algorithm(digraph, root=9)[1]
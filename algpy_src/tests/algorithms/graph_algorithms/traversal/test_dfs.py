@@ -67,3 +67,25 @@ def test_dfs_run_algorithm(
     assert dfs.n_ops == expected_n_ops
     assert dfs.run_algorithm(digraph, element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
     assert dfs.n_ops == expected_n_ops
+    assert dfs.run_algorithm(digraph.freeze(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert dfs.n_ops == expected_n_ops
+    assert dfs.run_algorithm(digraph.snapshot(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert dfs.n_ops == expected_n_ops
+    assert dfs.run_algorithm(digraph.compress(), element_to_search=element_to_search) == (expected_verdict, expected_traversal_graph)
+    assert dfs.n_ops == expected_n_ops
+
+
+def test_dfs_array_result(dfs: DepthFirstSearch) -> None:
+    digraph = DiGraph({1: {2: None, 4: None}, 2: {3: None}, 3: {}, 4: {5: None}, 5: {}, 6: {}})
+    _, traversal_graph = dfs.run_algorithm(digraph)
+    graph_n_ops = dfs.n_ops
+    result, traversal_result = dfs.run_algorithm(digraph, result_mode='arrays')
+    assert result is True and dfs.n_ops == graph_n_ops
+    assert traversal_result.order == list(traversal_graph.nodes)
+    assert traversal_result.to_graph() == traversal_graph
+    for node in range(1, 7):
+        parent = traversal_result.parent_of(node)
+        assert traversal_result.distance_of(node) == (0 if isinstance(parent, NoNode) else traversal_result.distance_of(parent) + 1)
+        assert isinstance(parent, NoNode) or node in digraph.adjacency_list[parent]
+    assert [node for node in range(1, 7) if isinstance(traversal_result.parent_of(node), NoNode)] == [1, 6]
+    assert dfs.run_algorithm(digraph, root=9, result_mode='arrays')[1].to_graph() == dfs.run_algorithm(digraph, root=9)[1]
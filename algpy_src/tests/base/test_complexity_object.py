@@ -1,3 +1,5 @@
+import sys
+
 from algpy_src.tests.test_utils.example_base_objects import ExampleComplexityObject
 
 
@@ -9,3 +11,13 @@ def test_complexity_object():
     assert obj.n_ops == 5
     obj.reset_n_ops()
     assert obj.n_ops == 0
+
+
+def test_complexity_object_memory_footprint():
+    obj = ExampleComplexityObject()
+    obj.increment_n_ops(1000)
+    footprint = obj.memory_footprint()
+    assert set(footprint.components) == {'instance', 'n_ops'}
+    assert footprint.components['n_ops'] == sys.getsizeof(1000)
+    obj.reset_n_ops()
+    assert set(obj.memory_footprint().components) == {'instance'}
@@ -0,0 +1,64 @@
+import sys
+
+import numpy as np
+
+from algpy_src.base.memory_footprint import MemoryFootprint, deep_sizeof, shallow_sizeof
+
+
+class Point:
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+class SlottedPoint:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+def test_memory_footprint_total() -> None:
+    assert MemoryFootprint().total == 0
+    assert MemoryFootprint({'nodes': 100, 'edges': 50}).total == 150
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    shared = 'shared' * 10
+    container = [shared, shared, (shared,)]
+    seen: set[int] = set()
+    assert deep_sizeof((container,), seen) == sys.getsizeof(container) + sys.getsizeof(shared) + sys.getsizeof((shared,))
+    assert deep_sizeof((shared,), seen) == 0
+
+    cyclic: list[object] = []
+    cyclic.append(cyclic)
+    assert deep_sizeof((cyclic,), set()) == sys.getsizeof(cyclic)
+
+
+def test_deep_sizeof_skips_unowned_objects() -> None:
+    assert deep_sizeof((None, True, 0, 256, int, len, np), set()) == 0
+    assert deep_sizeof((1000,), set()) == sys.getsizeof(1000)
+
+
+def test_deep_sizeof_objects_and_arrays() -> None:
+    x, y = 1.5, 2.5
+    point = Point(x, y)
+    assert deep_sizeof((point,), set()) == sys.getsizeof(point) + sys.getsizeof(vars(point)) + sys.getsizeof(x) + sys.getsizeof(y)
+    slotted_point = SlottedPoint(x, y)
+    assert deep_sizeof((slotted_point,), set()) == sys.getsizeof(slotted_point) + sys.getsizeof(x) + sys.getsizeof(y)
+
+    array = np.arange(1000, dtype=np.int64)
+    view = array[10:20]
+    assert deep_sizeof((view,), set()) == sys.getsizeof(view) + sys.getsizeof(array)
+    assert deep_sizeof((array,), set()) >= array.nbytes
+
+    data = {'a' * 20: [x, y]}
+    assert deep_sizeof((data,), set()) == sys.getsizeof(data) + sys.getsizeof('a' * 20) + sys.getsizeof(data['a' * 20]) + 2 * sys.getsizeof(x)
+
+
+def test_shallow_sizeof() -> None:
+    point = Point(1.5, 2.5)
+    seen: set[int] = set()
+    assert shallow_sizeof((point, point, None), seen) == sys.getsizeof(point) + sys.getsizeof(vars(point))
+    assert deep_sizeof(vars(point).values(), seen) == 2 * sys.getsizeof(1.5)
@@ -1,10 +1,23 @@
+import threading
+import time
+
+import numpy as np
 import pytest
 
 from algpy_src.data_structures.graphs.digraph import DiGraph
 from algpy_src.data_structures.graphs.graph_utils.affects_adjacency_matrix import affects_adjacency_matrix
+from algpy_src.data_structures.graphs.graph_utils.columnar_feature_store import ColumnarFeatureStore
+from algpy_src.data_structures.graphs.graph_utils.edge_entries import (collect_edges, count_edge_entries, edge_entry_size, number_of_edges_from_counts,
+                                                                        single_edges_data)
+from algpy_src.data_structures.graphs.graph_utils.graph_fingerprint import (FINGERPRINT_MASK, data_hash, edge_entry_token, graph_fingerprint, node_token,
+                                                                             single_edge_token)
+from algpy_src.data_structures.graphs.graph_utils.graph_journal import GraphChangeKind, GraphDelta, GraphJournal
+from algpy_src.data_structures.graphs.graph_utils.incremental_adjacency_matrix import IncrementalAdjacencyMatrix
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
 from algpy_src.data_structures.graphs.graph_utils.no_feature_object import NoFeature
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
+from algpy_src.data_structures.graphs.graph_utils.read_write_lock import ReadWriteLock
 
 
 def test_no_edge() -> None:
@@ -53,3 +66,195 @@ def test_affects_adjacency_matrix(empty_digraph: DiGraph) -> None:
     affecting_subfunction(empty_digraph)
     assert empty_digraph.adjacency_matrix == [[NoEdge(), None], [NoEdge(), NoEdge()]]
     assert empty_digraph.n_ops == 4
+
+
+def test_incremental_adjacency_matrix() -> None:
+    matrix: IncrementalAdjacencyMatrix[int] = IncrementalAdjacencyMatrix({1: {2: 'Edge1'}, 2: {}}, initial_capacity=2)
+    assert matrix.capacity == 2
+    assert matrix.node_index == {1: 0, 2: 1}
+    assert matrix.to_list() == [[NoEdge(), 'Edge1'], [NoEdge(), NoEdge()]]
+    assert matrix.to_list() is matrix.to_list()
+
+    matrix.add_node(3)
+    matrix.set_entry(3, 1, 'Edge2')
+    assert matrix.capacity == 4
+    assert matrix.matrix.shape == (3, 3)
+    assert matrix.to_list() == [[NoEdge(), 'Edge1', NoEdge()], [NoEdge(), NoEdge(), NoEdge()], ['Edge2', NoEdge(), NoEdge()]]
+
+    matrix.delete_entry(1, 2)
+    matrix.remove_node(2)
+    assert matrix.node_index == {1: 0, 3: 1}
+    assert matrix.to_list() == [[NoEdge(), NoEdge()], ['Edge2', NoEdge()]]
+    cached_list = matrix.to_list()
+    matrix.remove_node(2)
+    assert matrix.node_index == {1: 0, 3: 1}
+    assert matrix.to_list() is cached_list
+    matrix.set_entry(1, 3, 'Edge3')
+    assert matrix.to_list() == [[NoEdge(), 'Edge3'], ['Edge2', NoEdge()]]
+
+
+def test_graph_journal() -> None:
+    journal = GraphJournal()
+    assert journal.version == 0
+    assert journal.deltas_since(0) == []
+    journal.record(GraphChangeKind.NODE_ADDED, 1)
+    journal.record(GraphChangeKind.EDGE_ADDED, 1, 1, 'Edge1')
+    assert journal.version == 2
+    assert len(journal) == 2
+    assert journal.deltas_since(1) == [GraphDelta(2, GraphChangeKind.EDGE_ADDED, 1, 1, 'Edge1')]
+    assert journal.deltas_since(2) == []
+    with pytest.raises(ValueError):
+        journal.deltas_since(3)
+
+    bounded_journal = GraphJournal(max_deltas=2)
+    for node in range(10):
+        bounded_journal.record(GraphChangeKind.NODE_ADDED, node)
+    assert bounded_journal.version == 10
+    assert 2 <= len(bounded_journal) < 4
+    assert bounded_journal.oldest_version == 10 - len(bounded_journal)
+    assert [delta.source for delta in bounded_journal.deltas_since(8)] == [8, 9]
+    with pytest.raises(ValueError):
+        bounded_journal.deltas_since(0)
+    with pytest.raises(ValueError):
+        GraphJournal(max_deltas=0)
+
+
+def test_node_interner() -> None:
+    interner: NodeInterner[str] = NodeInterner(['a', 'b', 'a'])
+    assert len(interner) == 2
+    assert list(interner) == ['a', 'b']
+    assert 'a' in interner and 'c' not in interner
+    assert interner.intern('c') == 2
+    assert interner.intern('a') == 0
+    assert interner.id_of('b') == 1
+    assert interner.node_of(2) == 'c'
+    assert interner.ids_of(['c', 'a']) == [2, 0]
+    assert interner.nodes_of([1, 1]) == ['b', 'b']
+    assert interner.nodes == ['a', 'b', 'c']
+    assert interner.ids == {'a': 0, 'b': 1, 'c': 2}
+    with pytest.raises(KeyError):
+        interner.id_of('d')
+    with pytest.raises(KeyError):
+        interner.node_of(3)
+
+    copied_interner = interner.copy()
+    copied_interner.intern('d')
+    assert len(interner) == 3
+    assert copied_interner != interner
+    assert NodeInterner(['a', 'b', 'c']) == interner
+
+
+def test_read_write_lock() -> None:
+    lock = ReadWriteLock()
+    with pytest.raises(RuntimeError):
+        lock.release_read()
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+
+    events: list[str] = []
+    second_reader_entered, second_reader_may_leave = threading.Event(), threading.Event()
+
+    def second_reader() -> None:
+        lock.acquire_read()
+        second_reader_entered.set()
+        second_reader_may_leave.wait(timeout=5)
+        lock.release_read()
+
+    def writer() -> None:
+        with lock.write_locked():
+            events.append('write')
+
+    def late_reader() -> None:
+        with lock.read_locked():
+            events.append('read')
+
+    # readers share the lock
+    lock.acquire_read()
+    second_reader_thread = threading.Thread(target=second_reader)
+    second_reader_thread.start()
+    assert second_reader_entered.wait(timeout=5)
+    lock.release_read()
+
+    # a waiting writer blocks new readers and enters once the remaining reader leaves
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    deadline = time.monotonic() + 5
+    while lock.waiting_writers == 0 and time.monotonic() < deadline:
+        second_reader_may_leave.wait(timeout=0.001)
+    assert lock.waiting_writers == 1
+    late_reader_thread = threading.Thread(target=late_reader)
+    late_reader_thread.start()
+    late_reader_thread.join(timeout=0.1)
+    assert late_reader_thread.is_alive() and events == []
+    second_reader_may_leave.set()
+    for thread in [second_reader_thread, writer_thread, late_reader_thread]:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert events == ['write', 'read']
+    assert lock.waiting_writers == 0
+
+    with lock.write_locked(), pytest.raises(RuntimeError):
+        lock.release_read()
+    with lock.read_locked():
+        pass
+
+
+def test_edge_entries() -> None:
+    assert edge_entry_size('Edge', is_multigraph=False) == 1
+    assert edge_entry_size({'Edge1': 1}, is_multigraph=False) == 1
+    assert edge_entry_size({0: 'Edge1', 1: 'Edge2'}, is_multigraph=True) == 2
+    assert edge_entry_size({'Edge1', 'Edge2'}, is_multigraph=True) == 2
+    assert edge_entry_size(NoEdge(), is_multigraph=True) == 0
+    assert list(single_edges_data({'Edge1': 1}, is_multigraph=False)) == [{'Edge1': 1}]
+    assert list(single_edges_data({0: 'Edge1', 1: 'Edge2'}, is_multigraph=True)) == ['Edge1', 'Edge2']
+
+    undirected_adjacency = {1: {2: {'a', 'b'}, 1: {'c'}}, 2: {1: {'a', 'b'}}}
+    assert count_edge_entries(((node, neighbourhood.items()) for node, neighbourhood in undirected_adjacency.items()), is_multigraph=True) == (5, 1)
+    assert number_of_edges_from_counts(5, 1, is_directed=False) == 3
+    assert number_of_edges_from_counts(5, 1, is_directed=True) == 5
+    assert collect_edges(((node, neighbourhood.items()) for node, neighbourhood in undirected_adjacency.items()), is_directed=False, is_multigraph=True) == {
+        (1, 2, 'a'), (1, 2, 'b'), (1, 1, 'c')
+    }
+
+
+def test_graph_fingerprint() -> None:
+    assert data_hash({'weight': [1, 2]}) == data_hash({'weight': [1, 2]})
+    assert data_hash({1, 2}) == data_hash({2, 1}) == data_hash(frozenset({1, 2}))
+    assert data_hash(bytearray(b'unhashable')) == 0
+    assert edge_entry_token(1, 2, {'a', 'b'}) == single_edge_token(1, 2, 'a') + single_edge_token(1, 2, 'b')
+    assert edge_entry_token(1, 2, {0: 'a'}) == single_edge_token(1, 2, 'a', key=0)
+    fingerprint = graph_fingerprint([(1, [(2, 'a')]), (2, [])])
+    assert fingerprint == graph_fingerprint([(2, []), (1, [(2, 'a')])])
+    assert fingerprint == (node_token(1) + node_token(2) + edge_entry_token(1, 2, 'a')) & FINGERPRINT_MASK
+    assert fingerprint != graph_fingerprint([(1, [(2, 'b')]), (2, [])])
+    assert 0 <= fingerprint < 2 ** 64
+
+
+def test_columnar_feature_store() -> None:
+    store: ColumnarFeatureStore = ColumnarFeatureStore(('x', 'y'), initial_capacity=1)
+    store.set('a', {'x': 1.0, 'y': 2.0})
+    store.set('b', {'x': 3.0})
+    store.set_batch(['c', 'a'], [5.0, 6.0], 'y')
+    assert len(store) == 3 and store.nodes == ['a', 'b', 'c']
+    assert store.get('a') == {'x': 1.0, 'y': 6.0} and store.get('b') == {'x': 3.0, 'y': 0.0} and store.get('d') == NoFeature()
+    assert store.get_batch(['c', 'b', 'a'], 'x').tolist() == [0.0, 3.0, 1.0]
+    assert store.to_dict() == {'a': {'x': 1.0, 'y': 6.0}, 'b': {'x': 3.0, 'y': 0.0}, 'c': {'x': 0.0, 'y': 5.0}}
+
+    store.remove('a')
+    store.remove('d')
+    assert store.nodes == ['c', 'b'] and store.rows_of(['b', 'c']).tolist() == [1, 0]
+    assert store.column('y').tolist() == [5.0, 0.0]
+    with pytest.raises(ValueError):
+        store.column('x')[0] = 1.0
+    with pytest.raises(ValueError):
+        store.get_batch(['b'])
+    with pytest.raises(KeyError):
+        store.get_batch(['a'], 'x')
+    with pytest.raises(KeyError):
+        store.set('b', {'z': 1.0})
+
+    int_store: ColumnarFeatureStore = ColumnarFeatureStore(dtype=np.int64)
+    int_store.set_batch(range(3), 7)
+    assert int_store.get(2) == 7 and isinstance(int_store.get(2), int) and int_store.to_dict() == {0: 7, 1: 7, 2: 7}
+    with pytest.raises(ValueError):
+        ColumnarFeatureStore(())
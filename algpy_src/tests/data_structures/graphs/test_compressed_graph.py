@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from algpy_src.data_structures.graphs.compressed_graph import CompressedGraph
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
+
+
+@pytest.fixture
+def compressed_digraph() -> CompressedGraph:
+    return DiGraph({'a': {'c': 3, 'b': 1}, 'b': {'c': 1}, 'c': {'a': 4}, 'd': {'d': 2}}).compress(block_size=3)
+
+
+class TestCompressedGraph:
+
+    def test_compressed_graph_base(self, compressed_digraph: CompressedGraph) -> None:
+        assert compressed_digraph.name == 'Compressed Graph'
+        assert compressed_digraph.space_complexity == 'V + E'
+        assert compressed_digraph.is_directed is True
+        assert compressed_digraph.is_multigraph is False
+        assert compressed_digraph.block_size == 3
+        assert compressed_digraph.nodes == ['a', 'b', 'c', 'd']
+        assert compressed_digraph.has_node('d') and not compressed_digraph.has_node('e')
+        assert compressed_digraph.number_of_nodes == 4
+        assert compressed_digraph.number_of_edges == 5
+        assert compressed_digraph.node_interner.id_of('c') == 2
+
+    def test_compressed_graph_read_interface(self, compressed_digraph: CompressedGraph) -> None:
+        assert compressed_digraph.neighbors('a') == ['b', 'c']
+        assert compressed_digraph.neighbors('c') == ['a']
+        assert compressed_digraph.neighbors('d') == ['d']
+        assert compressed_digraph.neighbors('e') == []
+        assert compressed_digraph.has_edge('a', 'c') and not compressed_digraph.has_edge('c', 'b')
+        with pytest.raises(KeyError):
+            compressed_digraph.has_edge('a', 'e')
+        assert compressed_digraph.outdegree('a') == 2
+        assert compressed_digraph.outdegree('b') == 1
+        assert compressed_digraph.adjacency_list == {'a': {'b': None, 'c': None}, 'b': {'c': None}, 'c': {'a': None}, 'd': {'d': None}}
+
+    def test_compressed_graph_round_trip(self) -> None:
+        rng = np.random.default_rng(0)
+        n_nodes = 500
+        sources = rng.integers(0, n_nodes, 3000)
+        # wide range of neighbour id gaps, both before and after the node, to exercise multi-byte varints
+        targets = (sources + rng.integers(-n_nodes, n_nodes, 3000) * rng.integers(0, 2, 3000)) % n_nodes
+        for graph_class in [DiGraph, Graph]:
+            graph = graph_class.from_edge_arrays(sources, targets, nodes=range(n_nodes))
+            for block_size in [1, 7, 64]:
+                compressed_graph = CompressedGraph.from_graph(graph, block_size)
+                assert compressed_graph.is_directed is graph.is_directed
+                assert compressed_graph.number_of_edges == graph.number_of_edges
+                assert all(compressed_graph.neighbors(node) == sorted(graph.neighbors(node)) for node in graph.nodes)
+                assert compressed_graph == CompressedGraph.from_graph(graph.freeze(), 5)
+
+    def test_compressed_graph_memory(self) -> None:
+        rng = np.random.default_rng(0)
+        n_nodes, n_edges = 10_000, 100_000
+        sources = rng.integers(0, n_nodes, n_edges)
+        targets = (sources + rng.integers(1, 50, n_edges)) % n_nodes
+        frozen_graph = DiGraph.from_edge_arrays(sources, targets, nodes=range(n_nodes)).freeze()
+        compressed_graph = CompressedGraph.from_graph(frozen_graph)
+        assert 3 * compressed_graph.nbytes < frozen_graph.indptr.nbytes + frozen_graph.indices.nbytes
+
+    def test_compressed_graph_errors(self) -> None:
+        assert DiGraph().compress().number_of_nodes == 0
+        with pytest.raises(ValueError):
+            DiGraph({1: {2: None}}).compress(block_size=0)
+        with pytest.raises(ValueError):
+            MultiDiGraph({1: {2: {None}}}).compress()
@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from algpy_src.base.constants import FlowEdgeData
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.flow_network import FlowNetwork
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
+
+
+@pytest.fixture
+def frozen_digraph() -> CSRGraph:
+    return DiGraph({'a': {'c': 3, 'b': 1}, 'b': {'c': 1}, 'c': {}, 'd': {'d': 2}}).freeze()
+
+
+class TestCSRGraph:
+
+    def test_csr_graph_base(self, frozen_digraph: CSRGraph) -> None:
+        assert frozen_digraph.name == 'CSR Graph'
+        assert frozen_digraph.space_complexity == 'V + E'
+        assert frozen_digraph.is_directed is True
+        assert frozen_digraph.is_multigraph is False
+        assert frozen_digraph.nodes == ['a', 'b', 'c', 'd']
+        assert frozen_digraph.number_of_nodes == 4
+        assert frozen_digraph.number_of_edges == 4
+
+    def test_csr_graph_arrays(self, frozen_digraph: CSRGraph) -> None:
+        assert frozen_digraph.indptr.tolist() == [0, 2, 3, 3, 4]
+        assert frozen_digraph.indices.tolist() == [1, 2, 2, 3]
+        assert frozen_digraph.weights.tolist() == [1, 3, 1, 2]
+        assert frozen_digraph.weights.dtype == np.int64
+        assert frozen_digraph.node_id('c') == 2
+        assert frozen_digraph.node_interner.node_of(2) == 'c'
+        with pytest.raises(KeyError):
+            frozen_digraph.node_id('e')
+
+    def test_csr_graph_read_interface(self, frozen_digraph: CSRGraph) -> None:
+        assert frozen_digraph.neighbors('a') == ['b', 'c']
+        assert frozen_digraph.neighbors('c') == []
+        assert frozen_digraph.neighbors('e') == []
+        assert frozen_digraph.get_edge_data('a', 'c') == 3
+        assert isinstance(frozen_digraph.get_edge_data('a', 'c'), int)
+        assert frozen_digraph.get_edge_data('c', 'a') == NoEdge()
+        assert frozen_digraph.outdegree('a') == 2
+        assert list(frozen_digraph.iter_out_edges('a')) == [('b', 1), ('c', 3)]
+        assert list(frozen_digraph.iter_out_edges('e')) == []
+        with pytest.raises(KeyError):
+            frozen_digraph.get_edge_data('a', 'e')
+        assert frozen_digraph.adjacency_list == {'a': {'b': 1, 'c': 3}, 'b': {'c': 1}, 'c': {}, 'd': {'d': 2}}
+
+    def test_csr_graph_undirected(self) -> None:
+        graph = Graph({1: {2: None, 3: None}, 3: {3: None}})
+        frozen_graph = graph.freeze()
+        assert frozen_graph.is_directed is False
+        assert frozen_graph.number_of_edges == 3
+        assert frozen_graph.weights.dtype == object
+        assert frozen_graph.neighbors(3) == [1, 3]
+        assert frozen_graph.thaw() == graph
+        assert frozen_graph.thaw().number_of_edges == 3
+
+    def test_csr_graph_large_integer_weights(self) -> None:
+        digraph: DiGraph[str, int] = DiGraph({'a': {'b': 2 ** 63, 'c': -2 ** 63}, 'b': {'c': 2 ** 63 - 1}, 'c': {}})
+        frozen_digraph = digraph.freeze()
+        assert frozen_digraph.weights.dtype == object
+        assert frozen_digraph.get_edge_data('a', 'b') == 2 ** 63
+        assert frozen_digraph.thaw() == digraph
+        assert DiGraph({'a': {'b': 2 ** 63 - 1, 'c': -2 ** 63}, 'c': {}}).freeze().weights.dtype == np.int64
+        # mixed numeric data are stored as floats only if no integer loses precision
+        assert DiGraph({'a': {'b': 0.5, 'c': 2 ** 53}, 'c': {}}).freeze().weights.dtype == np.float64
+        assert DiGraph({'a': {'b': 0.5, 'c': 2 ** 53 + 1}, 'c': {}}).freeze().get_edge_data('a', 'c') == 2 ** 53 + 1
+
+    def test_csr_graph_thaw_flow_network(self) -> None:
+        flow_network: FlowNetwork[int] = FlowNetwork({0: {1: FlowEdgeData(0, 0, 5)}, 1: {}}, source=0, sink=1)
+        thawed = flow_network.freeze().thaw(FlowNetwork, source=0, sink=1)
+        assert thawed == flow_network
+
+    def test_csr_graph_binary_format(self, frozen_digraph: CSRGraph, tmp_path: Path) -> None:
+        frozen_digraph.save_binary(tmp_path / 'digraph')
+        loaded = CSRGraph.load_binary(tmp_path / 'digraph')
+        assert isinstance(loaded.indices, np.memmap)
+        assert isinstance(loaded.weights, np.memmap)
+        assert loaded == frozen_digraph
+        assert loaded.number_of_edges == 4
+        assert loaded.get_edge_data('a', 'c') == 3
+        assert list(loaded.iter_out_edges('a')) == [('b', 1), ('c', 3)]
+        assert not isinstance(CSRGraph.load_binary(tmp_path / 'digraph', mmap=False).indices, np.memmap)
+
+        graph = Graph({(0, 0): {(0, 1): None}, (0, 1): {(1, 1): None}})
+        graph.save_binary(tmp_path / 'graph')
+        with pytest.raises(ValueError, match='allow_pickle'):
+            Graph.load_binary(tmp_path / 'graph')
+        assert Graph.load_binary(tmp_path / 'graph', allow_pickle=True) == graph
+        assert CSRGraph.load_binary(tmp_path / 'graph', allow_pickle=True).neighbors((0, 1)) == [(0, 0), (1, 1)]
+        # a pickled table is not unpickled without allow_pickle even if the metadata does not record it
+        metadata = json.loads((tmp_path / 'graph' / 'metadata.json').read_text())
+        (tmp_path / 'graph' / 'metadata.json').write_text(json.dumps(metadata | {'pickled': False}))
+        with pytest.raises(ValueError):
+            CSRGraph.load_binary(tmp_path / 'graph')
+
+        float_digraph = DiGraph({'a': {'b': 0.5}, 'b': {'b': 1.5}})
+        float_digraph.save_binary(tmp_path / 'float_digraph')
+        assert DiGraph.load_binary(tmp_path / 'float_digraph') == float_digraph
+
+    def test_csr_graph_binary_format_node_tables(self, tmp_path: Path) -> None:
+        large_int_digraph: DiGraph[int, int] = DiGraph({2 ** 63: {-2 ** 63 - 1: 1}, -2 ** 63 - 1: {1: 2}, 1: {}})
+        large_int_digraph.save_binary(tmp_path / 'large_int_digraph')
+        assert np.load(tmp_path / 'large_int_digraph' / 'nodes.npy', allow_pickle=True).dtype == object
+        assert DiGraph.load_binary(tmp_path / 'large_int_digraph', allow_pickle=True) == large_int_digraph
+
+        null_str_digraph: DiGraph[str, int] = DiGraph({'a\x00': {'a': 1}, 'a': {'\x00b\x00\x00': 2}, '\x00b\x00\x00': {}})
+        null_str_digraph.save_binary(tmp_path / 'null_str_digraph')
+        assert np.load(tmp_path / 'null_str_digraph' / 'nodes.npy', allow_pickle=True).dtype == object
+        assert DiGraph.load_binary(tmp_path / 'null_str_digraph', allow_pickle=True) == null_str_digraph
+
+        str_digraph: DiGraph[str, int] = DiGraph({'a\x00b': {'a': 1}, 'a': {}})
+        str_digraph.save_binary(tmp_path / 'str_digraph')
+        assert np.load(tmp_path / 'str_digraph' / 'nodes.npy').dtype.kind == 'U'
+        assert DiGraph.load_binary(tmp_path / 'str_digraph') == str_digraph
+
+    def test_csr_graph_binary_format_flow_network(self, tmp_path: Path) -> None:
+        flow_network: FlowNetwork[str] = FlowNetwork({'s': {'a': FlowEdgeData(0, None, 5)}, 'a': {'t': FlowEdgeData(1, 2, float('inf'))}},
+                                                     source='s', sink='t')
+        flow_network.save_binary(tmp_path)
+        loaded: FlowNetwork[str] = FlowNetwork.load_binary(tmp_path)
+        assert loaded == flow_network
+        assert (loaded.source, loaded.sink) == ('s', 't')
+        assert loaded.get_edge_data('s', 'a') == FlowEdgeData(0, None, 5)
+        assert CSRGraph.load_binary(tmp_path).graph_attributes == {'source': 's', 'sink': 't'}
+        assert FlowNetwork.load_binary(tmp_path, sink='a').sink == 'a'
+        assert np.load(tmp_path / 'flows.npy').dtype == np.int64
+        edge_data = loaded.get_edge_data('a', 't')
+        assert isinstance(edge_data, FlowEdgeData) and type(edge_data.flow) is int
+
+    def test_csr_graph_equality(self, frozen_digraph: CSRGraph) -> None:
+        assert frozen_digraph == DiGraph({'a': {'b': 1, 'c': 3}, 'b': {'c': 1}, 'c': {}, 'd': {'d': 2}}).freeze()
+        assert frozen_digraph != DiGraph({'a': {'b': 1, 'c': 4}, 'b': {'c': 1}, 'c': {}, 'd': {'d': 2}}).freeze()
+
+    def test_csr_graph_rejects_multigraph(self) -> None:
+        with pytest.raises(ValueError):
+            MultiDiGraph({1: {2: {'a', 'b'}}}).freeze()
+
+    def test_csr_graph_memory_footprint(self) -> None:
+        digraph: DiGraph[int, int] = DiGraph({node: {node + 1: 1000 + node} for node in range(1000)})
+        frozen_digraph = digraph.freeze()
+        footprint = frozen_digraph.memory_footprint()
+        assert {'instance', 'nodes', 'node_table', 'indptr', 'indices', 'weights'} <= set(footprint.components)
+        assert footprint.components['indices'] >= frozen_digraph.indices.nbytes
+        assert footprint.components['weights'] >= frozen_digraph.weights.nbytes
+        assert footprint.total < digraph.memory_footprint().total
@@ -1,7 +1,11 @@
+import numpy as np
 import pytest
 
 from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph_utils.graph_fingerprint import graph_fingerprint
+from algpy_src.data_structures.graphs.graph_utils.graph_journal import GraphChangeKind, GraphDelta
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_utils.nodes_view import NodesView
 
 
 @pytest.fixture
@@ -129,3 +133,200 @@ class TestDiGraph:
         g.remove_nodes_from([1, 2, 3])
         assert g.adjacency_list == {}
         assert g.edges == set()
+
+    def test_digraph_incremental_adjacency_matrix(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        assert g.has_incremental_adjacency_matrix is False
+        g.enable_incremental_adjacency_matrix()
+        assert g.has_incremental_adjacency_matrix is True
+        assert g.adjacency_matrix == [[NoEdge(), 'Edge1', NoEdge()], [NoEdge(), NoEdge(), 'Edge2'], [NoEdge(), NoEdge(), NoEdge()]]
+
+        g.add_edge((3, 4, 'Edge3'))
+        g.add_edge((1, 2, 'Edge4'))
+        g.remove_edge(2, 3)
+        g.remove_node(1)
+        assert g.adjacency_matrix_array.shape == (3, 3)
+        assert g.adjacency_matrix == [[NoEdge(), NoEdge(), NoEdge()], [NoEdge(), NoEdge(), 'Edge3'], [NoEdge(), NoEdge(), NoEdge()]]
+        assert g.adjacency_matrix is g.adjacency_matrix
+        assert g.n_ops == 0
+        g.add_edge((4, 2, 'Edge5'))
+        assert g.adjacency_matrix == [[NoEdge(), NoEdge(), NoEdge()], [NoEdge(), NoEdge(), 'Edge3'], ['Edge5', NoEdge(), NoEdge()]]
+        g.remove_edge(4, 2)
+
+        g.disable_incremental_adjacency_matrix()
+        assert g.adjacency_matrix == [[NoEdge(), NoEdge(), NoEdge()], [NoEdge(), NoEdge(), 'Edge3'], [NoEdge(), NoEdge(), NoEdge()]]
+        assert g.adjacency_matrix_array.tolist() == g.adjacency_matrix
+
+    def test_digraph_reverse_adjacency_maintained(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        assert g.in_neighbors(3) == {2}
+        assert g.in_neighbors(4) == set()
+
+        g.add_edge((1, 3, 'Edge3'))
+        g.add_edge((4, 1, 'Edge4'))
+        assert g.adjacency_list_transposed == {1: {4: 'Edge4'}, 2: {1: 'Edge1'}, 3: {2: 'Edge2', 1: 'Edge3'}, 4: {}}
+        assert g.in_neighbors(3) == {1, 2}
+        assert g.indegree(3) == 2
+
+        g.add_edge((1, 3, 'Edge5'))
+        assert g.adjacency_list_transposed[3] == {2: 'Edge2', 1: 'Edge5'}
+        g.remove_edge(2, 3)
+        assert g.adjacency_list_transposed[3] == {1: 'Edge5'}
+        g.remove_node(1)
+        assert g.adjacency_list_transposed == {2: {}, 3: {}, 4: {}}
+        assert g.adjacency_list == {2: {}, 3: {}, 4: {}}
+        assert g.edges == set()
+
+    def test_digraph_nodes_view(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        nodes = g.nodes
+        assert isinstance(nodes, NodesView)
+        assert g.has_node(1) is True
+        assert g.has_node(4) is False
+        assert 4 not in nodes
+        assert [] not in nodes
+
+        g.add_node(4)
+        assert 4 in nodes
+        assert len(nodes) == 4
+        assert nodes == [1, 2, 3, 4]
+        assert nodes == {4, 3, 2, 1}
+        assert nodes != [4, 3, 2, 1]
+        g.remove_node(1)
+        assert list(nodes) == [2, 3, 4]
+
+    def test_digraph_from_edge_arrays(self, filled_digraph: DiGraph) -> None:
+        g: DiGraph = DiGraph.from_edge_arrays(np.array([1, 2, 1]), np.array([2, 3, 2]), ['Edge0', 'Edge2', 'Edge1'])
+        assert g == filled_digraph
+        assert g.edges == filled_digraph.edges
+        assert g.adjacency_list_transposed == filled_digraph.adjacency_list_transposed
+        assert all(type(node) is int for node in g.nodes)
+
+        g = DiGraph.from_edge_list([(1, 2, 'Edge1'), (2, 3, 'Edge2')], nodes=[4, 3])
+        assert g.nodes == [4, 3, 1, 2]
+        assert g.number_of_edges == 2
+
+        assert DiGraph.from_edge_arrays([1, 2], [2, 1]).edges == {(1, 2, None), (2, 1, None)}
+        with pytest.raises(ValueError):
+            DiGraph.from_edge_arrays([1, 2], [2], ['Edge1', 'Edge2'])
+
+    def test_digraph_without_stored_edges(self, filled_digraph: DiGraph) -> None:
+        g = DiGraph({1: {2: 'Edge1'}, 2: {3: 'Edge2'}, 3: {}}, store_edges=False)
+        assert g.stores_edges is False
+        assert filled_digraph.stores_edges is True
+        assert g == filled_digraph
+        assert g.edges == filled_digraph.edges
+        assert g.number_of_edges == 2
+
+        g.add_edge((1, 2, 'Edge3'))
+        g.add_edge((3, 3, 'Edge4'))
+        assert g.number_of_edges == 3
+        assert g.edges == {(1, 2, 'Edge3'), (2, 3, 'Edge2'), (3, 3, 'Edge4')}
+        g.remove_node(2)
+        assert g.number_of_edges == 1
+        assert g.edges == {(3, 3, 'Edge4')}
+
+    def test_digraph_neighbour_views(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        neighbours = g.neighbors(1)
+        in_neighbours = g.in_neighbors(3)
+        assert neighbours == {2}
+        assert g.neighbors(4) == set()
+        assert list(g.iter_out_edges(1)) == [(2, 'Edge1')]
+        assert list(g.iter_in_edges(3)) == [(2, 'Edge2')]
+        assert list(g.iter_out_edges(4)) == []
+
+        g.add_edge((1, 3, 'Edge3'))
+        assert neighbours == {2, 3}
+        assert in_neighbours == {1, 2}
+        assert list(g.iter_in_edges(3)) == [(2, 'Edge2'), (1, 'Edge3')]
+        assert g.neighbors(4) == set()
+
+    def test_digraph_journal(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        with pytest.raises(ValueError):
+            g.deltas_since(0)
+        journal = g.enable_journal()
+        assert g.enable_journal() is journal
+        assert g.version == 0
+
+        g.add_edge((1, 4, 'Edge3'))
+        g.add_edge((1, 2, 'Edge4'))
+        version = g.version
+        g.remove_node(1)
+        assert g.deltas_since(0)[:version] == [
+            GraphDelta(1, GraphChangeKind.NODE_ADDED, 4),
+            GraphDelta(2, GraphChangeKind.EDGE_ADDED, 1, 4, 'Edge3'),
+            GraphDelta(3, GraphChangeKind.EDGE_DATA_CHANGED, 1, 2, 'Edge4', 'Edge1'),
+        ]
+        assert {(delta.kind, delta.source, delta.target) for delta in g.deltas_since(version)} == {
+            (GraphChangeKind.EDGE_REMOVED, 1, 2), (GraphChangeKind.EDGE_REMOVED, 1, 4), (GraphChangeKind.NODE_REMOVED, 1, None),
+        }
+        assert g.deltas_since(version)[-1].kind == GraphChangeKind.NODE_REMOVED
+
+        g.disable_journal()
+        assert g.journal is None
+        with pytest.raises(ValueError):
+            _ = g.version
+
+    def test_digraph_node_interner(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        interner = g.node_interner
+        assert interner.nodes == [1, 2, 3]
+        assert g.node_interner is interner
+        g.add_edge((4, 1, 'Edge3'))
+        assert interner.id_of(4) == 3
+        g.remove_node(2)
+        assert g.node_interner is not interner
+        assert g.node_interner.nodes == [1, 3, 4]
+        assert g.node_interner.ids_of(g.nodes) == [0, 1, 2]
+
+    def test_digraph_memory_footprint(self) -> None:
+        small = DiGraph({node: {node + 1: 1000 + node} for node in range(10)})
+        large = DiGraph({node: {node + 1: 1000 + node} for node in range(1000)})
+        small_footprint, large_footprint = small.memory_footprint(), large.memory_footprint()
+        for component in ('instance', 'nodes', 'edge_data', 'adjacency_dicts', 'predecessor_dicts', 'edge_tuples', 'adjacency_matrix', 'node_interner'):
+            assert component in large_footprint.components
+        assert large_footprint.total == sum(large_footprint.components.values())
+        for component in ('nodes', 'edge_data', 'adjacency_dicts', 'predecessor_dicts', 'edge_tuples'):
+            assert large_footprint.components[component] > 50 * small_footprint.components[component]
+        assert large_footprint.components['node_interner'] == 0
+        _ = large.node_interner
+        assert large.memory_footprint().components['node_interner'] > 0
+        assert DiGraph({node: {node + 1: 1000 + node} for node in range(1000)}, store_edges=False).memory_footprint().components['edge_tuples'] == 0
+
+    def test_digraph_fingerprint(self, filled_digraph: DiGraph) -> None:
+        g = filled_digraph
+        fingerprint = g.fingerprint()
+        assert fingerprint == DiGraph({3: {}, 2: {3: 'Edge2'}, 1: {2: 'Edge1'}}).fingerprint()
+        assert hash(g) == hash(DiGraph({1: {2: 'Edge1'}, 2: {3: 'Edge2'}, 3: {}}))
+        g.add_edge((3, 4, ('Edge5', 1)))
+        g.add_edge((1, 2, 'Edge3'))
+        g.remove_edge(2, 3)
+        g.add_node(5)
+        g.remove_node(1)
+        assert g.fingerprint() == graph_fingerprint((node, neighbourhood.items()) for node, neighbourhood in g.adjacency_list.items())
+        g.remove_node(5)
+        g.add_edge((1, 2, 'Edge1'))
+        g.add_edge((2, 3, 'Edge2'))
+        g.remove_edge(3, 4)
+        g.remove_node(4)
+        assert g.fingerprint() == fingerprint
+
+        # graphs with different maintained fingerprints are unequal without comparing their adjacency
+        other = DiGraph({1: {2: 'Edge1'}, 2: {3: 'Edge2'}, 3: {}})
+        assert g == other
+        other.fingerprint()
+        other.add_edge((3, 1, 'Edge4'))
+        assert g != other
+        other.remove_edge(3, 1)
+        assert g == other
+        assert {g: 'result'}[other] == 'result'
+        assert g.snapshot().fingerprint() == fingerprint
+
+        lean_graph: DiGraph = DiGraph({1: {2: {'weight': [1, 2]}}, 2: {}}, store_edges=False)
+        lean_fingerprint = lean_graph.fingerprint()
+        lean_graph.add_edge((1, 2, {'weight': [1, 3]}))
+        assert lean_graph.fingerprint() != lean_fingerprint
+        lean_graph.add_edge((1, 2, {'weight': [1, 2]}))
+        assert lean_graph.fingerprint() == lean_fingerprint
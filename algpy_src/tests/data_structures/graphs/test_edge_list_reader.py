@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from algpy_src.base.constants import FlowEdgeData
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.edge_list_reader import EdgeListReader, parse_number
+from algpy_src.data_structures.graphs.flow_network import FlowNetwork
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
+
+
+@pytest.fixture
+def edge_list_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'edges.txt'
+    path.write_text('# source target weight\n1 2 5\n2\t3 0.5\n\n3 1 7\n1 2 4\n', encoding='utf-8')
+    return path
+
+
+class TestEdgeListReader:
+
+    def test_parse_number(self) -> None:
+        assert parse_number('3') == 3 and isinstance(parse_number('3'), int)
+        assert parse_number('3.0') == 3.0 and isinstance(parse_number('3.0'), float)
+        assert parse_number('inf') == float('inf')
+
+    def test_edge_list_reader_chunks(self, edge_list_file: Path) -> None:
+        reader: EdgeListReader[int] = EdgeListReader(edge_list_file, data_format='weight', node_type=int, chunk_size=3)
+        chunks = list(reader.iter_chunks())
+        assert chunks == [([1, 2, 3], [2, 3, 1], [5, 0.5, 7]), ([1], [2], [4])]
+        assert reader.nodes == [1, 2, 3]
+
+        reader = EdgeListReader(edge_list_file, node_type=int, chunk_size=2)
+        assert list(reader.iter_edges()) == [(1, 2, None), (2, 3, None), (3, 1, None), (1, 2, None)]
+
+    def test_edge_list_reader_interns_nodes(self, edge_list_file: Path) -> None:
+        reader: EdgeListReader[str] = EdgeListReader(edge_list_file, chunk_size=1)
+        edges = list(reader.iter_edges())
+        assert edges[0][0] is edges[2][1] is edges[3][0]
+
+    def test_edge_list_reader_load(self, edge_list_file: Path) -> None:
+        reader: EdgeListReader[int] = EdgeListReader(edge_list_file, data_format='weight', node_type=int, chunk_size=2)
+        expected_adjacency_list: dict[int, dict[int, int | float]] = {1: {2: 4}, 2: {3: 0.5}, 3: {1: 7}}
+        assert reader.load(DiGraph) == DiGraph(expected_adjacency_list)
+        assert reader.load(DiGraph, nodes=[0], store_edges=False).nodes == [0, 1, 2, 3]
+        assert reader.load(Graph).number_of_edges == 3
+        assert reader.load(MultiDiGraph).get_edge_data(1, 2) == {4, 5}
+
+    def test_edge_list_reader_without_comments(self, tmp_path: Path) -> None:
+        path = tmp_path / 'edges.txt'
+        path.write_text('#1 2\n2 #1\n\n', encoding='utf-8')
+        for comment in ('', None):
+            reader: EdgeListReader[str] = EdgeListReader(path, comment=comment)
+            assert list(reader.iter_edges()) == [('#1', '2', None), ('2', '#1', None)]
+        assert list(EdgeListReader(path).iter_edges()) == [('2', '#1', None)]
+
+    def test_edge_list_reader_csv_flow_network(self, tmp_path: Path) -> None:
+        path = tmp_path / 'flows.csv'
+        path.write_text('from,to,lower,flow,upper\ns,a,0,,5\na,t,1,2,inf\n"s",t,0,None,3\n', encoding='utf-8')
+        reader: EdgeListReader[str] = EdgeListReader(path, delimiter=',', has_header=True, data_format='flow')
+        flow_network: FlowNetwork[str] = reader.load(FlowNetwork, source='s', sink='t')
+        assert flow_network.adjacency_list == {
+            's': {'a': FlowEdgeData(0, None, 5), 't': FlowEdgeData(0, None, 3)}, 'a': {'t': FlowEdgeData(1, 2, float('inf'))}, 't': {},
+        }
+
+    def test_edge_list_reader_errors(self, tmp_path: Path) -> None:
+        path = tmp_path / 'edges.txt'
+        path.write_text('1 2 3\n2 3\n', encoding='utf-8')
+        with pytest.raises(ValueError, match='Line 2'):
+            list(EdgeListReader(path, data_format='weight').iter_edges())
+        with pytest.raises(ValueError):
+            EdgeListReader(path, data_format='flow', data_columns=[2])
+        with pytest.raises(ValueError):
+            EdgeListReader(path, chunk_size=0)
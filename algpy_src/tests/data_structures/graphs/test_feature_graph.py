@@ -1,7 +1,10 @@
+from typing import Optional
+
 import pytest
 
 from algpy_src.base.constants import Edge
 from algpy_src.data_structures.graphs.feature_graph import FeatureGraph
+from algpy_src.data_structures.graphs.graph_utils.no_feature_object import NoFeature
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
 
 
@@ -46,3 +49,43 @@ def test_basic_methods(line_feature_graph_with_features: FeatureGraph) -> None:
 
     line_feature_graph_with_features.remove_node(6)
     assert line_feature_graph_with_features.get_node_features(6) == NoNode()
+
+
+def test_columnar_features() -> None:
+    fg: FeatureGraph = FeatureGraph({1: {2: 1}}, node_features={1: 0.5, 3: 1.0}, feature_columns=('label',))
+    assert fg.nodes == {1, 2, 3} and fg.get_node_features(1) == 0.5 and fg.get_node_features(2) == NoFeature()
+    assert fg.get_node_features(4) == NoNode()
+    assert fg == FeatureGraph({1: {2: 1}}, node_features={1: 0.5, 3: 1.0})
+
+    fg.set_node_features_batch([2, 3], [0.25, 0.75])
+    assert fg.get_node_features_batch([3, 2, 1]).tolist() == [0.75, 0.25, 0.5]
+    assert fg.node_features == {1: 0.5, 2: 0.25, 3: 0.75}
+    with pytest.raises(ValueError):
+        fg.set_node_features_batch([4], [1.0])
+
+    fg.remove_node(1)
+    assert fg.node_features == {2: 0.25, 3: 0.75} and fg.feature_store is not None and len(fg.feature_store) == 2
+
+    multi_fg: FeatureGraph = FeatureGraph(feature_columns=('x', 'y'))
+    multi_fg.add_node_with_features('a', {'x': 1.0, 'y': 2.0})
+    multi_fg.set_node_features_batch(['a'], 3.0, 'y')
+    assert multi_fg.get_node_features('a') == {'x': 1.0, 'y': 3.0}
+
+
+def test_batch_features_without_columns(line_feature_graph_with_features: FeatureGraph) -> None:
+    line_feature_graph_with_features.set_node_features_batch([1, 2], ['10', '20'])
+    line_feature_graph_with_features.set_node_features_batch([3, 4], '0')
+    assert line_feature_graph_with_features.get_node_features_batch([1, 2, 3, 4, 5]).tolist() == ['10', '20', '0', '0', '5']
+    assert line_feature_graph_with_features.feature_store is None
+
+
+@pytest.mark.parametrize('feature_columns', [None, ('label',)])
+def test_writing_features_keeps_adjacency_matrix(feature_columns: Optional[tuple[str, ...]]) -> None:
+    fg: FeatureGraph = FeatureGraph({1: {2: 1}}, feature_columns=feature_columns)
+    adjacency_matrix = fg.adjacency_matrix
+    fg.add_node_with_features(1, 1.0)
+    fg.set_node_features_batch([1, 2], [0.0, 1.0])
+    assert fg._adjacency_matrix_is_actual and fg.adjacency_matrix is adjacency_matrix
+
+    fg.add_node_with_features(3, 1.0)
+    assert not fg._adjacency_matrix_is_actual
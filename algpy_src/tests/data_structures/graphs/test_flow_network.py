@@ -3,6 +3,7 @@ import pytest
 from algpy_src.base.constants import FlowEdgeData, Edge, Node
 from algpy_src.data_structures.graphs.flow_network import FlowNetwork
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.residual_network import ResidualNetwork
 
 
 @pytest.fixture
@@ -108,3 +109,65 @@ def test_basic_methods(line_flow_network_valid_flow: FlowNetwork[int]) -> None:
     line_flow_network_valid_flow.change_flow_between_nodes(1, 2, 5)
     with pytest.raises(ValueError):
         line_flow_network_valid_flow.check_flow_validity()
+
+
+def test_flow_network_from_edge_list(line_flow_network_no_flow: FlowNetwork[int]) -> None:
+    flow_network: FlowNetwork[int] = FlowNetwork.from_edge_list(line_flow_network_no_flow.edges, nodes=line_flow_network_no_flow.nodes, source=1, sink=5)
+    assert flow_network == line_flow_network_no_flow
+    assert flow_network.max_lower_bound == line_flow_network_no_flow.max_lower_bound
+
+
+def test_set_flows(line_flow_network_no_flow: FlowNetwork[int]) -> None:
+    line_flow_network_no_flow.set_flows([(1, 2, 5), (2, 3, 5), (3, 4, 100), (2, 1, 5)])
+    assert line_flow_network_no_flow.get_edge_data(1, 2) == FlowEdgeData(0, 5, 10)
+    assert line_flow_network_no_flow.get_edge_data(2, 3) == FlowEdgeData(0, 5, 10)
+    assert line_flow_network_no_flow.get_edge_data(3, 4) == FlowEdgeData(0, None, 10)
+    assert line_flow_network_no_flow.get_edge_data(2, 1) == NoEdge()
+    assert (1, 2, FlowEdgeData(0, 5, 10)) in line_flow_network_no_flow.edges
+    assert (1, 2, FlowEdgeData(0, None, 10)) not in line_flow_network_no_flow.edges
+
+
+def test_incremental_node_balances(line_flow_network_valid_flow: FlowNetwork[int]) -> None:
+    fn = line_flow_network_valid_flow
+    assert fn.current_flow == 5 and [fn.get_node_balance(node) for node in range(1, 6)] == [-5, 0, 0, 0, 5]
+    expect_valid_flow(fn)
+
+    fn.change_flow_between_nodes(2, 3, 7)
+    assert fn.get_node_balance(2) == -2 and fn.get_node_balance(3) == 2
+    with pytest.raises(ValueError):
+        fn.check_flow_validity()
+    fn.set_flows([(1, 2, 7), (3, 4, 7), (4, 5, 7)])
+    assert fn.current_flow == 7
+    expect_valid_flow(fn)
+
+    fn.add_edge((1, 6, FlowEdgeData(0, 11, 10)))
+    assert fn.get_node_balance(6) == 11 and fn.current_flow == 18
+    with pytest.raises(ValueError, match='outside the bounds'):
+        fn.check_flow_validity()
+    fn.remove_node(6)
+    assert fn.current_flow == 7
+    expect_valid_flow(fn)
+
+    fn.remove_edge(2, 3, FlowEdgeData(0, 7, 10))
+    assert fn.get_node_balance(2) == 7 and fn.get_node_balance(3) == -7
+    with pytest.raises(ValueError, match="Kirchhoff's law"):
+        fn.check_flow_validity()
+
+    with pytest.raises(ValueError, match='outside the bounds'):
+        FlowNetwork({1: {2: FlowEdgeData(0, 11, 10)}}, source=1, sink=2, check_input_flow_validity=True)
+
+
+def test_mixed_magnitude_float_flows() -> None:
+    fn: FlowNetwork[int] = FlowNetwork({
+        0: {1: FlowEdgeData(0, 1e17, 1e18), 3: FlowEdgeData(0, 0.5, 1)}, 3: {1: FlowEdgeData(0, 0.5, 1)},
+        1: {2: FlowEdgeData(0, 1e17 + 0.5, 1e18)}, 2: {}
+    }, source=0, sink=2)
+    fn.change_flow_between_nodes(0, 1, 0)
+    fn.change_flow_between_nodes(1, 2, 0.5)
+    assert fn.get_node_balance(1) == 0 and fn.get_node_balance(0) == -0.5 and fn.current_flow == 0.5
+    expect_valid_flow(fn)
+    residual_network: ResidualNetwork[int] = ResidualNetwork(fn)
+    assert residual_network.current_flow == 0.5
+
+    fn.set_flows([(0, 1, 2 ** 55), (1, 2, 2 ** 55 + 1), (0, 3, 1), (3, 1, 1)])
+    assert fn.get_node_balance(1) == 0 and fn.current_flow == 2 ** 55 + 1 and isinstance(fn.current_flow, int)
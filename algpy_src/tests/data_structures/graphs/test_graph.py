@@ -124,3 +124,33 @@ class TestGraph:
         g.remove_nodes_from([1, 2, 3])
         assert g.adjacency_list == {}
         assert g.edges == set()
+
+    def test_graph_from_edge_list(self, filled_graph: Graph) -> None:
+        g = Graph.from_edge_list([(1, 2, 'Edge0'), (3, 2, 'Edge2'), (2, 1, 'Edge1')])
+        assert g == filled_graph
+        assert g.edges == {(1, 2, 'Edge1'), (3, 2, 'Edge2')}
+        assert g.number_of_edges == 2
+
+    def test_graph_without_stored_edges(self, filled_graph: Graph) -> None:
+        g = Graph({1: {2: 'Edge1'}, 2: {3: 'Edge2'}, 3: {}}, store_edges=False)
+        assert g == filled_graph
+        assert g.edges == filled_graph.edges
+        assert g.number_of_edges == 2
+
+        g.add_edge((3, 1, 'Edge3'))
+        g.add_edge((2, 2, 'Edge4'))
+        g.add_edge((2, 1, 'Edge5'))
+        assert g.number_of_edges == 4
+        assert g.edges == {(1, 2, 'Edge5'), (1, 3, 'Edge3'), (2, 3, 'Edge2'), (2, 2, 'Edge4')}
+        g.remove_edge(2, 2)
+        g.remove_edge(3, 2)
+        assert g.number_of_edges == 2
+
+    def test_graph_fingerprint(self, filled_graph: Graph) -> None:
+        fingerprint = filled_graph.fingerprint()
+        filled_graph.add_edge((3, 3, 'Loop'))
+        filled_graph.add_edge((1, 2, 'Edge3'))
+        assert filled_graph.fingerprint() == Graph({1: {2: 'Edge3'}, 2: {3: 'Edge2'}, 3: {3: 'Loop'}}).fingerprint()
+        filled_graph.remove_edge(3, 3)
+        filled_graph.add_edge((2, 1, 'Edge1'))
+        assert filled_graph.fingerprint() == fingerprint
@@ -0,0 +1,95 @@
+import pytest
+
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_snapshot import GraphSnapshot
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
+from algpy_src.data_structures.graphs.multigraph import MultiGraph
+
+
+@pytest.fixture
+def digraph() -> DiGraph:
+    return DiGraph({'a': {'b': 1, 'c': 3}, 'b': {'c': 1}, 'c': {}, 'd': {'d': 2}})
+
+
+class TestGraphSnapshot:
+
+    def test_graph_snapshot_base(self, digraph: DiGraph) -> None:
+        snapshot = digraph.snapshot()
+        assert isinstance(snapshot, GraphSnapshot)
+        assert snapshot.name == 'DiGraph Snapshot'
+        assert snapshot.space_complexity == 'V + E'
+        assert snapshot.is_directed is True
+        assert snapshot.is_multigraph is False
+        assert snapshot.nodes == ['a', 'b', 'c', 'd']
+        assert snapshot.has_node('d') and not snapshot.has_node('e')
+        assert snapshot.number_of_nodes == 4
+        assert snapshot.number_of_edges == 4
+        assert snapshot.edges == digraph.edges
+        assert snapshot.adjacency_list == digraph.adjacency_list
+        assert snapshot.neighbors('a') == {'b', 'c'}
+        assert snapshot.in_neighbors('c') == {'a', 'b'}
+        assert list(snapshot.iter_out_edges('a')) == [('b', 1), ('c', 3)]
+        assert list(snapshot.iter_in_edges('c')) == [('a', 3), ('b', 1)]
+        assert list(snapshot.iter_out_edges('e')) == []
+        assert snapshot.get_edge_data('a', 'b') == 1
+        assert snapshot.get_edge_data('b', 'a') == NoEdge()
+        with pytest.raises(KeyError):
+            snapshot.get_edge_data('e', 'a')
+        assert snapshot.outdegree('a') == 2
+        assert snapshot.indegree('c') == 2
+        assert snapshot == digraph.snapshot()
+
+    def test_graph_snapshot_copy_on_write(self, digraph: DiGraph) -> None:
+        adjacency_before = {node: dict(neighbourhood) for node, neighbourhood in digraph.adjacency_list.items()}
+        snapshot = digraph.snapshot()
+        assert snapshot.adjacency_list is digraph.adjacency_list
+
+        digraph.add_edge(('a', 'd', 5))
+        digraph.add_edge(('b', 'c', 7))
+        digraph.add_node('e')
+        digraph.remove_edge('a', 'b')
+        digraph.remove_node('d')
+        assert snapshot.adjacency_list == adjacency_before
+        assert snapshot.in_neighbors('c') == {'a', 'b'}
+        assert snapshot.indegree('d') == 1
+        assert digraph.adjacency_list == {'a': {'c': 3}, 'b': {'c': 7}, 'c': {}, 'e': {}}
+        assert digraph.in_neighbors('c') == {'a', 'b'}
+        # rows which were not changed are still shared
+        assert snapshot.adjacency_list['c'] is digraph.adjacency_list['c']
+
+        second_snapshot = digraph.snapshot()
+        digraph.add_edge(('c', 'a', 1))
+        assert snapshot.adjacency_list == adjacency_before
+        assert second_snapshot.adjacency_list == {'a': {'c': 3}, 'b': {'c': 7}, 'c': {}, 'e': {}}
+        assert digraph.number_of_edges == 3
+
+    def test_graph_snapshot_undirected(self) -> None:
+        g = Graph({1: {2: 'Edge1'}, 2: {3: 'Edge2'}})
+        snapshot = g.snapshot()
+        g.add_edge((1, 3, 'Edge3'))
+        assert snapshot.number_of_edges == 2
+        assert snapshot.neighbors(3) == {2}
+        assert snapshot.in_neighbors(2) == {1, 3}
+        assert g.neighbors(3) == {1, 2}
+
+    def test_graph_snapshot_multigraph(self) -> None:
+        g = MultiDiGraph({1: {2: {'Edge1'}}})
+        snapshot = g.snapshot()
+        g.add_edge((1, 2, 'Edge2'))
+        g.add_edge((2, 2, 'Edge3'))
+        assert snapshot.is_multigraph is True
+        assert snapshot.adjacency_list == {1: {2: {'Edge1'}}, 2: {}}
+        assert snapshot.number_of_edges == 1
+        assert g.adjacency_list == {1: {2: {'Edge1', 'Edge2'}}, 2: {2: {'Edge3'}}}
+        g.remove_edge(1, 2, 'Edge1')
+        assert snapshot.get_edge_data(1, 2) == {'Edge1'}
+        assert g.get_edge_data(1, 2) == {'Edge2'}
+
+        keyed = MultiGraph({1: {2: {'Edge1'}}}, keyed=True)
+        keyed_snapshot = keyed.snapshot()
+        keyed.add_edge((1, 2, 'Edge2'))
+        assert keyed_snapshot.number_of_edges == 1
+        assert keyed_snapshot.outdegree(2) == 1
+        assert keyed.number_of_edges == 2
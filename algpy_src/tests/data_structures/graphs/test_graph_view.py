@@ -0,0 +1,90 @@
+import pytest
+
+from algpy_src.algorithms.graph_algorithms.traversal.bfs import BreadthFirstSearch
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.graph_view import GraphView
+from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
+from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
+
+
+@pytest.fixture
+def digraph() -> DiGraph:
+    return DiGraph({'a': {'b': 1, 'c': 3}, 'b': {'c': 1, 'd': 4}, 'c': {'a': 2}, 'd': {'d': 2}})
+
+
+class TestGraphView:
+
+    def test_subgraph_view(self, digraph: DiGraph) -> None:
+        view = digraph.subgraph_view(['c', 'a', 'e', 'b'])
+        assert isinstance(view, GraphView)
+        assert view.name == 'DiGraph View'
+        assert view.space_complexity == 'V'
+        assert view.is_directed is True
+        assert view.is_multigraph is False
+        assert view.nodes == ['c', 'a', 'b']
+        assert view.has_node('a') and not view.has_node('d') and not view.has_node('e')
+        assert view.number_of_nodes == 3
+        assert view.number_of_edges == 4
+        assert view.edges == {('a', 'b', 1), ('a', 'c', 3), ('b', 'c', 1), ('c', 'a', 2)}
+        assert view.adjacency_list == {'c': {'a': 2}, 'a': {'b': 1, 'c': 3}, 'b': {'c': 1}}
+        assert view.adjacency_list_transposed == {'c': {'a': 3, 'b': 1}, 'a': {'c': 2}, 'b': {'a': 1}}
+        assert view.neighbors('b') == {'c'}
+        assert view.neighbors('d') == set()
+        assert view.in_neighbors('c') == {'a', 'b'}
+        assert list(view.iter_out_edges('a')) == [('b', 1), ('c', 3)]
+        assert view.get_edge_data('a', 'b') == 1
+        assert view.get_edge_data('b', 'a') == NoEdge()
+        with pytest.raises(KeyError):
+            view.get_edge_data('b', 'd')
+        assert view.outdegree('b') == 1
+        assert view.indegree('c') == 2
+
+        # edge changes of the graph are reflected by the view
+        digraph.add_edge(('b', 'a', 5))
+        assert view.neighbors('b') == {'a', 'c'}
+        assert view == digraph.subgraph_view(['c', 'a', 'b'])
+
+    def test_edge_filter_view(self, digraph: DiGraph) -> None:
+        view = digraph.edge_filter_view(lambda source, target, weight: weight < 3)
+        assert view.nodes == digraph.nodes
+        assert view.number_of_edges == 4
+        assert view.adjacency_list == {'a': {'b': 1}, 'b': {'c': 1}, 'c': {'a': 2}, 'd': {'d': 2}}
+        assert view.get_edge_data('a', 'c') == NoEdge()
+        assert view.in_neighbors('c') == {'b'}
+
+        nested_view = view.subgraph_view(['a', 'b', 'c']).edge_filter_view(lambda source, target, weight: source != 'c')
+        assert nested_view.adjacency_list == {'a': {'b': 1}, 'b': {'c': 1}, 'c': {}}
+
+        snapshot_view = digraph.snapshot().edge_filter_view(lambda source, target, weight: weight > 3)
+        assert snapshot_view.edges == {('b', 'd', 4)}
+
+    def test_graph_view_undirected(self) -> None:
+        g = Graph({1: {2: 'Edge1', 3: 'Edge2'}, 2: {3: 'Edge3'}, 4: {4: 'Edge4'}})
+        view = g.subgraph_view([1, 2, 4])
+        assert view.is_directed is False
+        assert view.number_of_edges == 2
+        assert view.edges in ({(1, 2, 'Edge1'), (4, 4, 'Edge4')}, {(2, 1, 'Edge1'), (4, 4, 'Edge4')})
+        assert view.neighbors(2) == {1}
+
+    def test_graph_view_multigraph(self) -> None:
+        g = MultiDiGraph({1: {2: {'Edge1', 'Edge2'}, 3: {'Edge3'}}})
+        view = g.edge_filter_view(lambda source, target, data: data != 'Edge1')
+        assert view.is_multigraph is True
+        assert view.adjacency_list == {1: {2: {'Edge2'}, 3: {'Edge3'}}, 2: {}, 3: {}}
+        assert view.number_of_edges == 2
+        assert view.outdegree(1) == 2
+        assert g.get_edge_data(1, 2) == {'Edge1', 'Edge2'}
+
+        keyed = MultiDiGraph({1: {2: {'Edge1', 'Edge2'}}}, keyed=True)
+        keyed_view = keyed.edge_filter_view(lambda source, target, data: data == 'Edge2')
+        assert list(keyed_view.edges) == [(1, 2, 'Edge2')]
+
+    def test_graph_view_traversal(self) -> None:
+        g = Graph({0: {1: None, 2: None}, 1: {3: None}, 4: {5: None}, 5: {6: None}})
+        bfs = BreadthFirstSearch()
+        expected_traversal_graph = TraversalGraph()
+        expected_traversal_graph.add_nodes_from([4, 5, 6])
+        assert bfs.run_algorithm(g.subgraph_view([4, 5, 6])) == (True, expected_traversal_graph)
+        assert bfs.n_ops == 6
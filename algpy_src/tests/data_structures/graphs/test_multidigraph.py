@@ -1,5 +1,8 @@
+from typing import Any
+
 import pytest
 
+from algpy_src.data_structures.graphs.graph_utils.graph_fingerprint import graph_fingerprint
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
 from algpy_src.data_structures.graphs.multidigraph import MultiDiGraph
 
@@ -130,3 +133,77 @@ class TestMultiDiGraph:
         g.remove_nodes_from([1, 2, 3])
         assert g.adjacency_list == {}
         assert g.edges == set()
+
+    def test_multidigraph_reverse_adjacency_maintained(self, filled_multidigraph: MultiDiGraph) -> None:
+        g = filled_multidigraph
+        g.add_edge((3, 2, 'MultiEdge4'))
+        g.add_edge((1, 2, 'MultiEdge5'))
+        assert g.in_neighbors(2) == {1, 3}
+        assert g.indegree(2) == 4
+        g.remove_edge(1, 2, 'MultiEdge1')
+        assert g.adjacency_list_transposed[2] == {1: {'MultiEdge2', 'MultiEdge5'}, 3: {'MultiEdge4'}}
+        g.remove_node(2)
+        assert g.adjacency_list_transposed == {1: {}, 3: {}}
+        assert g.edges == set()
+
+    def test_multidigraph_adds_parallel_edges_in_place(self, filled_multidigraph: MultiDiGraph) -> None:
+        g = filled_multidigraph
+        multiedge = g.adjacency_list[1][2]
+        g.add_edge((1, 2, 'MultiEdge4'))
+        assert g.adjacency_list[1][2] is multiedge
+        assert g.adjacency_list_transposed[2][1] is multiedge
+        assert multiedge == {'MultiEdge1', 'MultiEdge2', 'MultiEdge4'}
+        g.remove_edge(1, 2, 'MultiEdge1', 'MultiEdge5')
+        assert g.adjacency_list[1][2] is multiedge
+        assert multiedge == {'MultiEdge2', 'MultiEdge4'}
+        assert g.edges == {(1, 2, 'MultiEdge2'), (1, 2, 'MultiEdge4'), (2, 3, 'MultiEdge3')}
+        g.remove_edge(1, 2, 'MultiEdge2', 'MultiEdge4')
+        assert g.adjacency_list == {1: {}, 2: {3: {'MultiEdge3'}}, 3: {}}
+
+    def test_multidigraph_keyed(self) -> None:
+        adjacency_list: dict[int, dict[int, Any]] = {1: {2: ['a', 'a']}, 2: {3: {5: 'b'}}}
+        g: MultiDiGraph = MultiDiGraph(adjacency_list, keyed=True)
+        assert g.is_keyed is True
+        assert g.stores_edges is False
+        assert g.adjacency_list == {1: {2: {6: 'a', 7: 'a'}}, 2: {3: {5: 'b'}}, 3: {}}
+        assert g.number_of_edges == 3
+        assert g.outdegree(1) == 2
+
+        assert g.add_edge_with_key((1, 2, 'a')) == 8
+        g.add_edge((3, 1, 'c'))
+        assert g.adjacency_list[1][2] == {6: 'a', 7: 'a', 8: 'a'}
+        assert g.adjacency_list_transposed[1] == {3: {9: 'c'}}
+        assert g.number_of_edges == 5
+        assert g.edges == {(1, 2, 'a'), (2, 3, 'b'), (3, 1, 'c')}
+
+        g.remove_edge(1, 2, 'a', 'a')
+        assert g.adjacency_list[1][2] == {8: 'a'}
+        g.remove_edge_by_key(1, 2, 8)
+        g.remove_edge_by_key(1, 2, 8)
+        assert g.adjacency_list[1] == {}
+        g.remove_node(3)
+        assert g.adjacency_list == {1: {}, 2: {}}
+        assert g.number_of_edges == 0
+
+        with pytest.raises(ValueError):
+            MultiDiGraph().add_edge_with_key((1, 2, 'a'))
+
+    def test_multidigraph_keyed_from_edge_list(self) -> None:
+        g: MultiDiGraph = MultiDiGraph.from_edge_arrays([1, 1, 2, 1], [2, 2, 1, 2], ['a', 'a', 'b', 'c'], keyed=True)
+        assert g.adjacency_list == {1: {2: {0: 'a', 1: 'a', 3: 'c'}}, 2: {1: {2: 'b'}}}
+        assert g.number_of_edges == 4
+        assert g.add_edge_with_key((2, 1, 'b')) == 4
+
+    @pytest.mark.parametrize('keyed', [False, True])
+    def test_multidigraph_fingerprint(self, keyed: bool) -> None:
+        g: MultiDiGraph = MultiDiGraph(keyed=keyed)
+        fingerprint = g.fingerprint()
+        g.add_edges_from([(1, 2, 'a'), (1, 2, 'b'), (2, 2, 'c'), (1, 2, 'a')])
+        assert g.fingerprint() == graph_fingerprint((node, neighbourhood.items()) for node, neighbourhood in g.adjacency_list.items())
+        if keyed:
+            g.remove_edge_by_key(1, 2, 0)
+        else:
+            g.remove_edge(1, 2, 'a')
+        assert g.fingerprint() == graph_fingerprint((node, neighbourhood.items()) for node, neighbourhood in g.adjacency_list.items())
+        g.remove_nodes_from([1, 2])
+        assert g.fingerprint() == fingerprint
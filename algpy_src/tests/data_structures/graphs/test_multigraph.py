@@ -1,5 +1,6 @@
 import pytest
 
+from algpy_src.data_structures.graphs.graph_utils.graph_journal import GraphChangeKind
 from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
 from algpy_src.data_structures.graphs.multigraph import MultiGraph
 
@@ -130,3 +131,67 @@ class TestMultiGraph:
         g.remove_nodes_from([1, 2, 3])
         assert g.adjacency_list == {}
         assert g.edges == set()
+
+    def test_multigraph_from_edge_list(self, filled_multigraph: MultiGraph) -> None:
+        g = MultiGraph.from_edge_list([(1, 2, 'MultiEdge1'), (2, 1, 'MultiEdge2'), (2, 3, 'MultiEdge3'), (3, 2, 'MultiEdge3')])
+        assert g == filled_multigraph
+        assert g.edges == {(1, 2, 'MultiEdge1'), (1, 2, 'MultiEdge2'), (2, 3, 'MultiEdge3')}
+        assert g.number_of_edges == 3
+
+    def test_multigraph_without_stored_edges(self, filled_multigraph: MultiGraph) -> None:
+        g = MultiGraph({1: {2: {'MultiEdge1', 'MultiEdge2'}}, 2: {3: {'MultiEdge3'}}, 3: {}}, store_edges=False)
+        assert g == filled_multigraph
+        assert g.edges == filled_multigraph.edges
+        assert g.number_of_edges == 3
+
+        g.add_edge((2, 1, 'MultiEdge4'))
+        g.add_edge((3, 3, 'MultiEdge5'))
+        assert g.number_of_edges == 5
+        g.remove_edge(1, 2, 'MultiEdge1', 'MultiEdge4')
+        assert g.number_of_edges == 3
+        assert g.edges == {(1, 2, 'MultiEdge2'), (2, 3, 'MultiEdge3'), (3, 3, 'MultiEdge5')}
+        g.remove_node(3)
+        assert g.number_of_edges == 1
+
+    def test_multigraph_keyed(self) -> None:
+        g = MultiGraph({1: {2: ['a', 'a'], 1: ['b']}}, keyed=True)
+        assert g.adjacency_list == {1: {2: {0: 'a', 1: 'a'}, 1: {2: 'b'}}, 2: {1: {0: 'a', 1: 'a'}}}
+        assert g.adjacency_list[1][2] is not g.adjacency_list[2][1]
+        assert g.number_of_edges == 3
+
+        key = g.add_edge_with_key((2, 1, 'a'))
+        g.add_edge((3, 3, 'c'))
+        assert g.adjacency_list[1][2] == g.adjacency_list[2][1] == {0: 'a', 1: 'a', key: 'a'}
+        assert g.number_of_edges == 5
+
+        g.remove_edge(2, 1, 'a')
+        assert g.adjacency_list[1][2] == g.adjacency_list[2][1] == {1: 'a', key: 'a'}
+        g.remove_edge_by_key(2, 1, key)
+        assert g.adjacency_list[1][2] == g.adjacency_list[2][1] == {1: 'a'}
+        assert g.number_of_edges == 3
+        g.remove_node(1)
+        assert g.adjacency_list == {2: {}, 3: {3: {4: 'c'}}}
+        assert g.number_of_edges == 1
+
+    def test_multigraph_journal(self) -> None:
+        g = MultiGraph({1: {2: {'Edge1'}}})
+        g.enable_journal()
+        g.add_edge((1, 2, 'Edge2'))
+        g.add_edge((1, 2, 'Edge2'))
+        g.add_edge((2, 3, 'Edge3'))
+        g.remove_edge(1, 2, 'Edge1')
+        assert [(delta.kind, delta.source, delta.target, delta.data) for delta in g.deltas_since(0)] == [
+            (GraphChangeKind.EDGE_ADDED, 1, 2, 'Edge2'), (GraphChangeKind.EDGE_ADDED, 2, 1, 'Edge2'),
+            (GraphChangeKind.NODE_ADDED, 3, None, None),
+            (GraphChangeKind.EDGE_ADDED, 2, 3, 'Edge3'), (GraphChangeKind.EDGE_ADDED, 3, 2, 'Edge3'),
+            (GraphChangeKind.EDGE_REMOVED, 1, 2, 'Edge1'), (GraphChangeKind.EDGE_REMOVED, 2, 1, 'Edge1'),
+        ]
+
+        keyed = MultiGraph({1: {2: {'Edge1'}}}, keyed=True)
+        keyed.enable_journal()
+        key = keyed.add_edge_with_key((1, 2, 'Edge2'))
+        keyed.remove_edge_by_key(1, 2, key)
+        assert [(delta.kind, delta.source, delta.target, delta.data, delta.key) for delta in keyed.deltas_since(0)] == [
+            (GraphChangeKind.EDGE_ADDED, 1, 2, 'Edge2', key), (GraphChangeKind.EDGE_ADDED, 2, 1, 'Edge2', key),
+            (GraphChangeKind.EDGE_REMOVED, 1, 2, 'Edge2', key), (GraphChangeKind.EDGE_REMOVED, 2, 1, 'Edge2', key),
+        ]
@@ -0,0 +1,41 @@
+from algpy_src.base.constants import FlowEdgeData
+from algpy_src.data_structures.graphs.flow_network import FlowNetwork
+from algpy_src.data_structures.graphs.residual_network import ResidualNetwork
+
+
+def test_residual_network() -> None:
+    flow_network: FlowNetwork[str] = FlowNetwork(
+        adjacency_list={
+            's': {'v': FlowEdgeData(0, 2, 3), 'u': FlowEdgeData(1, None, 4)},
+            'u': {'t': FlowEdgeData(0, 0, 5)},
+            'v': {'t': FlowEdgeData(0, 2, 2), 'u': FlowEdgeData(0, 0, 1)},
+            't': {},
+        },
+        source='s', sink='t'
+    )
+    residual_network: ResidualNetwork[str] = ResidualNetwork(flow_network)
+    assert residual_network.nodes == ['s', 'u', 'v', 't']
+    assert residual_network.source_id == 0 and residual_network.sink_id == 3
+    assert residual_network.number_of_edges == 5 and residual_network.flows == [2, 0, 0, 2, 0] and residual_network.current_flow == 2
+
+    s_to_v, s_to_u = residual_network.forward_arcs(0)
+    assert residual_network.forward_arcs_by_head(0) == [s_to_u, s_to_v]
+    assert residual_network.head(s_to_v) == 2 and residual_network.residual_capacity(s_to_v) == 1
+    assert residual_network.residual_capacity(s_to_u) == 4
+    v_against_s = residual_network.backward_arcs(2)[0]
+    assert v_against_s == s_to_v + 1 and residual_network.head(v_against_s) == 0 and residual_network.residual_capacity(v_against_s) == 2
+    assert residual_network.edge(s_to_v >> 1) == ('s', 'v')
+
+    residual_network.push(s_to_u, 3)
+    residual_network.push(v_against_s, 2)
+    residual_network.set_flow(residual_network.forward_arcs(1)[0] >> 1, 3)
+    assert residual_network.residual_capacity(s_to_u) == 1 and residual_network.residual_capacity(s_to_v) == 3
+    assert residual_network.current_flow == 3
+
+    residual_network.write_flows(flow_network)
+    assert flow_network.adjacency_list == {
+        's': {'v': FlowEdgeData(0, 0, 3), 'u': FlowEdgeData(1, 3, 4)},
+        'u': {'t': FlowEdgeData(0, 3, 5)},
+        'v': {'t': FlowEdgeData(0, 2, 2), 'u': FlowEdgeData(0, 0, 1)},
+        't': {},
+    }
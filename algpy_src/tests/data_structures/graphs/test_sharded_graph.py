@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from algpy_src.algorithms.graph_algorithms.traversal.bfs import BreadthFirstSearch
+from algpy_src.algorithms.graph_algorithms.traversal.shortest_paths.simple_dijkstra import DijkstraShortestPathsAlgorithm
+from algpy_src.data_structures.graphs.csr_graph import CSRGraph
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.sharded_graph import ShardCacheInfo, ShardedGraph
+
+
+@pytest.fixture
+def digraph() -> DiGraph:
+    return DiGraph({'a': {'c': 3, 'b': 1}, 'b': {'c': 1}, 'c': {'a': 4}, 'd': {'d': 2}, 'e': {'a': 1}})
+
+
+class TestShardedGraph:
+
+    def test_sharded_graph_base(self, digraph: DiGraph, tmp_path: Path) -> None:
+        sharded_graph = ShardedGraph.from_graph(digraph, tmp_path, shard_size=2, cache_shards=2)
+        assert sharded_graph.name == 'Sharded Graph'
+        assert sharded_graph.is_directed is True
+        assert sharded_graph.is_multigraph is False
+        assert sharded_graph.shard_size == 2
+        assert sharded_graph.number_of_shards == 3
+        assert sharded_graph.nodes == ['a', 'b', 'c', 'd', 'e']
+        assert sharded_graph.has_node('e') and not sharded_graph.has_node('f')
+        assert sharded_graph.number_of_nodes == 5
+        assert sharded_graph.number_of_edges == 6
+        assert sharded_graph.node_interner.id_of('d') == 3
+        assert sharded_graph.cache_info() == ShardCacheInfo(0, 0, 2, 0)
+
+    def test_sharded_graph_read_interface(self, digraph: DiGraph, tmp_path: Path) -> None:
+        sharded_graph = ShardedGraph.from_graph(digraph, tmp_path, shard_size=2)
+        assert sharded_graph.neighbors('a') == ['b', 'c']
+        assert sharded_graph.neighbors('f') == []
+        assert list(sharded_graph.iter_out_edges('c')) == [('a', 4)]
+        assert list(sharded_graph.iter_out_edges('f')) == []
+        assert sharded_graph.get_edge_data('a', 'c') == 3
+        assert sharded_graph.get_edge_data('c', 'b') == NoEdge()
+        with pytest.raises(KeyError):
+            sharded_graph.get_edge_data('a', 'f')
+        assert sharded_graph.outdegree('d') == 1
+        assert sharded_graph.adjacency_list == digraph.adjacency_list
+        assert sharded_graph == ShardedGraph(tmp_path)
+
+        dijkstra = DijkstraShortestPathsAlgorithm()
+        _, shortest_paths_graph = dijkstra.run_algorithm(sharded_graph, source='e')
+        _, expected_shortest_paths_graph = dijkstra.run_algorithm(digraph, source='e')
+        assert shortest_paths_graph == expected_shortest_paths_graph
+
+    def test_sharded_graph_cache(self, digraph: DiGraph, tmp_path: Path) -> None:
+        sharded_graph = ShardedGraph.from_graph(digraph, tmp_path, shard_size=2, cache_shards=2)
+        for node in ['a', 'b', 'c', 'a', 'e', 'c', 'a']:
+            sharded_graph.neighbors(node)
+        # shards: 0 = {a, b}, 1 = {c, d}, 2 = {e}; the access to e evicts shard 1, which then evicts shard 0 and so on
+        assert sharded_graph.cache_info() == ShardCacheInfo(hits=2, misses=5, max_shards=2, current_shards=2)
+        sharded_graph.clear_cache()
+        assert sharded_graph.cache_info() == ShardCacheInfo(0, 0, 2, 0)
+        with pytest.raises(ValueError):
+            ShardedGraph(tmp_path, cache_shards=0)
+        with pytest.raises(ValueError):
+            ShardedGraph.write(digraph, tmp_path, shard_size=0)
+
+    def test_sharded_graph_from_memory_mapped_graph(self, tmp_path: Path) -> None:
+        rng = np.random.default_rng(0)
+        graph = Graph.from_edge_arrays(rng.integers(0, 200, 1000), rng.integers(0, 200, 1000), rng.integers(1, 10, 1000), nodes=range(200))
+        graph.save_binary(tmp_path / 'binary')
+        sharded_graph = ShardedGraph.from_graph(CSRGraph.load_binary(tmp_path / 'binary'), tmp_path / 'sharded', shard_size=16, cache_shards=3)
+        assert sharded_graph.is_directed is False
+        assert sharded_graph.number_of_edges == graph.number_of_edges
+        assert all(set(sharded_graph.neighbors(node)) == set(graph.neighbors(node)) for node in graph.nodes)
+
+        bfs = BreadthFirstSearch()
+        assert set(bfs.run_algorithm(sharded_graph)[1].nodes) == set(graph.nodes)
+        assert sharded_graph.cache_info().current_shards == 3
+
+    def test_sharded_graph_pickled_tables(self, tmp_path: Path) -> None:
+        graph = Graph({(0, 0): {(0, 1): None}, (0, 1): {}})
+        with pytest.raises(ValueError, match='allow_pickle'):
+            ShardedGraph.from_graph(graph, tmp_path)
+        sharded_graph: ShardedGraph[tuple[int, int], None] = ShardedGraph(tmp_path, allow_pickle=True)
+        assert sharded_graph.nodes == [(0, 0), (0, 1)] and sharded_graph.get_edge_data((0, 1), (0, 0)) is None
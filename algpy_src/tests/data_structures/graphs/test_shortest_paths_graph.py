@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
 from algpy_src.data_structures.graphs.graph_utils.no_node_object import NoNode
-from algpy_src.data_structures.graphs.shortest_paths_graph import ShortestPathsGraph
+from algpy_src.data_structures.graphs.graph_utils.node_interner import NodeInterner
+from algpy_src.data_structures.graphs.shortest_paths_graph import NO_PREDECESSOR, ShortestPathsGraph
 from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
 
 
@@ -78,3 +80,40 @@ def test_shortest_paths(simple_shortest_paths_graph: ShortestPathsGraph) -> None
 
 
 
+
+
+@pytest.fixture
+def array_shortest_paths_graph() -> ShortestPathsGraph:
+    inf = float('inf')
+    return ShortestPathsGraph.from_arrays(
+        adjacency_list={'1': {'2': 1}, '2': {'3': 1}, '3': {'4': 1}},
+        node_interner=NodeInterner(['1', '2', '3', '4']),
+        sources=['1', '2', '3', '4'],
+        distances=np.array([[0, 1, 2, 3], [inf, 0, 1, 2], [inf, inf, 0, 1], [inf, inf, inf, 0]]),
+        predecessor_ids=np.array([[NO_PREDECESSOR, 0, 1, 2], [NO_PREDECESSOR, NO_PREDECESSOR, 1, 2], [NO_PREDECESSOR, NO_PREDECESSOR, NO_PREDECESSOR, 2],
+                                  [NO_PREDECESSOR] * 4])
+    )
+
+
+def test_array_shortest_paths_graph(simple_shortest_paths_graph: ShortestPathsGraph, array_shortest_paths_graph: ShortestPathsGraph) -> None:
+    assert array_shortest_paths_graph.shortest_path_lengths == {
+        '1': {'1': 0, '2': 1, '3': 2, '4': 3}, '2': {'2': 0, '3': 1, '4': 2}, '3': {'3': 0, '4': 1}, '4': {'4': 0},
+    }
+    assert array_shortest_paths_graph.shortest_path_predecessors == {
+        '1': {'1': NoNode(), '2': '1', '3': '2', '4': '3'}, '2': {'2': NoNode(), '3': '2', '4': '3'}, '3': {'3': NoNode(), '4': '3'}, '4': {'4': NoNode()},
+    }
+    for node_1 in '12345':
+        for node_2 in '12345':
+            assert array_shortest_paths_graph.shortest_path_length(node_1, node_2) == simple_shortest_paths_graph.shortest_path_length(node_1, node_2)
+            assert array_shortest_paths_graph.shortest_path(node_1, node_2) == simple_shortest_paths_graph.shortest_path(node_1, node_2)
+
+
+@pytest.mark.parametrize('sp_graph_fixture', ['simple_shortest_paths_graph', 'array_shortest_paths_graph'])
+def test_iter_path_and_path_lengths(sp_graph_fixture: str, request: pytest.FixtureRequest) -> None:
+    sp_graph: ShortestPathsGraph = request.getfixturevalue(sp_graph_fixture)
+    assert list(sp_graph.iter_path('1', '4')) == ['1', '2', '3', '4']
+    assert list(sp_graph.iter_path('2', '2')) == ['2']
+    assert list(sp_graph.iter_path('4', '1')) == []
+    assert list(sp_graph.iter_path('1', '5')) == []
+    assert sp_graph.path_lengths([('1', '4'), ('3', '3'), ('4', '1'), ('5', '1')]).tolist() == [3, 0, float('inf'), float('inf')]
+    assert sp_graph.path_lengths([]).tolist() == []
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from algpy_src.algorithms.graph_algorithms.traversal.bfs import BreadthFirstSearch
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.graph import Graph
+from algpy_src.data_structures.graphs.graph_utils.no_edge_object import NoEdge
+from algpy_src.data_structures.graphs.thread_safe_graph import ThreadSafeGraph
+from algpy_src.data_structures.graphs.traversal_graph import TraversalGraph
+
+
+@pytest.fixture
+def thread_safe_digraph() -> ThreadSafeGraph[str, int]:
+    return ThreadSafeGraph(DiGraph({'a': {'b': 1, 'c': 2}, 'b': {'c': 3}, 'c': {}}))
+
+
+def test_thread_safe_graph_delegation(thread_safe_digraph: ThreadSafeGraph[str, int]) -> None:
+    assert thread_safe_digraph.name == 'DiGraph'
+    assert thread_safe_digraph.number_of_edges == 3
+    assert thread_safe_digraph.has_node('a')
+    assert thread_safe_digraph.get_edge_data('a', 'c') == 2
+    assert thread_safe_digraph.neighbors('a') == ['b', 'c']
+    assert thread_safe_digraph.in_neighbors('c') == ['a', 'b']
+    assert thread_safe_digraph.iter_out_edges('a') == [('b', 1), ('c', 2)]
+    assert thread_safe_digraph.adjacency_matrix == [[NoEdge(), 1, 2], [NoEdge(), NoEdge(), 3], [NoEdge(), NoEdge(), NoEdge()]]
+    thread_safe_digraph.add_edge(('c', 'd', 4))
+    thread_safe_digraph.remove_edge('a', 'b')
+    assert thread_safe_digraph == DiGraph({'a': {'c': 2}, 'b': {'c': 3}, 'c': {'d': 4}, 'd': {}})
+    assert thread_safe_digraph == ThreadSafeGraph(DiGraph({'a': {'c': 2}, 'b': {'c': 3}, 'c': {'d': 4}, 'd': {}}))
+    with thread_safe_digraph.read_locked():
+        assert list(thread_safe_digraph.graph.nodes) == ['a', 'b', 'c', 'd']
+    assert not hasattr(thread_safe_digraph, '_adjacency_list')
+    assert not hasattr(thread_safe_digraph, 'not_an_attribute')
+
+
+def test_thread_safe_graph_run_algorithm() -> None:
+    graph: ThreadSafeGraph[int, None] = ThreadSafeGraph(Graph({1: {2: None}, 2: {3: None}}))
+    expected_traversal_graph = TraversalGraph()
+    expected_traversal_graph.add_nodes_from([1, 2, 3])
+    assert graph.run_algorithm(BreadthFirstSearch(), root=1) == (True, expected_traversal_graph)
+
+
+def test_thread_safe_graph_concurrent_access() -> None:
+    graph: ThreadSafeGraph[int, int] = ThreadSafeGraph(DiGraph())
+    n_writers, n_edges_per_writer = 4, 500
+    errors: list[Exception] = []
+
+    def write(writer_id: int) -> None:
+        for i in range(n_edges_per_writer):
+            graph.add_edge((writer_id, (writer_id, i), i))
+
+    def read() -> None:
+        try:
+            for _ in range(200):
+                for writer_id in range(n_writers):
+                    if graph.has_node(writer_id):
+                        # edges are added together with their nodes by a single locked call, thus a present node always has neighbours
+                        assert len(graph.neighbors(writer_id)) > 0
+                        _, traversal_graph = graph.run_algorithm(BreadthFirstSearch(), root=writer_id)
+                        assert traversal_graph.number_of_nodes > 1
+        except (AssertionError, KeyError, RuntimeError) as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(writer_id,)) for writer_id in range(n_writers)] + [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert graph.number_of_edges == n_writers * n_edges_per_writer
+    assert graph.number_of_nodes == n_writers * (n_edges_per_writer + 1)
+    with graph.write_locked():
+        graph.graph.add_edge((0, 1, 0))
+    assert graph.get_edge_data(0, 1) == 0
+
+
+def test_thread_safe_graph_lazy_state_on_lean_graph() -> None:
+    lean_graph: DiGraph[int, int] = DiGraph({node: {node + 1: node} for node in range(99)}, store_edges=False)
+    graph: ThreadSafeGraph[int, int] = ThreadSafeGraph(lean_graph)
+    edge_counts: list[int] = []
+    frozen_node_counts: list[int] = []
+
+    def read() -> None:
+        for _ in range(50):
+            edge_counts.append(graph.number_of_edges)
+            frozen_node_counts.append(graph.freeze().number_of_nodes)
+
+    readers = [threading.Thread(target=read) for _ in range(8)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    assert set(edge_counts) == {99} and set(frozen_node_counts) == {100}
+
+    graph.remove_node(0)
+    graph.add_edge((99, 100, 99))
+    assert graph.number_of_edges == 99
+    assert graph.node_interner.nodes == list(range(1, 101))
+    with graph.write_locked():
+        graph.graph.remove_node(1)
+    # the edge count was rebuilt when the block was left, the node interner only on the next read
+    assert not graph.graph.has_node_interner and graph.graph._number_of_edge_entries == 98
+    assert graph.number_of_nodes == 99 and graph.graph.has_node_interner
+    graph.remove_node(2)
+    graph.remove_node(3)
+    assert not graph.graph.has_node_interner
+    assert graph.freeze().number_of_nodes == 97 and graph.graph.has_node_interner
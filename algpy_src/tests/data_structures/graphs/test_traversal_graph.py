@@ -12,3 +12,13 @@ def test_traversal_graph_adjacency_list_ordering_sensitive() -> None:
 
     assert traversal_graph_1 == traversal_graph_2
     assert traversal_graph_1 != traversal_graph_3
+
+
+def test_traversal_graph_fingerprint() -> None:
+    traversal_graph_1 = TraversalGraph({1: {2: None}, 2: {3: None}, 3: {}})
+    traversal_graph_2 = TraversalGraph()
+    traversal_graph_2.add_edges_from([(2, 3, None), (1, 2, None)])
+    # equal structure in a different order, thus equal fingerprints but unequal traversal graphs
+    assert traversal_graph_1.fingerprint() == traversal_graph_2.fingerprint()
+    assert traversal_graph_1 != traversal_graph_2
+    assert hash(traversal_graph_1) == hash(TraversalGraph({1: {2: None}, 2: {3: None}, 3: {}}))
@@ -154,3 +154,13 @@ def test_find_and_decrease_key(complex_fib_heap: FibonacciHeap[int, int]) -> Non
     assert node_46.child is None
     assert node_46.successor is not None and node_46.successor == node_7
     assert node_7.predecessor is not None and node_7.predecessor == node_46
+
+
+def test_fibonacci_heap_memory_footprint(complex_fib_heap: FibonacciHeap[int, int]) -> None:
+    assert {'instance', 'keys', 'priorities', 'heap_nodes'} <= set(FibonacciHeap().memory_footprint().components)
+    footprint = complex_fib_heap.memory_footprint()
+    assert footprint.components['heap_nodes'] > 0
+    complex_fib_heap.insert(10_000, 20_000)
+    larger_footprint = complex_fib_heap.memory_footprint()
+    assert larger_footprint.components['keys'] > footprint.components['keys']
+    assert larger_footprint.components['heap_nodes'] > footprint.components['heap_nodes']
@@ -31,3 +31,14 @@ def test_prefix_trie_delete(prefix_trie: PrefixTrie[str]) -> None:
     prefix_trie.insert('cattle')
     assert prefix_trie.delete('cat') is False
     assert prefix_trie.delete('cattle') is True
+
+
+def test_prefix_trie_memory_footprint(prefix_trie: PrefixTrie[str]) -> None:
+    empty_footprint = prefix_trie.memory_footprint()
+    prefix_trie.insert('cat')
+    prefix_trie.insert('cattle')
+    footprint = prefix_trie.memory_footprint()
+    assert {'instance', 'alphabet', 'keys', 'child_arrays', 'trie_nodes'} <= set(footprint.components)
+    # one child array per node, i.e., the root and 6 nodes of the letters of 'cattle'
+    assert footprint.components['child_arrays'] == 7 * empty_footprint.components['child_arrays']
+    assert footprint.components['trie_nodes'] > empty_footprint.components['trie_nodes']
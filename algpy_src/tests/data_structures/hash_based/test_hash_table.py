@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 
 import pytest
@@ -49,4 +50,15 @@ def test_rehashing_works(ht: HashTable) -> None:
 
 def test_cannot_hash_unhashable(ht: HashTable) -> None:
     with pytest.raises(TypeError):
-        ht.insert([], 10)  # type: ignore # (we test invalid input type error)
\ No newline at end of file
+        ht.insert([], 10)  # type: ignore # (we test invalid input type error)
+
+
+def test_hash_table_memory_footprint(ht: HashTable) -> None:
+    empty_footprint = ht.memory_footprint()
+    assert empty_footprint.components['keys'] == empty_footprint.components['values'] == empty_footprint.components['chains'] == 0
+    for i in range(100):
+        ht.insert(f'key{i}', [i])
+    footprint = ht.memory_footprint()
+    assert {'instance', 'keys', 'values', 'entry_tuples', 'chains', 'bucket_array'} <= set(footprint.components)
+    assert footprint.components['keys'] > 0 and footprint.components['values'] > 0 and footprint.components['chains'] > 0
+    assert footprint.components['bucket_array'] == sys.getsizeof(ht._hash_table)
@@ -0,0 +1,8 @@
+from algpy_src.tools.graph_benchmarks.contention_benchmark import benchmark_reader_scaling
+
+
+def test_benchmark_reader_scaling() -> None:
+    for with_writer in [False, True]:
+        throughputs = benchmark_reader_scaling([1, 2, 4], n_reads_per_thread=2_000, n_nodes=1_000, with_writer=with_writer, seed=0)
+        assert list(throughputs.keys()) == [1, 2, 4]
+        assert all(throughput > 0 for throughput in throughputs.values())
@@ -0,0 +1,16 @@
+from algpy_src.tools.graph_benchmarks.membership_benchmark import benchmark_graph_lookups, count_graph_lookup_comparisons
+
+
+def test_benchmark_graph_lookups() -> None:
+    lookup_times = benchmark_graph_lookups([1_000, 100_000], n_lookups=5_000, seed=0)
+    assert list(lookup_times.keys()) == [1_000, 100_000]
+    for times in lookup_times.values():
+        assert set(times.keys()) == {'has_node', 'in_nodes', 'get_edge_data'}
+        assert all(time_per_call > 0 for time_per_call in times.values())
+
+
+def test_graph_lookups_stay_flat() -> None:
+    lookup_comparisons = count_graph_lookup_comparisons([100, 10_000], n_lookups=1_000, seed=0)
+    assert lookup_comparisons[100] == lookup_comparisons[10_000]
+    assert lookup_comparisons[10_000]['has_node'] == lookup_comparisons[10_000]['in_nodes'] == 1
+    assert lookup_comparisons[10_000]['get_edge_data'] <= 4
@@ -0,0 +1,97 @@
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+from algpy_src.data_structures.graphs.digraph import DiGraph
+from algpy_src.data_structures.graphs.thread_safe_graph import ThreadSafeGraph
+
+
+def _read(graph: ThreadSafeGraph[int, int], nodes: list[int], barrier: threading.Barrier) -> None:
+    """
+    Reader thread of the benchmark performing an outdegree and (for nodes with a successor) a get_edge_data call for each of the given nodes.
+
+    Parameters
+    ----------
+    graph : ThreadSafeGraph[int, int]
+        Benchmarked graph.
+    nodes : list[int]
+        Nodes to read.
+    barrier : threading.Barrier
+        Barrier to wait at before reading, so that all readers start at once.
+    """
+    barrier.wait()
+    for node in nodes:
+        if graph.outdegree(node) > 0:
+            graph.get_edge_data(node, node + 1)
+
+
+def _write(graph: ThreadSafeGraph[int, int], n_nodes: int, readers_done: threading.Event) -> None:
+    """
+    Writer thread of the benchmark repeatedly adding and removing an edge until all readers are done.
+
+    Parameters
+    ----------
+    graph : ThreadSafeGraph[int, int]
+        Benchmarked graph.
+    n_nodes : int
+        Number of nodes of the graph.
+    readers_done : threading.Event
+        Event set once all readers have finished.
+    """
+    node = 0
+    while not readers_done.is_set():
+        graph.add_edge((node, (node + 2) % n_nodes, 2))
+        graph.remove_edge(node, (node + 2) % n_nodes)
+        node = (node + 1) % n_nodes
+
+
+def benchmark_reader_scaling(thread_counts: Iterable[int], n_reads_per_thread: int = 10_000, n_nodes: int = 10_000, with_writer: bool = False,
+                             seed: Optional[int] = None) -> dict[int, float]:
+    """
+    Benchmark of the read throughput of a ThreadSafeGraph for increasing numbers of concurrent reader threads.
+    Each reader performs outdegree and get_edge_data calls for random nodes of a path-like directed graph, optionally while one writer thread keeps adding and removing edges.
+    Readers share the lock, thus on free-threaded CPython builds the throughput should grow with the number of readers (up to the number of cores),
+    whereas with the global interpreter lock it stays roughly flat and only shows the overhead of the locking.
+
+    Parameters
+    ----------
+    thread_counts : Iterable[int]
+        Numbers of concurrent reader threads to benchmark.
+    n_reads_per_thread : int (default 10_000)
+        Number of reads performed by each reader thread.
+    n_nodes : int (default 10_000)
+        Number of nodes of the benchmarked graph.
+    with_writer : bool (default False)
+        Whether a writer thread changes the graph while the readers run.
+    seed : Optional[int] (default None)
+        Seed of the random generator choosing the read nodes.
+
+    Returns
+    -------
+    throughputs : dict[int, float]
+        For each number of reader threads, total number of reads per second of all readers together.
+    """
+    rng = random.Random(seed)
+    graph: ThreadSafeGraph[int, int] = ThreadSafeGraph(DiGraph({node: {node + 1: 1} for node in range(n_nodes - 1)} | {n_nodes - 1: {}}))
+    throughputs: dict[int, float] = {}
+    for n_threads in thread_counts:
+        reads = [[rng.randrange(n_nodes) for _ in range(n_reads_per_thread)] for _ in range(n_threads)]
+        barrier = threading.Barrier(n_threads + 1)
+        readers_done = threading.Event()
+        readers = [threading.Thread(target=_read, args=(graph, nodes, barrier)) for nodes in reads]
+        writer = threading.Thread(target=_write, args=(graph, n_nodes, readers_done)) if with_writer else None
+        for reader in readers:
+            reader.start()
+        if writer is not None:
+            writer.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for reader in readers:
+            reader.join()
+        elapsed = time.perf_counter() - start
+        readers_done.set()
+        if writer is not None:
+            writer.join()
+        throughputs[n_threads] = n_threads * n_reads_per_thread / elapsed
+    return throughputs
@@ -0,0 +1,138 @@
+import random
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from algpy_src.data_structures.graphs.digraph import DiGraph
+
+
+class _ComparedNode:
+    """
+    Integer node counting how many times nodes are compared for equality, e.g., once per hash-based lookup or once per scanned node of a linear search.
+    """
+    comparisons = 0
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        _ComparedNode.comparisons += 1
+        return isinstance(other, _ComparedNode) and self.value == other.value
+
+
+def _comparisons_per_call(function: Callable[[Any], object], arguments: list[Any]) -> float:
+    """
+    Count the average number of node comparisons of calling the given function once for each of the given arguments.
+
+    Parameters
+    ----------
+    function : Callable[[Any], object]
+        Function to measure.
+    arguments : list[Any]
+        Arguments to call the function with.
+
+    Returns
+    -------
+    comparisons_per_call : float
+        Average number of node comparisons of one call.
+    """
+    _ComparedNode.comparisons = 0
+    for argument in arguments:
+        function(argument)
+    return _ComparedNode.comparisons / len(arguments)
+
+
+def _time_per_call(function: Callable[[int], object], arguments: list[int]) -> float:
+    """
+    Measure the average wall clock time of calling the given function once for each of the given arguments.
+    The calls are performed once beforehand as a warm-up so that the measurement is not dominated by first-call overheads.
+
+    Parameters
+    ----------
+    function : Callable[[int], object]
+        Function to measure.
+    arguments : list[int]
+        Arguments to call the function with.
+
+    Returns
+    -------
+    time_per_call : float
+        Average time of one call in seconds.
+    """
+    for argument in arguments:
+        function(argument)
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments)
+
+
+def benchmark_graph_lookups(graph_sizes: Iterable[int], n_lookups: int = 10_000, seed: Optional[int] = None) -> dict[int, dict[str, float]]:
+    """
+    Micro-benchmark of node membership checks and edge lookups on path-like directed graphs of increasing size.
+    With constant-time lookups, the measured times should stay (roughly) flat as the number of nodes grows.
+
+    Parameters
+    ----------
+    graph_sizes : Iterable[int]
+        Numbers of nodes of the benchmarked graphs.
+    n_lookups : int (default 10_000)
+        Number of random lookups of each kind performed per graph.
+    seed : Optional[int] (default None)
+        Seed of the random generator choosing the looked-up nodes.
+
+    Returns
+    -------
+    lookup_times : dict[int, dict[str, float]]
+        For each graph size, average time in seconds of one 'has_node', 'in_nodes' and 'get_edge_data' call.
+    """
+    rng = random.Random(seed)
+    lookup_times: dict[int, dict[str, float]] = {}
+    for n_nodes in graph_sizes:
+        graph: DiGraph[int, int] = DiGraph({node: {node + 1: 1} for node in range(n_nodes - 1)} | {n_nodes - 1: {}})
+        lookups = [rng.randrange(n_nodes) for _ in range(n_lookups)]
+        lookup_times[n_nodes] = {
+            'has_node': _time_per_call(graph.has_node, lookups),
+            'in_nodes': _time_per_call(lambda node: node in graph.nodes, lookups),
+            'get_edge_data': _time_per_call(lambda node: graph.get_edge_data(node, (node + 1) % n_nodes), lookups),
+        }
+    return lookup_times
+
+
+def count_graph_lookup_comparisons(graph_sizes: Iterable[int], n_lookups: int = 1_000, seed: Optional[int] = None) -> dict[int, dict[str, float]]:
+    """
+    Deterministic counterpart of benchmark_graph_lookups(): count node equality comparisons instead of measuring wall clock time.
+    Nodes are looked up by equal but distinct objects, thus a hash-based lookup compares exactly one node,
+    while a linear search compares all nodes before the looked-up one, so constant-time lookups show the same counts for all graph sizes.
+
+    Parameters
+    ----------
+    graph_sizes : Iterable[int]
+        Numbers of nodes of the path-like directed graphs, at least 2 each.
+    n_lookups : int (default 1_000)
+        Number of random lookups of each kind performed per graph.
+    seed : Optional[int] (default None)
+        Seed of the random generator choosing the looked-up nodes.
+
+    Returns
+    -------
+    lookup_comparisons : dict[int, dict[str, float]]
+        For each graph size, average number of node comparisons of one 'has_node', 'in_nodes' and 'get_edge_data' call.
+    """
+    rng = random.Random(seed)
+    lookup_comparisons: dict[int, dict[str, float]] = {}
+    for n_nodes in graph_sizes:
+        nodes = [_ComparedNode(node) for node in range(n_nodes)]
+        graph: DiGraph[_ComparedNode, int] = DiGraph({nodes[node]: {nodes[node + 1]: 1} for node in range(n_nodes - 1)} | {nodes[n_nodes - 1]: {}})
+        # nodes with a successor, so that every edge lookup finds its edge
+        lookups = [rng.randrange(n_nodes - 1) for _ in range(n_lookups)]
+        lookup_comparisons[n_nodes] = {
+            'has_node': _comparisons_per_call(lambda node: graph.has_node(_ComparedNode(node)), lookups),
+            'in_nodes': _comparisons_per_call(lambda node: _ComparedNode(node) in graph.nodes, lookups),
+            'get_edge_data': _comparisons_per_call(lambda node: graph.get_edge_data(_ComparedNode(node), _ComparedNode(node + 1)), lookups),
+        }
+    return lookup_comparisons